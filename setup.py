@@ -21,13 +21,14 @@ setuptools.setup(
     description='Python multi-engine PCAP analyse kit.',
     long_description=long_desc,
     long_description_content_type='text/markdown',
-    python_requires='>=3.4',
+    python_requires='>=3.7',
     install_requires=['setuptools', 'dictdumper', 'chardet', 'aenum', 'emoji'],
     extras_require={
-        'all': ['dpkt', 'scapy', 'pyshark'],
+        'all': ['dpkt', 'scapy', 'pyshark', 'numpy'],
         'DPKT': ['dpkt'],
         'Scapy': ['scapy'],
         'PyShark': ['pyshark'],
+        'NumPy': ['numpy'],
     },
     # py_modules = ['pcapkit'],
     entry_points={
@@ -75,9 +76,6 @@ setuptools.setup(
         'Operating System :: OS Independent',
         'Programming Language :: Python',
         'Programming Language :: Python :: 3',
-        'Programming Language :: Python :: 3.4',
-        'Programming Language :: Python :: 3.5',
-        'Programming Language :: Python :: 3.6',
         'Programming Language :: Python :: 3.7',
         'Programming Language :: Python :: 3 :: Only',
         'Programming Language :: Python :: Implementation',
@@ -25,16 +25,21 @@ __all__ = [
 
     # pcapkit.dumpkit
     'PCAP',                                                 # PCAP Dumper
+    'JSONLines',                                            # JSON-Lines Dumper
     'NotImplementedIO',                                     # Simulated I/O
 
     # pcapkit.foundation
     'Extractor',                                            # Extraction
     'analyse2',                                             # Analysis
     'TraceFlow',                                            # Trace Flow
+    'Columns',                                              # Columnar Export
+    'Catalog',                                              # Capture Catalog
+    'RecordReader',                                         # Raw Frame Records
 
     # pcapkit.interface
-    'extract', 'analyse', 'reassemble', 'trace',            # Interface Functions
-    'TREE', 'JSON', 'PLIST', 'PCAP',                        # Format Macros
+    'extract', 'analyse', 'reassemble', 'trace', 'columns', 'catalog', 'merge',
+    'split', 'extract_many',                                # Interface Functions
+    'TREE', 'JSON', 'JSONL', 'PLIST', 'PCAP',               # Format Macros
     'LINK', 'INET', 'TRANS', 'APP', 'RAW',                  # Layer Macros
     'DPKT', 'Scapy', 'PyShark', 'MPServer', 'MPPipeline', 'PCAPKit',
                                                             # Engine Macros
@@ -53,43 +53,12 @@ different sections.
     dump utilities for `pcapkit` implementation
 
 """
-# All Reference
-import pcapkit.__all__ as all
-
-# Interface
-from pcapkit.interface import *
-
-# ToolKit
-from pcapkit.toolkit import *
-
-# Protocols
-from pcapkit.protocols.null import NoPayload
-from pcapkit.protocols.raw import Raw
-from pcapkit.protocols.link.arp import ARP
-from pcapkit.protocols.link.ethernet import Ethernet
-from pcapkit.protocols.link.l2tp import L2TP
-from pcapkit.protocols.link.ospf import OSPF
-from pcapkit.protocols.link.rarp import RARP
-from pcapkit.protocols.link.vlan import VLAN
-from pcapkit.protocols.internet.ah import AH
-from pcapkit.protocols.internet.hip import HIP
-from pcapkit.protocols.internet.hopopt import HOPOPT
-from pcapkit.protocols.internet.ip import IP
-from pcapkit.protocols.internet.ipsec import IPsec
-from pcapkit.protocols.internet.ipv4 import IPv4
-from pcapkit.protocols.internet.ipv6 import IPv6
-from pcapkit.protocols.internet.ipv6_frag import IPv6_Frag
-from pcapkit.protocols.internet.ipv6_opts import IPv6_Opts
-from pcapkit.protocols.internet.ipv6_route import IPv6_Route
-from pcapkit.protocols.internet.ipx import IPX
-from pcapkit.protocols.internet.mh import MH
-from pcapkit.protocols.transport.tcp import TCP
-from pcapkit.protocols.transport.udp import UDP
-from pcapkit.protocols.application.http import HTTP
+from pcapkit.utilities.lazy import lazy_loader
 
 __all__ = [
-    'extract', 'analyse', 'reassemble', 'trace',            # Interface Functions
-    'TREE', 'JSON', 'PLIST', 'PCAP',                        # Format Macros
+    'extract', 'analyse', 'reassemble', 'trace', 'columns', 'catalog', 'merge',
+    'split', 'extract_many',                                # Interface Functions
+    'TREE', 'JSON', 'JSONL', 'PLIST', 'PCAP',               # Format Macros
     'LINK', 'INET', 'TRANS', 'APP', 'RAW',                  # Layer Macros
     'DPKT', 'Scapy', 'PyShark', 'MPServer', 'MPPipeline', 'PCAPKit',
                                                             # Engine Macros
@@ -102,3 +71,82 @@ __all__ = [
     'TCP', 'UDP',                                           # Transport Layer
     'HTTP',                                                 # Application Layer
 ]
+
+# lazy attribute loading (PEP 562)
+__getattr__, __dir__ = lazy_loader(__name__, {
+    # All Reference
+    'all': 'pcapkit.__all__:',
+
+    # Interface
+    'extract': 'pcapkit.interface',
+    'analyse': 'pcapkit.interface',
+    'reassemble': 'pcapkit.interface',
+    'trace': 'pcapkit.interface',
+    'columns': 'pcapkit.interface',
+    'catalog': 'pcapkit.interface',
+    'merge': 'pcapkit.interface',
+    'split': 'pcapkit.interface',
+    'extract_many': 'pcapkit.interface',
+    'TREE': 'pcapkit.interface',
+    'JSON': 'pcapkit.interface',
+    'JSONL': 'pcapkit.interface',
+    'PLIST': 'pcapkit.interface',
+    'PCAP': 'pcapkit.interface',
+    'LINK': 'pcapkit.interface',
+    'INET': 'pcapkit.interface',
+    'TRANS': 'pcapkit.interface',
+    'APP': 'pcapkit.interface',
+    'RAW': 'pcapkit.interface',
+    'DPKT': 'pcapkit.interface',
+    'Scapy': 'pcapkit.interface',
+    'PyShark': 'pcapkit.interface',
+    'MPServer': 'pcapkit.interface',
+    'MPPipeline': 'pcapkit.interface',
+    'PCAPKit': 'pcapkit.interface',
+
+    # ToolKit
+    'ipv4_reassembly': 'pcapkit.toolkit',
+    'ipv6_reassembly': 'pcapkit.toolkit',
+    'tcp_reassembly': 'pcapkit.toolkit',
+    'tcp_traceflow': 'pcapkit.toolkit',
+    'dpkt_ipv6_hdr_len': 'pcapkit.toolkit',
+    'dpkt_packet2chain': 'pcapkit.toolkit',
+    'dpkt_packet2dict': 'pcapkit.toolkit',
+    'dpkt_ipv4_reassembly': 'pcapkit.toolkit',
+    'dpkt_ipv6_reassembly': 'pcapkit.toolkit',
+    'dpkt_tcp_reassembly': 'pcapkit.toolkit',
+    'dpkt_tcp_traceflow': 'pcapkit.toolkit',
+    'pyshark_packet2dict': 'pcapkit.toolkit',
+    'pyshark_tcp_traceflow': 'pcapkit.toolkit',
+    'scapy_packet2chain': 'pcapkit.toolkit',
+    'scapy_packet2dict': 'pcapkit.toolkit',
+    'scapy_ipv4_reassembly': 'pcapkit.toolkit',
+    'scapy_ipv6_reassembly': 'pcapkit.toolkit',
+    'scapy_tcp_reassembly': 'pcapkit.toolkit',
+    'scapy_tcp_traceflow': 'pcapkit.toolkit',
+
+    # Protocols
+    'NoPayload': 'pcapkit.protocols.null',
+    'Raw': 'pcapkit.protocols.raw',
+    'ARP': 'pcapkit.protocols.link.arp',
+    'Ethernet': 'pcapkit.protocols.link.ethernet',
+    'L2TP': 'pcapkit.protocols.link.l2tp',
+    'OSPF': 'pcapkit.protocols.link.ospf',
+    'RARP': 'pcapkit.protocols.link.rarp',
+    'VLAN': 'pcapkit.protocols.link.vlan',
+    'AH': 'pcapkit.protocols.internet.ah',
+    'HIP': 'pcapkit.protocols.internet.hip',
+    'HOPOPT': 'pcapkit.protocols.internet.hopopt',
+    'IP': 'pcapkit.protocols.internet.ip',
+    'IPsec': 'pcapkit.protocols.internet.ipsec',
+    'IPv4': 'pcapkit.protocols.internet.ipv4',
+    'IPv6': 'pcapkit.protocols.internet.ipv6',
+    'IPv6_Frag': 'pcapkit.protocols.internet.ipv6_frag',
+    'IPv6_Opts': 'pcapkit.protocols.internet.ipv6_opts',
+    'IPv6_Route': 'pcapkit.protocols.internet.ipv6_route',
+    'IPX': 'pcapkit.protocols.internet.ipx',
+    'MH': 'pcapkit.protocols.internet.mh',
+    'TCP': 'pcapkit.protocols.transport.tcp',
+    'UDP': 'pcapkit.protocols.transport.udp',
+    'HTTP': 'pcapkit.protocols.application.http',
+})
@@ -12,9 +12,15 @@ import sys
 import warnings
 
 import emoji
-from pcapkit.foundation.extraction import Extractor
 from pcapkit.interface import JSON, PLIST, TREE
 
+###############################################################################
+# from pcapkit.foundation.catalog import Catalog
+# from pcapkit.foundation.extraction import Extractor
+# from pcapkit.foundation.merge import merge
+# from pcapkit.foundation.split import split
+###############################################################################
+
 # version number
 __version__ = '0.6.0'
 
@@ -32,13 +38,15 @@ def get_parser():
     parser.add_argument('-o', '--output', action='store', metavar='file-name',
                         dest='fout', help=(
                             'The name of input pcap file. If format extension '
-                            'omits, it will be automatically appended.'
+                            'omits, it will be automatically appended. Use "-" '
+                            'to write JSON-Lines output to stdout.'
                         ))
     parser.add_argument('-f', '--format', action='store', metavar='format',
                         dest='format', help=(
                             'Print a extraction report in the specified output '
                             'format. Available are all formats supported by '
-                            'dictdumper, e.g.: json, plist, and tree.'
+                            'dictdumper, e.g.: json, plist, and tree, as well '
+                            'as jsonl for streaming JSON-Lines output.'
                         ))
     parser.add_argument('-j', '--json', action='store_true', default=False,
                         help=(
@@ -85,10 +93,146 @@ def get_parser():
                         default='None', metavar='LAYER', help=(
                             'Indicate extract frames until which layer.'
                         ))
+    parser.add_argument('-S', '--start-time', action='store', dest='start_time',
+                        metavar='TIME', help=(
+                            'Extract frames at or after which time, as UNIX '
+                            'timestamp or ISO 8601 format.'
+                        ))
+    parser.add_argument('-T', '--end-time', action='store', dest='end_time',
+                        metavar='TIME', help=(
+                            'Extract frames before which time, as UNIX '
+                            'timestamp or ISO 8601 format.'
+                        ))
+    parser.add_argument('-I', '--index', action='store', dest='index',
+                        metavar='DATABASE', help=(
+                            'Capture catalog (SQLite database) to locate start '
+                            'time, instead of binary search in input file.'
+                        ))
+    return parser
+
+
+def get_split_parser():
+    parser = argparse.ArgumentParser(prog='pcapkit split', description=(
+        'Split PCAP file by size, time or frame count, without dissection'
+    ))
+    parser.add_argument('fin', metavar='input-file-name',
+                        help=(
+                            'The name of input pcap file.'
+                        ))
+    parser.add_argument('-o', '--output', action='store', metavar='prefix',
+                        dest='fout', help=(
+                            'The prefix of output file names, which are '
+                            'suffixed with "_NNNNN.pcap". Defaults to the name '
+                            'of input file without extension.'
+                        ))
+    parser.add_argument('-b', '--by', action='store', dest='by', default='count',
+                        choices=('size', 'time', 'count'), help=(
+                            'Indicate criterion of rotation.'
+                        ))
+    parser.add_argument('-n', '--limit', action='store', dest='limit', type=float,
+                        required=True, metavar='LIMIT', help=(
+                            'Max size of output files (in bytes), time span '
+                            'of output files (in seconds), or max number of '
+                            'frames of output files.'
+                        ))
+    return parser
+
+
+def get_merge_parser():
+    parser = argparse.ArgumentParser(prog='pcapkit merge', description=(
+        'Merge PCAP files by timestamp, without dissection'
+    ))
+    parser.add_argument('files', metavar='input-file-name', nargs='+',
+                        help=(
+                            'The names of input pcap files.'
+                        ))
+    parser.add_argument('-o', '--output', action='store', metavar='file-name',
+                        dest='fout', required=True, help=(
+                            'The name of output pcap file.'
+                        ))
+    parser.add_argument('-d', '--dedup', action='store', dest='dedup', type=float,
+                        metavar='SECONDS', help=(
+                            'Suppress exact duplicate packets within time '
+                            'window (in seconds).'
+                        ))
+    parser.add_argument('-e', '--byteorder', action='store', dest='byteorder',
+                        choices=('little', 'big'), help=(
+                            'Indicate byte order of output file. Defaults to '
+                            'byte order of the first input file.'
+                        ))
+    parser.add_argument('-n', '--nanosecond', action='store_true', default=None,
+                        help=(
+                            'Write nanosecond-resolution output file. Defaults '
+                            'to if any input file is of nanosecond resolution.'
+                        ))
+    return parser
+
+
+def get_catalog_parser():
+    parser = argparse.ArgumentParser(prog='pcapkit catalog', description=(
+        'Ingest PCAP files into SQLite-indexed capture catalog'
+    ))
+    parser.add_argument('database', metavar='database',
+                        help=(
+                            'The name of catalog (SQLite database) file.'
+                        ))
+    parser.add_argument('files', metavar='input-file-name', nargs='+',
+                        help=(
+                            'The names of input pcap files.'
+                        ))
+    parser.add_argument('-P', '--protocol', action='store', dest='protocol',
+                        metavar='PROTOCOL', help=(
+                            'Indicate extraction stops after which protocol.'
+                        ))
+    parser.add_argument('-L', '--layer', action='store', dest='layer',
+                        metavar='LAYER', help=(
+                            'Indicate extract frames until which layer.'
+                        ))
     return parser
 
 
+def split_main(argv):
+    args = get_split_parser().parse_args(argv)
+    warnings.simplefilter('ignore')
+
+    from pcapkit.foundation.split import split
+    limit = args.limit if args.by == 'time' else int(args.limit)
+    report = split(args.fin, args.fout, by=args.by, limit=limit)
+    print(f'{report.frames} frames split into {len(report.files)} files')
+
+
+def merge_main(argv):
+    args = get_merge_parser().parse_args(argv)
+    warnings.simplefilter('ignore')
+
+    from pcapkit.foundation.merge import merge
+    report = merge(args.files, args.fout, dedup=args.dedup,
+                   byteorder=args.byteorder, nanosecond=args.nanosecond)
+    print(f'{report.frames} frames merged into {report.fout!r} ({report.duplicates} duplicates)')
+
+
+def catalog_main(argv):
+    args = get_catalog_parser().parse_args(argv)
+    warnings.simplefilter('ignore')
+
+    from pcapkit.foundation.catalog import Catalog
+    with Catalog(args.database) as catalog:
+        count = catalog.ingest(*args.files, layer=args.layer, protocol=args.protocol)
+    print(f'{count} frames ingested into {args.database!r}')
+
+
+# subcommands, i.e. name -> main function
+SUBCOMMANDS = {
+    'split': split_main,
+    'merge': merge_main,
+    'catalog': catalog_main,
+}
+
+
 def main():
+    if len(sys.argv) > 1 and sys.argv[1] in SUBCOMMANDS and not os.path.isfile(sys.argv[1]):
+        return SUBCOMMANDS[sys.argv[1]](sys.argv[2:])
+
     parser = get_parser()
     args = parser.parse_args()
     warnings.simplefilter('ignore')
@@ -104,11 +248,13 @@ def main():
     else:
         fmt = None
 
+    from pcapkit.foundation.extraction import Extractor
     extractor = Extractor(store=False, format=fmt,
                           fin=args.fin, fout=args.fout,
                           auto=args.verbose, files=args.files,
                           layer=args.layer, protocol=args.protocol,
-                          engine=args.engine, extension=args.auto_extension)
+                          engine=args.engine, extension=args.auto_extension,
+                          start_time=args.start_time, end_time=args.end_time, index=args.index)
 
     if not args.verbose:
         print(emoji.emojize(f":police_car_light: Loading file {extractor.input!r}"))
@@ -3,6 +3,8 @@
 
 from aenum import IntEnum, extend_enum
 
+from pcapkit.corekit.enumtable import EnumTable
+
 
 class HrdType(IntEnum):
     """Enumeration class for HrdType."""
@@ -56,7 +58,7 @@ class HrdType(IntEnum):
     def get(key, default=-1):
         """Backport support for original codes."""
         if isinstance(key, int):
-            return HrdType(key)
+            return _TABLE(key)
         if key not in HrdType._member_map_:
             extend_enum(HrdType, key, default)
         return HrdType[key]
@@ -67,9 +69,10 @@ class HrdType(IntEnum):
         if not (isinstance(value, int) and 0 <= value <= 65535):
             raise ValueError('%r is not a valid %s' % (value, cls.__name__))
         if 38 <= value <= 255:
-            extend_enum(cls, 'Unassigned [%d]' % value, value)
-            return cls(value)
+            return _TABLE.intern('Unassigned [%d]' % value, value)
         if 258 <= value <= 65534:
-            extend_enum(cls, 'Unassigned [%d]' % value, value)
-            return cls(value)
+            return _TABLE.intern('Unassigned [%d]' % value, value)
         super()._missing_(value)
+
+
+_TABLE = EnumTable(HrdType)
@@ -3,6 +3,8 @@
 
 from aenum import IntEnum, extend_enum
 
+from pcapkit.corekit.enumtable import EnumTable
+
 
 class OperType(IntEnum):
     """Enumeration class for OperType."""
@@ -42,7 +44,7 @@ class OperType(IntEnum):
     def get(key, default=-1):
         """Backport support for original codes."""
         if isinstance(key, int):
-            return OperType(key)
+            return _TABLE(key)
         if key not in OperType._member_map_:
             extend_enum(OperType, key, default)
         return OperType[key]
@@ -53,6 +55,8 @@ class OperType(IntEnum):
         if not (isinstance(value, int) and 0 <= value <= 65535):
             raise ValueError('%r is not a valid %s' % (value, cls.__name__))
         if 26 <= value <= 65534:
-            extend_enum(cls, 'Unassigned [%d]' % value, value)
-            return cls(value)
+            return _TABLE.intern('Unassigned [%d]' % value, value)
         super()._missing_(value)
+
+
+_TABLE = EnumTable(OperType)
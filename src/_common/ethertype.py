@@ -3,6 +3,8 @@
 
 from aenum import IntEnum, extend_enum
 
+from pcapkit.corekit.enumtable import EnumTable
+
 
 class EtherType(IntEnum):
     """Enumeration class for EtherType."""
@@ -176,7 +178,7 @@ class EtherType(IntEnum):
     def get(key, default=-1):
         """Backport support for original codes."""
         if isinstance(key, int):
-            return EtherType(key)
+            return _TABLE(key)
         if key not in EtherType._member_map_:
             extend_enum(EtherType, key, default)
         return EtherType[key]
@@ -188,226 +190,173 @@ class EtherType(IntEnum):
             raise ValueError('%r is not a valid %s' % (value, cls.__name__))
         if 0x0000 <= value <= 0x05DC:
             # [Neil_Sembower]
-            extend_enum(cls, 'IEEE802.3 Length Field [0x%s]' % hex(value)[2:].upper().zfill(4), value)
-            return cls(value)
+            return _TABLE.intern('IEEE802.3 Length Field [0x%s]' % hex(value)[2:].upper().zfill(4), value)
         if 0x0101 <= value <= 0x01FF:
             # [Neil_Sembower]
-            extend_enum(cls, 'Experimental [0x%s]' % hex(value)[2:].upper().zfill(4), value)
-            return cls(value)
+            return _TABLE.intern('Experimental [0x%s]' % hex(value)[2:].upper().zfill(4), value)
         if 0x0888 <= value <= 0x088A:
             # [Neil_Sembower]
-            extend_enum(cls, 'Xyplex [0x%s]' % hex(value)[2:].upper().zfill(4), value)
-            return cls(value)
+            return _TABLE.intern('Xyplex [0x%s]' % hex(value)[2:].upper().zfill(4), value)
         if 0x1001 <= value <= 0x100F:
             # [Neil_Sembower]
-            extend_enum(cls, 'Berkeley Trailer encap/IP [0x%s]' % hex(value)[2:].upper().zfill(4), value)
-            return cls(value)
+            return _TABLE.intern('Berkeley Trailer encap/IP [0x%s]' % hex(value)[2:].upper().zfill(4), value)
         if 0x6008 <= value <= 0x6009:
             # [Neil_Sembower]
-            extend_enum(cls, 'DEC Unassigned [0x%s]' % hex(value)[2:].upper().zfill(4), value)
-            return cls(value)
+            return _TABLE.intern('DEC Unassigned [0x%s]' % hex(value)[2:].upper().zfill(4), value)
         if 0x6010 <= value <= 0x6014:
             # [Neil_Sembower]
-            extend_enum(cls, '3Com Corporation [0x%s]' % hex(value)[2:].upper().zfill(4), value)
-            return cls(value)
+            return _TABLE.intern('3Com Corporation [0x%s]' % hex(value)[2:].upper().zfill(4), value)
         if 0x7020 <= value <= 0x7029:
             # [Neil_Sembower]
-            extend_enum(cls, 'LRT [0x%s]' % hex(value)[2:].upper().zfill(4), value)
-            return cls(value)
+            return _TABLE.intern('LRT [0x%s]' % hex(value)[2:].upper().zfill(4), value)
         if 0x8039 <= value <= 0x803C:
             # [Neil_Sembower]
-            extend_enum(cls, 'DEC Unassigned [0x%s]' % hex(value)[2:].upper().zfill(4), value)
-            return cls(value)
+            return _TABLE.intern('DEC Unassigned [0x%s]' % hex(value)[2:].upper().zfill(4), value)
         if 0x8040 <= value <= 0x8042:
             # [Neil_Sembower]
-            extend_enum(cls, 'DEC Unassigned [0x%s]' % hex(value)[2:].upper().zfill(4), value)
-            return cls(value)
+            return _TABLE.intern('DEC Unassigned [0x%s]' % hex(value)[2:].upper().zfill(4), value)
         if 0x806E <= value <= 0x8077:
             # [Neil_Sembower]
-            extend_enum(cls, 'Landmark Graphics Corp. [0x%s]' % hex(value)[2:].upper().zfill(4), value)
-            return cls(value)
+            return _TABLE.intern('Landmark Graphics Corp. [0x%s]' % hex(value)[2:].upper().zfill(4), value)
         if 0x807D <= value <= 0x807F:
             # [Neil_Sembower]
-            extend_enum(cls, 'Vitalink Communications [0x%s]' % hex(value)[2:].upper().zfill(4), value)
-            return cls(value)
+            return _TABLE.intern('Vitalink Communications [0x%s]' % hex(value)[2:].upper().zfill(4), value)
         if 0x8081 <= value <= 0x8083:
             # [Neil_Sembower]
-            extend_enum(cls, 'Counterpoint Computers [0x%s]' % hex(value)[2:].upper().zfill(4), value)
-            return cls(value)
+            return _TABLE.intern('Counterpoint Computers [0x%s]' % hex(value)[2:].upper().zfill(4), value)
         if 0x809C <= value <= 0x809E:
             # [Neil_Sembower]
-            extend_enum(cls, 'Datability [0x%s]' % hex(value)[2:].upper().zfill(4), value)
-            return cls(value)
+            return _TABLE.intern('Datability [0x%s]' % hex(value)[2:].upper().zfill(4), value)
         if 0x80A4 <= value <= 0x80B3:
             # [Neil_Sembower]
-            extend_enum(cls, 'Siemens Gammasonics Inc. [0x%s]' % hex(value)[2:].upper().zfill(4), value)
-            return cls(value)
+            return _TABLE.intern('Siemens Gammasonics Inc. [0x%s]' % hex(value)[2:].upper().zfill(4), value)
         if 0x80C0 <= value <= 0x80C3:
             # [Neil_Sembower]
-            extend_enum(cls, 'DCA Data Exchange Cluster [0x%s]' % hex(value)[2:].upper().zfill(4), value)
-            return cls(value)
+            return _TABLE.intern('DCA Data Exchange Cluster [0x%s]' % hex(value)[2:].upper().zfill(4), value)
         if 0x80C8 <= value <= 0x80CC:
             # [Neil_Sembower]
-            extend_enum(cls, 'Intergraph Corporation [0x%s]' % hex(value)[2:].upper().zfill(4), value)
-            return cls(value)
+            return _TABLE.intern('Intergraph Corporation [0x%s]' % hex(value)[2:].upper().zfill(4), value)
         if 0x80CD <= value <= 0x80CE:
             # [Neil_Sembower]
-            extend_enum(cls, 'Harris Corporation [0x%s]' % hex(value)[2:].upper().zfill(4), value)
-            return cls(value)
+            return _TABLE.intern('Harris Corporation [0x%s]' % hex(value)[2:].upper().zfill(4), value)
         if 0x80CF <= value <= 0x80D2:
             # [Neil_Sembower]
-            extend_enum(cls, 'Taylor Instrument [0x%s]' % hex(value)[2:].upper().zfill(4), value)
-            return cls(value)
+            return _TABLE.intern('Taylor Instrument [0x%s]' % hex(value)[2:].upper().zfill(4), value)
         if 0x80D3 <= value <= 0x80D4:
             # [Neil_Sembower]
-            extend_enum(cls, 'Rosemount Corporation [0x%s]' % hex(value)[2:].upper().zfill(4), value)
-            return cls(value)
+            return _TABLE.intern('Rosemount Corporation [0x%s]' % hex(value)[2:].upper().zfill(4), value)
         if 0x80DE <= value <= 0x80DF:
             # [Neil_Sembower]
-            extend_enum(cls, 'Integrated Solutions TRFS [0x%s]' % hex(value)[2:].upper().zfill(4), value)
-            return cls(value)
+            return _TABLE.intern('Integrated Solutions TRFS [0x%s]' % hex(value)[2:].upper().zfill(4), value)
         if 0x80E0 <= value <= 0x80E3:
             # [Neil_Sembower]
-            extend_enum(cls, 'Allen-Bradley [0x%s]' % hex(value)[2:].upper().zfill(4), value)
-            return cls(value)
+            return _TABLE.intern('Allen-Bradley [0x%s]' % hex(value)[2:].upper().zfill(4), value)
         if 0x80E4 <= value <= 0x80F0:
             # [Neil_Sembower]
-            extend_enum(cls, 'Datability [0x%s]' % hex(value)[2:].upper().zfill(4), value)
-            return cls(value)
+            return _TABLE.intern('Datability [0x%s]' % hex(value)[2:].upper().zfill(4), value)
         if 0x80F4 <= value <= 0x80F5:
             # [Neil_Sembower]
-            extend_enum(cls, 'Kinetics [0x%s]' % hex(value)[2:].upper().zfill(4), value)
-            return cls(value)
+            return _TABLE.intern('Kinetics [0x%s]' % hex(value)[2:].upper().zfill(4), value)
         if 0x8101 <= value <= 0x8103:
             # [Neil_Sembower]
-            extend_enum(cls, 'Wellfleet Communications [0x%s]' % hex(value)[2:].upper().zfill(4), value)
-            return cls(value)
+            return _TABLE.intern('Wellfleet Communications [0x%s]' % hex(value)[2:].upper().zfill(4), value)
         if 0x8107 <= value <= 0x8109:
             # [Neil_Sembower]
-            extend_enum(cls, 'Symbolics Private [0x%s]' % hex(value)[2:].upper().zfill(4), value)
-            return cls(value)
+            return _TABLE.intern('Symbolics Private [0x%s]' % hex(value)[2:].upper().zfill(4), value)
         if 0x8132 <= value <= 0x8136:
             # [Neil_Sembower]
-            extend_enum(cls, 'Bridge Communications [0x%s]' % hex(value)[2:].upper().zfill(4), value)
-            return cls(value)
+            return _TABLE.intern('Bridge Communications [0x%s]' % hex(value)[2:].upper().zfill(4), value)
         if 0x8137 <= value <= 0x8138:
             # [Neil_Sembower]
-            extend_enum(cls, 'Novell, Inc. [0x%s]' % hex(value)[2:].upper().zfill(4), value)
-            return cls(value)
+            return _TABLE.intern('Novell, Inc. [0x%s]' % hex(value)[2:].upper().zfill(4), value)
         if 0x8139 <= value <= 0x813D:
             # [Neil_Sembower]
-            extend_enum(cls, 'KTI [0x%s]' % hex(value)[2:].upper().zfill(4), value)
-            return cls(value)
+            return _TABLE.intern('KTI [0x%s]' % hex(value)[2:].upper().zfill(4), value)
         if 0x8151 <= value <= 0x8153:
             # [Neil_Sembower]
-            extend_enum(cls, 'Qualcomm [0x%s]' % hex(value)[2:].upper().zfill(4), value)
-            return cls(value)
+            return _TABLE.intern('Qualcomm [0x%s]' % hex(value)[2:].upper().zfill(4), value)
         if 0x815C <= value <= 0x815E:
             # [Neil_Sembower]
-            extend_enum(cls, 'Computer Protocol Pty Ltd [0x%s]' % hex(value)[2:].upper().zfill(4), value)
-            return cls(value)
+            return _TABLE.intern('Computer Protocol Pty Ltd [0x%s]' % hex(value)[2:].upper().zfill(4), value)
         if 0x8164 <= value <= 0x8166:
             # [Neil_Sembower]
-            extend_enum(cls, 'Charles River Data System [0x%s]' % hex(value)[2:].upper().zfill(4), value)
-            return cls(value)
+            return _TABLE.intern('Charles River Data System [0x%s]' % hex(value)[2:].upper().zfill(4), value)
         if 0x8184 <= value <= 0x818C:
             # [Neil_Sembower]
-            extend_enum(cls, 'Silicon Graphics prop. [0x%s]' % hex(value)[2:].upper().zfill(4), value)
-            return cls(value)
+            return _TABLE.intern('Silicon Graphics prop. [0x%s]' % hex(value)[2:].upper().zfill(4), value)
         if 0x819A <= value <= 0x81A3:
             # [Neil_Sembower]
-            extend_enum(cls, 'Qualcomm [0x%s]' % hex(value)[2:].upper().zfill(4), value)
-            return cls(value)
+            return _TABLE.intern('Qualcomm [0x%s]' % hex(value)[2:].upper().zfill(4), value)
         if 0x81A5 <= value <= 0x81AE:
             # [Neil_Sembower]
-            extend_enum(cls, 'RAD Network Devices [0x%s]' % hex(value)[2:].upper().zfill(4), value)
-            return cls(value)
+            return _TABLE.intern('RAD Network Devices [0x%s]' % hex(value)[2:].upper().zfill(4), value)
         if 0x81B7 <= value <= 0x81B9:
             # [Neil_Sembower]
-            extend_enum(cls, 'Xyplex [0x%s]' % hex(value)[2:].upper().zfill(4), value)
-            return cls(value)
+            return _TABLE.intern('Xyplex [0x%s]' % hex(value)[2:].upper().zfill(4), value)
         if 0x81CC <= value <= 0x81D5:
             # [Neil_Sembower]
-            extend_enum(cls, 'Apricot Computers [0x%s]' % hex(value)[2:].upper().zfill(4), value)
-            return cls(value)
+            return _TABLE.intern('Apricot Computers [0x%s]' % hex(value)[2:].upper().zfill(4), value)
         if 0x81D6 <= value <= 0x81DD:
             # [Neil_Sembower]
-            extend_enum(cls, 'Artisoft [0x%s]' % hex(value)[2:].upper().zfill(4), value)
-            return cls(value)
+            return _TABLE.intern('Artisoft [0x%s]' % hex(value)[2:].upper().zfill(4), value)
         if 0x81E6 <= value <= 0x81EF:
             # [Neil_Sembower]
-            extend_enum(cls, 'Polygon [0x%s]' % hex(value)[2:].upper().zfill(4), value)
-            return cls(value)
+            return _TABLE.intern('Polygon [0x%s]' % hex(value)[2:].upper().zfill(4), value)
         if 0x81F0 <= value <= 0x81F2:
             # [Neil_Sembower]
-            extend_enum(cls, 'Comsat Labs [0x%s]' % hex(value)[2:].upper().zfill(4), value)
-            return cls(value)
+            return _TABLE.intern('Comsat Labs [0x%s]' % hex(value)[2:].upper().zfill(4), value)
         if 0x81F3 <= value <= 0x81F5:
             # [Neil_Sembower]
-            extend_enum(cls, 'SAIC [0x%s]' % hex(value)[2:].upper().zfill(4), value)
-            return cls(value)
+            return _TABLE.intern('SAIC [0x%s]' % hex(value)[2:].upper().zfill(4), value)
         if 0x81F6 <= value <= 0x81F8:
             # [Neil_Sembower]
-            extend_enum(cls, 'VG Analytical [0x%s]' % hex(value)[2:].upper().zfill(4), value)
-            return cls(value)
+            return _TABLE.intern('VG Analytical [0x%s]' % hex(value)[2:].upper().zfill(4), value)
         if 0x8203 <= value <= 0x8205:
             # [Neil_Sembower]
-            extend_enum(cls, 'Quantum Software [0x%s]' % hex(value)[2:].upper().zfill(4), value)
-            return cls(value)
+            return _TABLE.intern('Quantum Software [0x%s]' % hex(value)[2:].upper().zfill(4), value)
         if 0x8221 <= value <= 0x8222:
             # [Neil_Sembower]
-            extend_enum(cls, 'Ascom Banking Systems [0x%s]' % hex(value)[2:].upper().zfill(4), value)
-            return cls(value)
+            return _TABLE.intern('Ascom Banking Systems [0x%s]' % hex(value)[2:].upper().zfill(4), value)
         if 0x823E <= value <= 0x8240:
             # [Neil_Sembower]
-            extend_enum(cls, 'Advanced Encryption Syste [0x%s]' % hex(value)[2:].upper().zfill(4), value)
-            return cls(value)
+            return _TABLE.intern('Advanced Encryption Syste [0x%s]' % hex(value)[2:].upper().zfill(4), value)
         if 0x827F <= value <= 0x8282:
             # [Neil_Sembower]
-            extend_enum(cls, 'Athena Programming [0x%s]' % hex(value)[2:].upper().zfill(4), value)
-            return cls(value)
+            return _TABLE.intern('Athena Programming [0x%s]' % hex(value)[2:].upper().zfill(4), value)
         if 0x8263 <= value <= 0x826A:
             # [Neil_Sembower]
-            extend_enum(cls, 'Charles River Data System [0x%s]' % hex(value)[2:].upper().zfill(4), value)
-            return cls(value)
+            return _TABLE.intern('Charles River Data System [0x%s]' % hex(value)[2:].upper().zfill(4), value)
         if 0x829A <= value <= 0x829B:
             # [Neil_Sembower]
-            extend_enum(cls, 'Inst Ind Info Tech [0x%s]' % hex(value)[2:].upper().zfill(4), value)
-            return cls(value)
+            return _TABLE.intern('Inst Ind Info Tech [0x%s]' % hex(value)[2:].upper().zfill(4), value)
         if 0x829C <= value <= 0x82AB:
             # [Neil_Sembower]
-            extend_enum(cls, 'Taurus Controls [0x%s]' % hex(value)[2:].upper().zfill(4), value)
-            return cls(value)
+            return _TABLE.intern('Taurus Controls [0x%s]' % hex(value)[2:].upper().zfill(4), value)
         if 0x82AC <= value <= 0x8693:
             # [Neil_Sembower]
-            extend_enum(cls, 'Walker Richer & Quinn [0x%s]' % hex(value)[2:].upper().zfill(4), value)
-            return cls(value)
+            return _TABLE.intern('Walker Richer & Quinn [0x%s]' % hex(value)[2:].upper().zfill(4), value)
         if 0x8694 <= value <= 0x869D:
             # [Neil_Sembower]
-            extend_enum(cls, 'Idea Courier [0x%s]' % hex(value)[2:].upper().zfill(4), value)
-            return cls(value)
+            return _TABLE.intern('Idea Courier [0x%s]' % hex(value)[2:].upper().zfill(4), value)
         if 0x869E <= value <= 0x86A1:
             # [Neil_Sembower]
-            extend_enum(cls, 'Computer Network Tech [0x%s]' % hex(value)[2:].upper().zfill(4), value)
-            return cls(value)
+            return _TABLE.intern('Computer Network Tech [0x%s]' % hex(value)[2:].upper().zfill(4), value)
         if 0x86A3 <= value <= 0x86AC:
             # [Neil_Sembower]
-            extend_enum(cls, 'Gateway Communications [0x%s]' % hex(value)[2:].upper().zfill(4), value)
-            return cls(value)
+            return _TABLE.intern('Gateway Communications [0x%s]' % hex(value)[2:].upper().zfill(4), value)
         if 0x86E0 <= value <= 0x86EF:
             # [Neil_Sembower]
-            extend_enum(cls, 'Landis & Gyr Powers [0x%s]' % hex(value)[2:].upper().zfill(4), value)
-            return cls(value)
+            return _TABLE.intern('Landis & Gyr Powers [0x%s]' % hex(value)[2:].upper().zfill(4), value)
         if 0x8700 <= value <= 0x8710:
             # [Neil_Sembower]
-            extend_enum(cls, 'Motorola [0x%s]' % hex(value)[2:].upper().zfill(4), value)
-            return cls(value)
+            return _TABLE.intern('Motorola [0x%s]' % hex(value)[2:].upper().zfill(4), value)
         if 0x8A96 <= value <= 0x8A97:
             # [Neil_Sembower]
-            extend_enum(cls, 'Invisible Software [0x%s]' % hex(value)[2:].upper().zfill(4), value)
-            return cls(value)
+            return _TABLE.intern('Invisible Software [0x%s]' % hex(value)[2:].upper().zfill(4), value)
         if 0xFF00 <= value <= 0xFF0F:
             # [Neil_Sembower]
-            extend_enum(cls, 'ISC Bunker Ramo [0x%s]' % hex(value)[2:].upper().zfill(4), value)
-            return cls(value)
+            return _TABLE.intern('ISC Bunker Ramo [0x%s]' % hex(value)[2:].upper().zfill(4), value)
         super()._missing_(value)
+
+
+_TABLE = EnumTable(EtherType)
@@ -3,6 +3,8 @@
 
 from aenum import IntEnum, extend_enum
 
+from pcapkit.corekit.enumtable import EnumTable
+
 
 class CertType(IntEnum):
     """Enumeration class for CertType."""
@@ -24,7 +26,7 @@ class CertType(IntEnum):
     def get(key, default=-1):
         """Backport support for original codes."""
         if isinstance(key, int):
-            return CertType(key)
+            return _TABLE(key)
         if key not in CertType._member_map_:
             extend_enum(CertType, key, default)
         return CertType[key]
@@ -35,6 +37,8 @@ class CertType(IntEnum):
         if not (isinstance(value, int) and 0 <= value <= 255):
             raise ValueError('%r is not a valid %s' % (value, cls.__name__))
         if 9 <= value <= 255:
-            extend_enum(cls, 'Unassigned [%d]' % value, value)
-            return cls(value)
+            return _TABLE.intern('Unassigned [%d]' % value, value)
         super()._missing_(value)
+
+
+_TABLE = EnumTable(CertType)
@@ -3,6 +3,8 @@
 
 from aenum import IntEnum, extend_enum
 
+from pcapkit.corekit.enumtable import EnumTable
+
 
 class CipherID(IntEnum):
     """Enumeration class for CipherID."""
@@ -20,7 +22,7 @@ class CipherID(IntEnum):
     def get(key, default=-1):
         """Backport support for original codes."""
         if isinstance(key, int):
-            return CipherID(key)
+            return _TABLE(key)
         if key not in CipherID._member_map_:
             extend_enum(CipherID, key, default)
         return CipherID[key]
@@ -31,6 +33,8 @@ class CipherID(IntEnum):
         if not (isinstance(value, int) and 0 <= value <= 65535):
             raise ValueError('%r is not a valid %s' % (value, cls.__name__))
         if 5 <= value <= 65535:
-            extend_enum(cls, 'Unassigned [%d]' % value, value)
-            return cls(value)
+            return _TABLE.intern('Unassigned [%d]' % value, value)
         super()._missing_(value)
+
+
+_TABLE = EnumTable(CipherID)
@@ -3,6 +3,8 @@
 
 from aenum import IntEnum, extend_enum
 
+from pcapkit.corekit.enumtable import EnumTable
+
 
 class DI_TYPE(IntEnum):
     """Enumeration class for DI_TYPE."""
@@ -18,7 +20,7 @@ class DI_TYPE(IntEnum):
     def get(key, default=-1):
         """Backport support for original codes."""
         if isinstance(key, int):
-            return DI_TYPE(key)
+            return _TABLE(key)
         if key not in DI_TYPE._member_map_:
             extend_enum(DI_TYPE, key, default)
         return DI_TYPE[key]
@@ -29,6 +31,8 @@ class DI_TYPE(IntEnum):
         if not (isinstance(value, int) and 0 <= value <= 15):
             raise ValueError('%r is not a valid %s' % (value, cls.__name__))
         if 3 <= value <= 15:
-            extend_enum(cls, 'Unassigned [%d]' % value, value)
-            return cls(value)
+            return _TABLE.intern('Unassigned [%d]' % value, value)
         super()._missing_(value)
+
+
+_TABLE = EnumTable(DI_TYPE)
@@ -3,6 +3,8 @@
 
 from aenum import IntEnum, extend_enum
 
+from pcapkit.corekit.enumtable import EnumTable
+
 
 class ECDSA_LOW(IntEnum):
     """Enumeration class for ECDSA_LOW."""
@@ -17,7 +19,7 @@ class ECDSA_LOW(IntEnum):
     def get(key, default=-1):
         """Backport support for original codes."""
         if isinstance(key, int):
-            return ECDSA_LOW(key)
+            return _TABLE(key)
         if key not in ECDSA_LOW._member_map_:
             extend_enum(ECDSA_LOW, key, default)
         return ECDSA_LOW[key]
@@ -28,6 +30,8 @@ class ECDSA_LOW(IntEnum):
         if not (isinstance(value, int) and 0 <= value <= 65535):
             raise ValueError('%r is not a valid %s' % (value, cls.__name__))
         if 2 <= value <= 65535:
-            extend_enum(cls, 'Unassigned [%d]' % value, value)
-            return cls(value)
+            return _TABLE.intern('Unassigned [%d]' % value, value)
         super()._missing_(value)
+
+
+_TABLE = EnumTable(ECDSA_LOW)
@@ -3,6 +3,8 @@
 
 from aenum import IntEnum, extend_enum
 
+from pcapkit.corekit.enumtable import EnumTable
+
 
 class ESP_SuiteID(IntEnum):
     """Enumeration class for ESP_SuiteID."""
@@ -31,7 +33,7 @@ class ESP_SuiteID(IntEnum):
     def get(key, default=-1):
         """Backport support for original codes."""
         if isinstance(key, int):
-            return ESP_SuiteID(key)
+            return _TABLE(key)
         if key not in ESP_SuiteID._member_map_:
             extend_enum(ESP_SuiteID, key, default)
         return ESP_SuiteID[key]
@@ -42,6 +44,8 @@ class ESP_SuiteID(IntEnum):
         if not (isinstance(value, int) and 0 <= value <= 65535):
             raise ValueError('%r is not a valid %s' % (value, cls.__name__))
         if 16 <= value <= 65535:
-            extend_enum(cls, 'Unassigned [%d]' % value, value)
-            return cls(value)
+            return _TABLE.intern('Unassigned [%d]' % value, value)
         super()._missing_(value)
+
+
+_TABLE = EnumTable(ESP_SuiteID)
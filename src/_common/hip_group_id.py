@@ -3,6 +3,8 @@
 
 from aenum import IntEnum, extend_enum
 
+from pcapkit.corekit.enumtable import EnumTable
+
 
 class GroupID(IntEnum):
     """Enumeration class for GroupID."""
@@ -27,7 +29,7 @@ class GroupID(IntEnum):
     def get(key, default=-1):
         """Backport support for original codes."""
         if isinstance(key, int):
-            return GroupID(key)
+            return _TABLE(key)
         if key not in GroupID._member_map_:
             extend_enum(GroupID, key, default)
         return GroupID[key]
@@ -38,6 +40,8 @@ class GroupID(IntEnum):
         if not (isinstance(value, int) and 0 <= value <= 255):
             raise ValueError('%r is not a valid %s' % (value, cls.__name__))
         if 12 <= value <= 255:
-            extend_enum(cls, 'Unassigned [%d]' % value, value)
-            return cls(value)
+            return _TABLE.intern('Unassigned [%d]' % value, value)
         super()._missing_(value)
+
+
+_TABLE = EnumTable(GroupID)
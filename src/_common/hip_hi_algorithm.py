@@ -3,6 +3,8 @@
 
 from aenum import IntEnum, extend_enum
 
+from pcapkit.corekit.enumtable import EnumTable
+
 
 class HI_ALG(IntEnum):
     """Enumeration class for HI_ALG."""
@@ -25,7 +27,7 @@ class HI_ALG(IntEnum):
     def get(key, default=-1):
         """Backport support for original codes."""
         if isinstance(key, int):
-            return HI_ALG(key)
+            return _TABLE(key)
         if key not in HI_ALG._member_map_:
             extend_enum(HI_ALG, key, default)
         return HI_ALG[key]
@@ -36,6 +38,8 @@ class HI_ALG(IntEnum):
         if not (isinstance(value, int) and 0 <= value <= 65535):
             raise ValueError('%r is not a valid %s' % (value, cls.__name__))
         if 10 <= value <= 65535:
-            extend_enum(cls, 'Unassigned [%d]' % value, value)
-            return cls(value)
+            return _TABLE.intern('Unassigned [%d]' % value, value)
         super()._missing_(value)
+
+
+_TABLE = EnumTable(HI_ALG)
@@ -3,6 +3,8 @@
 
 from aenum import IntEnum, extend_enum
 
+from pcapkit.corekit.enumtable import EnumTable
+
 
 class HIT_SuiteID(IntEnum):
     """Enumeration class for HIT_SuiteID."""
@@ -19,7 +21,7 @@ class HIT_SuiteID(IntEnum):
     def get(key, default=-1):
         """Backport support for original codes."""
         if isinstance(key, int):
-            return HIT_SuiteID(key)
+            return _TABLE(key)
         if key not in HIT_SuiteID._member_map_:
             extend_enum(HIT_SuiteID, key, default)
         return HIT_SuiteID[key]
@@ -30,6 +32,8 @@ class HIT_SuiteID(IntEnum):
         if not (isinstance(value, int) and 0 <= value <= 15):
             raise ValueError('%r is not a valid %s' % (value, cls.__name__))
         if 4 <= value <= 15:
-            extend_enum(cls, 'Unassigned [%d]' % value, value)
-            return cls(value)
+            return _TABLE.intern('Unassigned [%d]' % value, value)
         super()._missing_(value)
+
+
+_TABLE = EnumTable(HIT_SuiteID)
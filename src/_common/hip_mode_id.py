@@ -3,6 +3,8 @@
 
 from aenum import IntEnum, extend_enum
 
+from pcapkit.corekit.enumtable import EnumTable
+
 
 class ModeID(IntEnum):
     """Enumeration class for ModeID."""
@@ -18,7 +20,7 @@ class ModeID(IntEnum):
     def get(key, default=-1):
         """Backport support for original codes."""
         if isinstance(key, int):
-            return ModeID(key)
+            return _TABLE(key)
         if key not in ModeID._member_map_:
             extend_enum(ModeID, key, default)
         return ModeID[key]
@@ -29,6 +31,8 @@ class ModeID(IntEnum):
         if not (isinstance(value, int) and 0 <= value <= 65535):
             raise ValueError('%r is not a valid %s' % (value, cls.__name__))
         if 3 <= value <= 65535:
-            extend_enum(cls, 'Unassigned [%d]' % value, value)
-            return cls(value)
+            return _TABLE.intern('Unassigned [%d]' % value, value)
         super()._missing_(value)
+
+
+_TABLE = EnumTable(ModeID)
@@ -3,6 +3,8 @@
 
 from aenum import IntEnum, extend_enum
 
+from pcapkit.corekit.enumtable import EnumTable
+
 
 class MsgType(IntEnum):
     """Enumeration class for MsgType."""
@@ -50,7 +52,7 @@ class MsgType(IntEnum):
     def get(key, default=-1):
         """Backport support for original codes."""
         if isinstance(key, int):
-            return MsgType(key)
+            return _TABLE(key)
         if key not in MsgType._member_map_:
             extend_enum(MsgType, key, default)
         return MsgType[key]
@@ -61,44 +63,34 @@ class MsgType(IntEnum):
         if not (isinstance(value, int) and 0 <= value <= 65535):
             raise ValueError('%r is not a valid %s' % (value, cls.__name__))
         if 2 <= value <= 6:
-            extend_enum(cls, 'Unassigned [%d]' % value, value)
-            return cls(value)
+            return _TABLE.intern('Unassigned [%d]' % value, value)
         if 8 <= value <= 13:
-            extend_enum(cls, 'Unassigned [%d]' % value, value)
-            return cls(value)
+            return _TABLE.intern('Unassigned [%d]' % value, value)
         if 21 <= value <= 23:
-            extend_enum(cls, 'Unassigned [%d]' % value, value)
-            return cls(value)
+            return _TABLE.intern('Unassigned [%d]' % value, value)
         if 29 <= value <= 31:
-            extend_enum(cls, 'Unassigned [%d]' % value, value)
-            return cls(value)
+            return _TABLE.intern('Unassigned [%d]' % value, value)
         if 33 <= value <= 39:
-            extend_enum(cls, 'Unassigned [%d]' % value, value)
-            return cls(value)
+            return _TABLE.intern('Unassigned [%d]' % value, value)
         if 52 <= value <= 59:
-            extend_enum(cls, 'Unassigned [%d]' % value, value)
-            return cls(value)
+            return _TABLE.intern('Unassigned [%d]' % value, value)
         if 63 <= value <= 69:
-            extend_enum(cls, 'Unassigned [%d]' % value, value)
-            return cls(value)
+            return _TABLE.intern('Unassigned [%d]' % value, value)
         if 71 <= value <= 89:
-            extend_enum(cls, 'Unassigned [%d]' % value, value)
-            return cls(value)
+            return _TABLE.intern('Unassigned [%d]' % value, value)
         if 91 <= value <= 99:
-            extend_enum(cls, 'Unassigned [%d]' % value, value)
-            return cls(value)
+            return _TABLE.intern('Unassigned [%d]' % value, value)
         if 101 <= value <= 8191:
-            extend_enum(cls, 'Unassigned [%d]' % value, value)
-            return cls(value)
+            return _TABLE.intern('Unassigned [%d]' % value, value)
         if 8192 <= value <= 16383:
             # [RFC 7401]
-            extend_enum(cls, 'Reserved for Private Use [%d]' % value, value)
-            return cls(value)
+            return _TABLE.intern('Reserved for Private Use [%d]' % value, value)
         if 16385 <= value <= 40959:
-            extend_enum(cls, 'Unassigned [%d]' % value, value)
-            return cls(value)
+            return _TABLE.intern('Unassigned [%d]' % value, value)
         if 40960 <= value <= 65535:
             # [RFC 7401]
-            extend_enum(cls, 'Reserved for Private Use [%d]' % value, value)
-            return cls(value)
+            return _TABLE.intern('Reserved for Private Use [%d]' % value, value)
         super()._missing_(value)
+
+
+_TABLE = EnumTable(MsgType)
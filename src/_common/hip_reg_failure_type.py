@@ -3,6 +3,8 @@
 
 from aenum import IntEnum, extend_enum
 
+from pcapkit.corekit.enumtable import EnumTable
+
 
 class RegFailType(IntEnum):
     """Enumeration class for RegFailType."""
@@ -24,7 +26,7 @@ class RegFailType(IntEnum):
     def get(key, default=-1):
         """Backport support for original codes."""
         if isinstance(key, int):
-            return RegFailType(key)
+            return _TABLE(key)
         if key not in RegFailType._member_map_:
             extend_enum(RegFailType, key, default)
         return RegFailType[key]
@@ -35,10 +37,11 @@ class RegFailType(IntEnum):
         if not (isinstance(value, int) and 0 <= value <= 255):
             raise ValueError('%r is not a valid %s' % (value, cls.__name__))
         if 9 <= value <= 200:
-            extend_enum(cls, 'Unassigned [%d]' % value, value)
-            return cls(value)
+            return _TABLE.intern('Unassigned [%d]' % value, value)
         if 201 <= value <= 255:
             # [RFC 8003]
-            extend_enum(cls, 'Reserved for Private Use [%d]' % value, value)
-            return cls(value)
+            return _TABLE.intern('Reserved for Private Use [%d]' % value, value)
         super()._missing_(value)
+
+
+_TABLE = EnumTable(RegFailType)
@@ -3,6 +3,8 @@
 
 from aenum import IntEnum, extend_enum
 
+from pcapkit.corekit.enumtable import EnumTable
+
 
 class RegType(IntEnum):
     """Enumeration class for RegType."""
@@ -18,7 +20,7 @@ class RegType(IntEnum):
     def get(key, default=-1):
         """Backport support for original codes."""
         if isinstance(key, int):
-            return RegType(key)
+            return _TABLE(key)
         if key not in RegType._member_map_:
             extend_enum(RegType, key, default)
         return RegType[key]
@@ -29,10 +31,11 @@ class RegType(IntEnum):
         if not (isinstance(value, int) and 0 <= value <= 255):
             raise ValueError('%r is not a valid %s' % (value, cls.__name__))
         if 3 <= value <= 200:
-            extend_enum(cls, 'Unassigned [%d]' % value, value)
-            return cls(value)
+            return _TABLE.intern('Unassigned [%d]' % value, value)
         if 201 <= value <= 255:
             # [RFC 8003]
-            extend_enum(cls, 'Reserved for Private Use [%d]' % value, value)
-            return cls(value)
+            return _TABLE.intern('Reserved for Private Use [%d]' % value, value)
         super()._missing_(value)
+
+
+_TABLE = EnumTable(RegType)
@@ -3,6 +3,8 @@
 
 from aenum import IntEnum, extend_enum
 
+from pcapkit.corekit.enumtable import EnumTable
+
 
 class SuiteID(IntEnum):
     """Enumeration class for SuiteID."""
@@ -22,7 +24,7 @@ class SuiteID(IntEnum):
     def get(key, default=-1):
         """Backport support for original codes."""
         if isinstance(key, int):
-            return SuiteID(key)
+            return _TABLE(key)
         if key not in SuiteID._member_map_:
             extend_enum(SuiteID, key, default)
         return SuiteID[key]
@@ -33,6 +35,8 @@ class SuiteID(IntEnum):
         if not (isinstance(value, int) and 0 <= value <= 65535):
             raise ValueError('%r is not a valid %s' % (value, cls.__name__))
         if 7 <= value <= 65535:
-            extend_enum(cls, 'Unassigned [%d]' % value, value)
-            return cls(value)
+            return _TABLE.intern('Unassigned [%d]' % value, value)
         super()._missing_(value)
+
+
+_TABLE = EnumTable(SuiteID)
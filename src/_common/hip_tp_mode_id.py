@@ -3,6 +3,8 @@
 
 from aenum import IntEnum, extend_enum
 
+from pcapkit.corekit.enumtable import EnumTable
+
 
 class TAT_ModeID(IntEnum):
     """Enumeration class for TAT_ModeID."""
@@ -19,7 +21,10 @@ class TAT_ModeID(IntEnum):
     def get(key, default=-1):
         """Backport support for original codes."""
         if isinstance(key, int):
-            return TAT_ModeID(key)
+            return _TABLE(key)
         if key not in TAT_ModeID._member_map_:
             extend_enum(TAT_ModeID, key, default)
         return TAT_ModeID[key]
+
+
+_TABLE = EnumTable(TAT_ModeID)
@@ -3,6 +3,8 @@
 
 from aenum import IntEnum, extend_enum
 
+from pcapkit.corekit.enumtable import EnumTable
+
 
 class PktType(IntEnum):
     """Enumeration class for PktType."""
@@ -26,7 +28,7 @@ class PktType(IntEnum):
     def get(key, default=-1):
         """Backport support for original codes."""
         if isinstance(key, int):
-            return PktType(key)
+            return _TABLE(key)
         if key not in PktType._member_map_:
             extend_enum(PktType, key, default)
         return PktType[key]
@@ -37,12 +39,12 @@ class PktType(IntEnum):
         if not (isinstance(value, int) and 0 <= value <= 127):
             raise ValueError('%r is not a valid %s' % (value, cls.__name__))
         if 5 <= value <= 15:
-            extend_enum(cls, 'Unassigned [%d]' % value, value)
-            return cls(value)
+            return _TABLE.intern('Unassigned [%d]' % value, value)
         if 21 <= value <= 31:
-            extend_enum(cls, 'Unassigned [%d]' % value, value)
-            return cls(value)
+            return _TABLE.intern('Unassigned [%d]' % value, value)
         if 33 <= value <= 127:
-            extend_enum(cls, 'Unassigned [%d]' % value, value)
-            return cls(value)
+            return _TABLE.intern('Unassigned [%d]' % value, value)
         super()._missing_(value)
+
+
+_TABLE = EnumTable(PktType)
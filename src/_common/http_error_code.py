@@ -3,6 +3,8 @@
 
 from aenum import IntEnum, extend_enum
 
+from pcapkit.corekit.enumtable import EnumTable
+
 
 class ErrCode(IntEnum):
     """Enumeration class for ErrCode."""
@@ -29,7 +31,7 @@ class ErrCode(IntEnum):
     def get(key, default=-1):
         """Backport support for original codes."""
         if isinstance(key, int):
-            return ErrCode(key)
+            return _TABLE(key)
         if key not in ErrCode._member_map_:
             extend_enum(ErrCode, key, default)
         return ErrCode[key]
@@ -41,6 +43,8 @@ class ErrCode(IntEnum):
             raise ValueError('%r is not a valid %s' % (value, cls.__name__))
         if 0x0000_000E <= value <= 0xFFFF_FFFF:
             temp = hex(value)[2:].upper().zfill(8)
-            extend_enum(cls, 'Unassigned [0x%s]' % (temp[:4]+'_'+temp[4:]), value)
-            return cls(value)
+            return _TABLE.intern('Unassigned [0x%s]' % (temp[:4]+'_'+temp[4:]), value)
         super()._missing_(value)
+
+
+_TABLE = EnumTable(ErrCode)
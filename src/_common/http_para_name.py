@@ -3,6 +3,8 @@
 
 from aenum import IntEnum, extend_enum
 
+from pcapkit.corekit.enumtable import EnumTable
+
 
 class Settings(IntEnum):
     """Enumeration class for Settings."""
@@ -24,7 +26,7 @@ class Settings(IntEnum):
     def get(key, default=-1):
         """Backport support for original codes."""
         if isinstance(key, int):
-            return Settings(key)
+            return _TABLE(key)
         if key not in Settings._member_map_:
             extend_enum(Settings, key, default)
         return Settings[key]
@@ -35,16 +37,15 @@ class Settings(IntEnum):
         if not (isinstance(value, int) and 0x0000 <= value <= 0xFFFF):
             raise ValueError('%r is not a valid %s' % (value, cls.__name__))
         if 0x0007 <= value <= 0x000F:
-            extend_enum(cls, 'Unassigned [0x%s]' % hex(value)[2:].upper().zfill(4), value)
-            return cls(value)
+            return _TABLE.intern('Unassigned [0x%s]' % hex(value)[2:].upper().zfill(4), value)
         if 0x0009 <= value <= 0x000F:
-            extend_enum(cls, 'Unassigned [0x%s]' % hex(value)[2:].upper().zfill(4), value)
-            return cls(value)
+            return _TABLE.intern('Unassigned [0x%s]' % hex(value)[2:].upper().zfill(4), value)
         if 0x0011 <= value <= 0xEFFF:
-            extend_enum(cls, 'Unassigned [0x%s]' % hex(value)[2:].upper().zfill(4), value)
-            return cls(value)
+            return _TABLE.intern('Unassigned [0x%s]' % hex(value)[2:].upper().zfill(4), value)
         if 0xF000 <= value <= 0xFFFF:
             # [RFC 7540]
-            extend_enum(cls, 'Reserved for Experimental Use [0x%s]' % hex(value)[2:].upper().zfill(4), value)
-            return cls(value)
+            return _TABLE.intern('Reserved for Experimental Use [0x%s]' % hex(value)[2:].upper().zfill(4), value)
         super()._missing_(value)
+
+
+_TABLE = EnumTable(Settings)
@@ -3,6 +3,8 @@
 
 from aenum import IntEnum, extend_enum
 
+from pcapkit.corekit.enumtable import EnumTable
+
 
 class PktType(IntEnum):
     """Enumeration class for PktType."""
@@ -28,7 +30,7 @@ class PktType(IntEnum):
     def get(key, default=-1):
         """Backport support for original codes."""
         if isinstance(key, int):
-            return PktType(key)
+            return _TABLE(key)
         if key not in PktType._member_map_:
             extend_enum(PktType, key, default)
         return PktType[key]
@@ -39,10 +41,11 @@ class PktType(IntEnum):
         if not (isinstance(value, int) and 0x00 <= value <= 0xFF):
             raise ValueError('%r is not a valid %s' % (value, cls.__name__))
         if 0x0D <= value <= 0xEF:
-            extend_enum(cls, 'Unassigned [0x%s]' % hex(value)[2:].upper().zfill(2), value)
-            return cls(value)
+            return _TABLE.intern('Unassigned [0x%s]' % hex(value)[2:].upper().zfill(2), value)
         if 0xF0 <= value <= 0xFF:
             # [RFC 7540]
-            extend_enum(cls, 'Reserved for Experimental Use [0x%s]' % hex(value)[2:].upper().zfill(2), value)
-            return cls(value)
+            return _TABLE.intern('Reserved for Experimental Use [0x%s]' % hex(value)[2:].upper().zfill(2), value)
         super()._missing_(value)
+
+
+_TABLE = EnumTable(PktType)
@@ -3,6 +3,8 @@
 
 from aenum import IntEnum, extend_enum
 
+from pcapkit.corekit.enumtable import EnumTable
+
 
 class QS(IntEnum):
     """Enumeration class for QS."""
@@ -17,7 +19,7 @@ class QS(IntEnum):
     def get(key, default=-1):
         """Backport support for original codes."""
         if isinstance(key, int):
-            return QS(key)
+            return _TABLE(key)
         if key not in QS._member_map_:
             extend_enum(QS, key, default)
         return QS[key]
@@ -27,5 +29,7 @@ class QS(IntEnum):
         """Lookup function used when value is not found."""
         if not (isinstance(value, int) and 0 <= value <= 8):
             raise ValueError('%r is not a valid %s' % (value, cls.__name__))
-        extend_enum(cls, 'Unassigned [%d]' % value, value)
-        return cls(value)
+        return _TABLE.intern('Unassigned [%d]' % value, value)
+
+
+_TABLE = EnumTable(QS)
@@ -3,6 +3,8 @@
 
 from aenum import IntEnum, extend_enum
 
+from pcapkit.corekit.enumtable import EnumTable
+
 
 class ClasLvl(IntEnum):
     """Enumeration class for ClasLvl."""
@@ -23,7 +25,7 @@ class ClasLvl(IntEnum):
     def get(key, default=-1):
         """Backport support for original codes."""
         if isinstance(key, int):
-            return ClasLvl(key)
+            return _TABLE(key)
         if key not in ClasLvl._member_map_:
             extend_enum(ClasLvl, key, default)
         return ClasLvl[key]
@@ -34,5 +36,7 @@ class ClasLvl(IntEnum):
         if not (isinstance(value, int) and 0b0000_0000 <= value <= 0b1111_1111):
             raise ValueError('%r is not a valid %s' % (value, cls.__name__))
         temp = bin(value)[2:].upper().zfill(8)
-        extend_enum(cls, 'Unassigned [0b%s]' % (temp[:4]+'_'+temp[4:]), value)
-        return cls(value)
+        return _TABLE.intern('Unassigned [0b%s]' % (temp[:4]+'_'+temp[4:]), value)
+
+
+_TABLE = EnumTable(ClasLvl)
@@ -3,6 +3,8 @@
 
 from aenum import IntEnum, extend_enum
 
+from pcapkit.corekit.enumtable import EnumTable
+
 
 class OptCls(IntEnum):
     """Enumeration class for OptCls."""
@@ -19,7 +21,7 @@ class OptCls(IntEnum):
     def get(key, default=-1):
         """Backport support for original codes."""
         if isinstance(key, int):
-            return OptCls(key)
+            return _TABLE(key)
         if key not in OptCls._member_map_:
             extend_enum(OptCls, key, default)
         return OptCls[key]
@@ -29,5 +31,7 @@ class OptCls(IntEnum):
         """Lookup function used when value is not found."""
         if not (isinstance(value, int) and 0 <= value <= 3):
             raise ValueError('%r is not a valid %s' % (value, cls.__name__))
-        extend_enum(cls, 'Unassigned [%d]' % value, value)
-        return cls(value)
+        return _TABLE.intern('Unassigned [%d]' % value, value)
+
+
+_TABLE = EnumTable(OptCls)
@@ -3,6 +3,8 @@
 
 from aenum import IntEnum, extend_enum
 
+from pcapkit.corekit.enumtable import EnumTable
+
 
 class Options(IntEnum):
     """Enumeration class for Options."""
@@ -45,7 +47,7 @@ class Options(IntEnum):
     def get(key, default=-1):
         """Backport support for original codes."""
         if isinstance(key, int):
-            return Options(key)
+            return _TABLE(key)
         if key not in Options._member_map_:
             extend_enum(Options, key, default)
         return Options[key]
@@ -55,5 +57,7 @@ class Options(IntEnum):
         """Lookup function used when value is not found."""
         if not (isinstance(value, int) and 0 <= value <= 255):
             raise ValueError('%r is not a valid %s' % (value, cls.__name__))
-        extend_enum(cls, 'Unassigned [%d]' % value, value)
-        return cls(value)
+        return _TABLE.intern('Unassigned [%d]' % value, value)
+
+
+_TABLE = EnumTable(Options)
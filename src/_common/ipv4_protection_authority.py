@@ -3,6 +3,8 @@
 
 from aenum import IntEnum, extend_enum
 
+from pcapkit.corekit.enumtable import EnumTable
+
 
 class ProtAuth(IntEnum):
     """Enumeration class for ProtAuth."""
@@ -23,7 +25,7 @@ class ProtAuth(IntEnum):
     def get(key, default=-1):
         """Backport support for original codes."""
         if isinstance(key, int):
-            return ProtAuth(key)
+            return _TABLE(key)
         if key not in ProtAuth._member_map_:
             extend_enum(ProtAuth, key, default)
         return ProtAuth[key]
@@ -33,5 +35,7 @@ class ProtAuth(IntEnum):
         """Lookup function used when value is not found."""
         if not (isinstance(value, int) and 0 <= value <= 7):
             raise ValueError('%r is not a valid %s' % (value, cls.__name__))
-        extend_enum(cls, 'Unassigned [%d]' % value, value)
-        return cls(value)
+        return _TABLE.intern('Unassigned [%d]' % value, value)
+
+
+_TABLE = EnumTable(ProtAuth)
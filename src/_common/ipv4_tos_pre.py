@@ -3,6 +3,8 @@
 
 from aenum import IntEnum, extend_enum
 
+from pcapkit.corekit.enumtable import EnumTable
+
 
 class Precedence(IntEnum):
     """Enumeration class for Precedence."""
@@ -23,7 +25,7 @@ class Precedence(IntEnum):
     def get(key, default=-1):
         """Backport support for original codes."""
         if isinstance(key, int):
-            return Precedence(key)
+            return _TABLE(key)
         if key not in Precedence._member_map_:
             extend_enum(Precedence, key, default)
         return Precedence[key]
@@ -33,5 +35,7 @@ class Precedence(IntEnum):
         """Lookup function used when value is not found."""
         if not (isinstance(value, int) and 0b000 <= value <= 0b111):
             raise ValueError('%r is not a valid %s' % (value, cls.__name__))
-        extend_enum(cls, 'Unassigned [%d]' % value, value)
-        return cls(value)
+        return _TABLE.intern('Unassigned [%d]' % value, value)
+
+
+_TABLE = EnumTable(Precedence)
@@ -3,6 +3,8 @@
 
 from aenum import IntEnum, extend_enum
 
+from pcapkit.corekit.enumtable import EnumTable
+
 
 class EXT_HDR(IntEnum):
     """Enumeration class for EXT_HDR."""
@@ -26,7 +28,10 @@ class EXT_HDR(IntEnum):
     def get(key, default=-1):
         """Backport support for original codes."""
         if isinstance(key, int):
-            return EXT_HDR(key)
+            return _TABLE(key)
         if key not in EXT_HDR._member_map_:
             extend_enum(EXT_HDR, key, default)
         return EXT_HDR[key]
+
+
+_TABLE = EnumTable(EXT_HDR)
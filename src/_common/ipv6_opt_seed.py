@@ -3,6 +3,8 @@
 
 from aenum import IntEnum, extend_enum
 
+from pcapkit.corekit.enumtable import EnumTable
+
 
 class SeedID(IntEnum):
     """Enumeration class for SeedID."""
@@ -19,7 +21,7 @@ class SeedID(IntEnum):
     def get(key, default=-1):
         """Backport support for original codes."""
         if isinstance(key, int):
-            return SeedID(key)
+            return _TABLE(key)
         if key not in SeedID._member_map_:
             extend_enum(SeedID, key, default)
         return SeedID[key]
@@ -29,5 +31,7 @@ class SeedID(IntEnum):
         """Lookup function used when value is not found."""
         if not (isinstance(value, int) and 0b00 <= value <= 0b11):
             raise ValueError('%r is not a valid %s' % (value, cls.__name__))
-        extend_enum(cls, 'Unassigned [0b%s]' % bin(value)[2:].zfill(2), value)
-        return cls(value)
+        return _TABLE.intern('Unassigned [0b%s]' % bin(value)[2:].zfill(2), value)
+
+
+_TABLE = EnumTable(SeedID)
@@ -3,6 +3,8 @@
 
 from aenum import IntEnum, extend_enum
 
+from pcapkit.corekit.enumtable import EnumTable
+
 
 class Options(IntEnum):
     """Enumeration class for Options."""
@@ -40,7 +42,7 @@ class Options(IntEnum):
     def get(key, default=-1):
         """Backport support for original codes."""
         if isinstance(key, int):
-            return Options(key)
+            return _TABLE(key)
         if key not in Options._member_map_:
             extend_enum(Options, key, default)
         return Options[key]
@@ -50,5 +52,7 @@ class Options(IntEnum):
         """Lookup function used when value is not found."""
         if not (isinstance(value, int) and 0x00 <= value <= 0xFF):
             raise ValueError('%r is not a valid %s' % (value, cls.__name__))
-        extend_enum(cls, 'Unassigned [0x%s]' % hex(value)[2:].upper().zfill(2), value)
-        return cls(value)
+        return _TABLE.intern('Unassigned [0x%s]' % hex(value)[2:].upper().zfill(2), value)
+
+
+_TABLE = EnumTable(Options)
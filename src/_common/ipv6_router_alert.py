@@ -3,6 +3,8 @@
 
 from aenum import IntEnum, extend_enum
 
+from pcapkit.corekit.enumtable import EnumTable
+
 
 class RT_ALT(IntEnum):
     """Enumeration class for RT_ALT."""
@@ -86,7 +88,7 @@ class RT_ALT(IntEnum):
     def get(key, default=-1):
         """Backport support for original codes."""
         if isinstance(key, int):
-            return RT_ALT(key)
+            return _TABLE(key)
         if key not in RT_ALT._member_map_:
             extend_enum(RT_ALT, key, default)
         return RT_ALT[key]
@@ -97,10 +99,11 @@ class RT_ALT(IntEnum):
         if not (isinstance(value, int) and 0 <= value <= 65535):
             raise ValueError('%r is not a valid %s' % (value, cls.__name__))
         if 70 <= value <= 65502:
-            extend_enum(cls, 'Unassigned [%d]' % value, value)
-            return cls(value)
+            return _TABLE.intern('Unassigned [%d]' % value, value)
         if 65503 <= value <= 65534:
             # [RFC 5350]
-            extend_enum(cls, 'Reserved for experimental use [%d]' % value, value)
-            return cls(value)
+            return _TABLE.intern('Reserved for experimental use [%d]' % value, value)
         super()._missing_(value)
+
+
+_TABLE = EnumTable(RT_ALT)
@@ -3,6 +3,8 @@
 
 from aenum import IntEnum, extend_enum
 
+from pcapkit.corekit.enumtable import EnumTable
+
 
 class RT_TYPE(IntEnum):
     """Enumeration class for RT_TYPE."""
@@ -22,7 +24,7 @@ class RT_TYPE(IntEnum):
     def get(key, default=-1):
         """Backport support for original codes."""
         if isinstance(key, int):
-            return RT_TYPE(key)
+            return _TABLE(key)
         if key not in RT_TYPE._member_map_:
             extend_enum(RT_TYPE, key, default)
         return RT_TYPE[key]
@@ -33,6 +35,8 @@ class RT_TYPE(IntEnum):
         if not (isinstance(value, int) and 0 <= value <= 255):
             raise ValueError('%r is not a valid %s' % (value, cls.__name__))
         if 4 <= value <= 252:
-            extend_enum(cls, 'Unassigned [%d]' % value, value)
-            return cls(value)
+            return _TABLE.intern('Unassigned [%d]' % value, value)
         super()._missing_(value)
+
+
+_TABLE = EnumTable(RT_TYPE)
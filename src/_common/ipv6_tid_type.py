@@ -3,6 +3,8 @@
 
 from aenum import IntEnum, extend_enum
 
+from pcapkit.corekit.enumtable import EnumTable
+
 
 class TaggerId(IntEnum):
     """Enumeration class for TaggerId."""
@@ -19,7 +21,7 @@ class TaggerId(IntEnum):
     def get(key, default=-1):
         """Backport support for original codes."""
         if isinstance(key, int):
-            return TaggerId(key)
+            return _TABLE(key)
         if key not in TaggerId._member_map_:
             extend_enum(TaggerId, key, default)
         return TaggerId[key]
@@ -30,6 +32,8 @@ class TaggerId(IntEnum):
         if not (isinstance(value, int) and 0 <= value <= 7):
             raise ValueError('%r is not a valid %s' % (value, cls.__name__))
         if 4 <= value <= 7:
-            extend_enum(cls, 'Unassigned [%d]' % value, value)
-            return cls(value)
+            return _TABLE.intern('Unassigned [%d]' % value, value)
         super()._missing_(value)
+
+
+_TABLE = EnumTable(TaggerId)
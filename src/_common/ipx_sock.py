@@ -3,6 +3,8 @@
 
 from aenum import IntEnum, extend_enum
 
+from pcapkit.corekit.enumtable import EnumTable
+
 
 class Sockets(IntEnum):
     """Enumeration class for Sockets."""
@@ -29,7 +31,7 @@ class Sockets(IntEnum):
     def get(key, default=-1):
         """Backport support for original codes."""
         if isinstance(key, int):
-            return Sockets(key)
+            return _TABLE(key)
         if key not in Sockets._member_map_:
             extend_enum(Sockets, key, default)
         return Sockets[key]
@@ -40,18 +42,16 @@ class Sockets(IntEnum):
         if not (isinstance(value, int) and 0x0000 <= value <= 0xFFFF):
             raise ValueError('%r is not a valid %s' % (value, cls.__name__))
         if 0x0001 <= value <= 0x0BB8:
-            extend_enum(cls, 'Registered by Xerox [0x%s]' % hex(value)[2:].upper().zfill(4), value)
-            return cls(value)
+            return _TABLE.intern('Registered by Xerox [0x%s]' % hex(value)[2:].upper().zfill(4), value)
         if 0x0020 <= value <= 0x003F:
-            extend_enum(cls, 'Experimental [0x%s]' % hex(value)[2:].upper().zfill(4), value)
-            return cls(value)
+            return _TABLE.intern('Experimental [0x%s]' % hex(value)[2:].upper().zfill(4), value)
         if 0x0BB9 <= value <= 0xFFFF:
-            extend_enum(cls, 'Dynamically Assigned [0x%s]' % hex(value)[2:].upper().zfill(4), value)
-            return cls(value)
+            return _TABLE.intern('Dynamically Assigned [0x%s]' % hex(value)[2:].upper().zfill(4), value)
         if 0x4000 <= value <= 0x4FFF:
-            extend_enum(cls, 'Dynamically Assigned Socket Numbers [0x%s]' % hex(value)[2:].upper().zfill(4), value)
-            return cls(value)
+            return _TABLE.intern('Dynamically Assigned Socket Numbers [0x%s]' % hex(value)[2:].upper().zfill(4), value)
         if 0x8000 <= value <= 0xFFFF:
-            extend_enum(cls, 'Statically Assigned Socket Numbers [0x%s]' % hex(value)[2:].upper().zfill(4), value)
-            return cls(value)
+            return _TABLE.intern('Statically Assigned Socket Numbers [0x%s]' % hex(value)[2:].upper().zfill(4), value)
         super()._missing_(value)
+
+
+_TABLE = EnumTable(Sockets)
@@ -3,6 +3,8 @@
 
 from aenum import IntEnum, extend_enum
 
+from pcapkit.corekit.enumtable import EnumTable
+
 
 class PktType(IntEnum):
     """Enumeration class for PktType."""
@@ -22,7 +24,7 @@ class PktType(IntEnum):
     def get(key, default=-1):
         """Backport support for original codes."""
         if isinstance(key, int):
-            return PktType(key)
+            return _TABLE(key)
         if key not in PktType._member_map_:
             extend_enum(PktType, key, default)
         return PktType[key]
@@ -32,5 +34,7 @@ class PktType(IntEnum):
         """Lookup function used when value is not found."""
         if not (isinstance(value, int) and 0 <= value <= 255):
             raise ValueError('%r is not a valid %s' % (value, cls.__name__))
-        extend_enum(cls, 'Unassigned [%d]' % value, value)
-        return cls(value)
+        return _TABLE.intern('Unassigned [%d]' % value, value)
+
+
+_TABLE = EnumTable(PktType)
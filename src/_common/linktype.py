@@ -3,6 +3,8 @@
 
 from aenum import IntEnum, extend_enum
 
+from pcapkit.corekit.enumtable import EnumTable
+
 
 class LinkType(IntEnum):
     """Enumeration class for LinkType."""
@@ -130,7 +132,7 @@ class LinkType(IntEnum):
     def get(key, default=-1):
         """Backport support for original codes."""
         if isinstance(key, int):
-            return LinkType(key)
+            return _TABLE(key)
         if key not in LinkType._member_map_:
             extend_enum(LinkType, key, default)
         return LinkType[key]
@@ -140,5 +142,7 @@ class LinkType(IntEnum):
         """Lookup function used when value is not found."""
         if not (isinstance(value, int) and 0 <= value <= 0xFFFF_FFFF):
             raise ValueError('%r is not a valid %s' % (value, cls.__name__))
-        extend_enum(cls, 'Unassigned [%d]' % value, value)
-        return cls(value)
+        return _TABLE.intern('Unassigned [%d]' % value, value)
+
+
+_TABLE = EnumTable(LinkType)
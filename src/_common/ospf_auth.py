@@ -3,6 +3,8 @@
 
 from aenum import IntEnum, extend_enum
 
+from pcapkit.corekit.enumtable import EnumTable
+
 
 class AuthType(IntEnum):
     """Enumeration class for AuthType."""
@@ -19,7 +21,7 @@ class AuthType(IntEnum):
     def get(key, default=-1):
         """Backport support for original codes."""
         if isinstance(key, int):
-            return AuthType(key)
+            return _TABLE(key)
         if key not in AuthType._member_map_:
             extend_enum(AuthType, key, default)
         return AuthType[key]
@@ -30,10 +32,11 @@ class AuthType(IntEnum):
         if not (isinstance(value, int) and 0 <= value <= 65535):
             raise ValueError('%r is not a valid %s' % (value, cls.__name__))
         if 4 <= value <= 255:
-            extend_enum(cls, 'Unassigned [%d]' % value, value)
-            return cls(value)
+            return _TABLE.intern('Unassigned [%d]' % value, value)
         if 256 <= value <= 65535:
             # [RFC 6549]
-            extend_enum(cls, 'Deprecated [%d]' % value, value)
-            return cls(value)
+            return _TABLE.intern('Deprecated [%d]' % value, value)
         super()._missing_(value)
+
+
+_TABLE = EnumTable(AuthType)
@@ -3,6 +3,8 @@
 
 from aenum import IntEnum, extend_enum
 
+from pcapkit.corekit.enumtable import EnumTable
+
 
 class Options(IntEnum):
     """Enumeration class for Options."""
@@ -57,7 +59,7 @@ class Options(IntEnum):
     def get(key, default=-1):
         """Backport support for original codes."""
         if isinstance(key, int):
-            return Options(key)
+            return _TABLE(key)
         if key not in Options._member_map_:
             extend_enum(Options, key, default)
         return Options[key]
@@ -67,15 +69,14 @@ class Options(IntEnum):
         """Lookup function used when value is not found."""
         if not (isinstance(value, int) and 0 <= value <= 255):
             raise ValueError('%r is not a valid %s' % (value, cls.__name__))
-        extend_enum(cls, 'Unassigned [%d]' % value, value)
-        return cls(value)
+        return _TABLE.intern('Unassigned [%d]' % value, value)
         if 35 <= value <= 68:
-            extend_enum(cls, 'Reserved [%d]' % value, value)
-            return cls(value)
+            return _TABLE.intern('Reserved [%d]' % value, value)
         if 71 <= value <= 75:
-            extend_enum(cls, 'Reserved [%d]' % value, value)
-            return cls(value)
+            return _TABLE.intern('Reserved [%d]' % value, value)
         if 79 <= value <= 252:
-            extend_enum(cls, 'Reserved [%d]' % value, value)
-            return cls(value)
+            return _TABLE.intern('Reserved [%d]' % value, value)
         super()._missing_(value)
+
+
+_TABLE = EnumTable(Options)
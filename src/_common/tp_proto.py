@@ -3,6 +3,8 @@
 
 from aenum import IntEnum, extend_enum
 
+from pcapkit.corekit.enumtable import EnumTable
+
 
 class TransType(IntEnum):
     """Enumeration class for TransType."""
@@ -162,7 +164,7 @@ class TransType(IntEnum):
     def get(key, default=-1):
         """Backport support for original codes."""
         if isinstance(key, int):
-            return TransType(key)
+            return _TABLE(key)
         if key not in TransType._member_map_:
             extend_enum(TransType, key, default)
         return TransType[key]
@@ -174,6 +176,8 @@ class TransType(IntEnum):
             raise ValueError('%r is not a valid %s' % (value, cls.__name__))
         if 143 <= value <= 252:
             # [Internet_Assigned_Numbers_Authority]
-            extend_enum(cls, 'Unassigned [%d]' % value, value)
-            return cls(value)
+            return _TABLE.intern('Unassigned [%d]' % value, value)
         super()._missing_(value)
+
+
+_TABLE = EnumTable(TransType)
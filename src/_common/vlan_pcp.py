@@ -3,6 +3,8 @@
 
 from aenum import IntEnum, extend_enum
 
+from pcapkit.corekit.enumtable import EnumTable
+
 
 class PrioLvl(IntEnum):
     """Enumeration class for PrioLvl."""
@@ -23,7 +25,7 @@ class PrioLvl(IntEnum):
     def get(key, default=-1):
         """Backport support for original codes."""
         if isinstance(key, int):
-            return PrioLvl(key)
+            return _TABLE(key)
         if key not in PrioLvl._member_map_:
             extend_enum(PrioLvl, key, default)
         return PrioLvl[key]
@@ -33,5 +35,7 @@ class PrioLvl(IntEnum):
         """Lookup function used when value is not found."""
         if not (isinstance(value, int) and 0b000 <= value <= 0b111):
             raise ValueError('%r is not a valid %s' % (value, cls.__name__))
-        extend_enum(cls, 'Unassigned [0b%s]' % bin(value)[2:].zfill(3), value)
-        return cls(value)
+        return _TABLE.intern('Unassigned [0b%s]' % bin(value)[2:].zfill(3), value)
+
+
+_TABLE = EnumTable(PrioLvl)
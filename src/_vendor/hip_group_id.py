@@ -21,6 +21,8 @@ def LINE(NAME, DOCS, FLAG, ENUM, MISS): return f'''\
 
 from aenum import IntEnum, extend_enum
 
+from pcapkit.corekit.enumtable import EnumTable
+
 
 class {NAME}(IntEnum):
     """Enumeration class for {NAME}."""
@@ -34,7 +36,7 @@ class {NAME}(IntEnum):
     def get(key, default=-1):
         """Backport support for original codes."""
         if isinstance(key, int):
-            return {NAME}(key)
+            return _TABLE(key)
         if key not in {NAME}._member_map_:
             extend_enum({NAME}, key, default)
         return {NAME}[key]
@@ -46,6 +48,9 @@ class {NAME}(IntEnum):
             raise ValueError('%r is not a valid %s' % (value, cls.__name__))
         {MISS}
         super()._missing_(value)
+
+
+_TABLE = EnumTable({NAME})
 '''
 
 
@@ -117,8 +122,7 @@ for item in reader:
         miss.append(f'if {start} <= value <= {stop}:')
         if lrfc or cmmt:
             miss.append(f'    #{lrfc}{cmmt}')
-        miss.append(f"    extend_enum(cls, '{name} [%d]' % value, value)")
-        miss.append('    return cls(value)')
+        miss.append(f"    return _TABLE.intern('{name} [%d]' % value, value)")
 
 
 ###############
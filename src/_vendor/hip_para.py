@@ -20,6 +20,8 @@ LINE = lambda NAME, DOCS, FLAG, ENUM, MISS: f'''\
 
 from aenum import IntEnum, extend_enum
 
+from pcapkit.corekit.enumtable import EnumTable
+
 
 class {NAME}(IntEnum):
     """Enumeration class for {NAME}."""
@@ -33,7 +35,7 @@ class {NAME}(IntEnum):
     def get(key, default=-1):
         """Backport support for original codes."""
         if isinstance(key, int):
-            return {NAME}(key)
+            return _TABLE(key)
         if key not in {NAME}._member_map_:
             extend_enum({NAME}, key, default)
         return {NAME}[key]
@@ -45,6 +47,9 @@ class {NAME}(IntEnum):
             raise ValueError('%r is not a valid %s' % (value, cls.__name__))
         {MISS}
         super()._missing_(value)
+
+
+_TABLE = EnumTable({NAME})
 '''
 
 
@@ -116,8 +121,7 @@ for item in reader:
         miss.append(f'if {start} <= value <= {stop}:')
         if lrfc or cmmt or plen:
             miss.append(f"#{lrfc}{plen}{cmmt}")
-        miss.append(f"    extend_enum(cls, '{name} [%d]' % value, value)")
-        miss.append('    return cls(value)')
+        miss.append(f"    return _TABLE.intern('{name} [%d]' % value, value)")
 
 
 ###############
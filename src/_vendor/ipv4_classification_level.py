@@ -17,6 +17,8 @@ def LINE(NAME, DOCS, FLAG, ENUM, MISS): return f'''\
 
 from aenum import IntEnum, extend_enum
 
+from pcapkit.corekit.enumtable import EnumTable
+
 
 class {NAME}(IntEnum):
     """Enumeration class for {NAME}."""
@@ -30,7 +32,7 @@ class {NAME}(IntEnum):
     def get(key, default=-1):
         """Backport support for original codes."""
         if isinstance(key, int):
-            return {NAME}(key)
+            return _TABLE(key)
         if key not in {NAME}._member_map_:
             extend_enum({NAME}, key, default)
         return {NAME}[key]
@@ -41,6 +43,9 @@ class {NAME}(IntEnum):
         if not ({FLAG}):
             raise ValueError('%r is not a valid %s' % (value, cls.__name__))
         {MISS}
+
+
+_TABLE = EnumTable({NAME})
 '''
 
 
@@ -86,8 +91,7 @@ def rename(name, code):
 enum = list()
 miss = [
     'temp = bin(value)[2:].upper().zfill(8)',
-    "extend_enum(cls, 'Unassigned [0b%s]' % (temp[:4]+'_'+temp[4:]), value)",
-    'return cls(value)'
+    "return _TABLE.intern('Unassigned [0b%s]' % (temp[:4]+'_'+temp[4:]), value)"
 ]
 for code, name in DATA.items():
     code = binary(code)
@@ -21,6 +21,8 @@ def LINE(NAME, DOCS, ENUM): return f'''\
 
 from aenum import IntEnum, extend_enum
 
+from pcapkit.corekit.enumtable import EnumTable
+
 
 class {NAME}(IntEnum):
     """Enumeration class for {NAME}."""
@@ -34,10 +36,13 @@ class {NAME}(IntEnum):
     def get(key, default=-1):
         """Backport support for original codes."""
         if isinstance(key, int):
-            return {NAME}(key)
+            return _TABLE(key)
         if key not in {NAME}._member_map_:
             extend_enum({NAME}, key, default)
         return {NAME}[key]
+
+
+_TABLE = EnumTable({NAME})
 '''
 
 
@@ -120,8 +125,7 @@ for item in reader:
         miss.append(f'if {start} <= value <= {stop}:')
         if lrfc or desc or cmmt:
             miss.append(f'    #{lrfc}{desc}{cmmt}')
-        miss.append(f"    extend_enum(cls, '{name} [%d]' % value, value)")
-        miss.append('    return cls(value)')
+        miss.append(f"    return _TABLE.intern('{name} [%d]' % value, value)")
 
 
 ###############
@@ -7,8 +7,13 @@ tuple-like class `VersionInfo`, and protocol collection
 class `ProtoChain`.
 
 """
-from pcapkit.corekit.infoclass import Info
-from pcapkit.corekit.protochain import ProtoChain
-from pcapkit.corekit.version import VersionInfo
+from pcapkit.utilities.lazy import lazy_loader
 
 __all__ = ['Info', 'ProtoChain', 'VersionInfo']
+
+# lazy attribute loading (PEP 562)
+__getattr__, __dir__ = lazy_loader(__name__, {
+    'Info': 'pcapkit.corekit.infoclass',
+    'ProtoChain': 'pcapkit.corekit.protochain',
+    'VersionInfo': 'pcapkit.corekit.version',
+})
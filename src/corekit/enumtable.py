@@ -0,0 +1,89 @@
+# -*- coding: utf-8 -*-
+"""enumeration lookup table
+
+`pcapkit.corekit.enumtable` contains class `EnumTable`,
+which is a precomputed value-to-member lookup table for
+IANA enumerations in `pcapkit._common`. Unassigned (yet
+valid) values are interned as pseudo members of the
+enumeration, thus no class mutation is made during
+dissection.
+
+"""
+__all__ = ['EnumTable']
+
+
+class EnumTable:
+    """Value-to-member lookup table of an enumeration.
+
+    Properties:
+        * enum -- EnumMeta, enumeration class
+
+    Methods:
+        * intern -- fetch or create pseudo member for unassigned value
+
+    Attributes:
+        * _enum -- EnumMeta, enumeration class
+        * _table -- dict, mapping of value to (pseudo) member
+
+    """
+    ##########################################################################
+    # Properties.
+    ##########################################################################
+
+    @property
+    def enum(self):
+        """Enumeration class."""
+        return self._enum
+
+    ##########################################################################
+    # Methods.
+    ##########################################################################
+
+    def intern(self, name, value):
+        """Fetch or create pseudo member for unassigned value.
+
+        Positional arguments:
+            * name -- str, name of pseudo member
+            * value -- int, value of pseudo member
+
+        Returns:
+            * Enum -- interned (pseudo) member
+
+        """
+        try:
+            return self._table[value]
+        except KeyError:
+            pass
+        member = int.__new__(self._enum, value)
+        member._name_ = name
+        member._value_ = value
+        return self._table.setdefault(value, member)
+
+    ##########################################################################
+    # Data models.
+    ##########################################################################
+
+    def __init__(self, enum):
+        """Build lookup table.
+
+        Positional arguments:
+            * enum -- EnumMeta, enumeration class
+
+        """
+        self._enum = enum
+        self._table = dict(enum._value2member_map_)
+
+    def __call__(self, value):
+        """Lookup member by value.
+
+        Positional arguments:
+            * value -- int, enumeration value
+
+        Returns:
+            * Enum -- enumeration (pseudo) member
+
+        """
+        try:
+            return self._table[value]
+        except (KeyError, TypeError):
+            return self._enum(value)
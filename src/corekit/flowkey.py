@@ -0,0 +1,70 @@
+# -*- coding: utf-8 -*-
+"""flow keys
+
+`pcapkit.corekit.flowkey` contains functions to make keys
+of TCP flows, which are packed endpoints (IP address & port)
+as `bytes`. Keys are made once per frame whilst dissecting,
+and shared by flow tracing (`TraceFlow`, which keys on flows
+of both directions) and TCP reassembly (`TCP_Reassembly`,
+which keys on streams of one direction).
+
+"""
+import ipaddress
+
+__all__ = ['flow_key', 'stream_key', 'unpack_key']
+
+
+def flow_key(src, srcport, dst, dstport):
+    """Make direction-normalised flow key.
+
+    Positional arguments:
+        * src -- ipaddress.IPv4Address / ipaddress.IPv6Address, source IP address
+        * srcport -- int, source port
+        * dst -- ipaddress.IPv4Address / ipaddress.IPv6Address, destination IP address
+        * dstport -- int, destination port
+
+    Returns:
+        * bytes -- flow key, i.e. packed endpoints in ascending order
+        * bool -- if packet is from the greater endpoint, i.e. in reverse direction
+
+    Endpoints are 6 bytes for IPv4 and 18 bytes for IPv6, thus
+    keys of the two versions never collide.
+
+    """
+    this = src.packed + srcport.to_bytes(2, 'big')
+    that = dst.packed + dstport.to_bytes(2, 'big')
+    if this <= that:
+        return this + that, False
+    return that + this, True
+
+
+def stream_key(key, reverse):
+    """Make stream key, i.e. packed endpoints in packet direction.
+
+    Positional arguments:
+        * key -- bytes, flow key
+        * reverse -- bool, if packet is in reverse direction
+
+    Returns:
+        * bytes -- stream key
+
+    """
+    if not reverse:
+        return key
+    half = len(key) // 2
+    return key[half:] + key[:half]
+
+
+def unpack_key(key):
+    """Unpack flow (or stream) key.
+
+    Positional arguments:
+        * key -- bytes, flow (or stream) key
+
+    Returns:
+        * tuple -- source IP address, source port, destination IP address & destination port
+
+    """
+    half = len(key) // 2
+    return (ipaddress.ip_address(key[:half-2]), int.from_bytes(key[half-2:half], 'big'),
+            ipaddress.ip_address(key[half:-2]), int.from_bytes(key[-2:], 'big'))
@@ -21,6 +21,9 @@ from pcapkit.utilities.validations import int_check, str_check
 
 __all__ = ['ProtoChain']
 
+# regular expression special characters
+metachar = re.compile(r'[\\^$.|?*+()\[\]{}]')
+
 
 class _ProtoList(collections.abc.Collection):
     """List of protocol classes for ProtoChain."""
@@ -28,8 +31,21 @@ class _ProtoList(collections.abc.Collection):
     def data(self):
         return self.__data__
 
+    @property
+    def keys(self):
+        """Lowercase indexes of protocols."""
+        if self.__keys__ is None:
+            keys = set()
+            for data in self.__data__:
+                with contextlib.suppress(Exception):
+                    index = data.__index__()
+                    keys.update(name.lower() for name in (index if isinstance(index, tuple) else (index,)))
+            self.__keys__ = frozenset(keys)
+        return self.__keys__
+
     def __init__(self, data=None, *, base=None):
         self.__data__ = list()
+        self.__keys__ = None
 
         if data is not None:
             self.__data__.append(data)
@@ -55,13 +71,9 @@ class _ProtoList(collections.abc.Collection):
         if flag or isinstance(x, Protocol):
             return (x in self.__data__)
 
-        with contextlib.suppress(Exception):
-            for data in self.__data__:
-                index = data.__index__()
-                if isinstance(index, tuple):
-                    index = r'|'.join(index)
-                if re.fullmatch(index, x, re.IGNORECASE):
-                    return True
+        # protocol indexes are plain names
+        if isinstance(x, str):
+            return (x.lower() in self.keys)
         return False
 
 
@@ -71,8 +83,16 @@ class _AliasList(collections.abc.Sequence):
     def data(self):
         return self.__data__
 
+    @property
+    def keys(self):
+        """Lowercase aliases of protocols."""
+        if self.__keys__ is None:
+            self.__keys__ = frozenset(data.lower() for data in self.__data__ if isinstance(data, str))
+        return self.__keys__
+
     def __init__(self, data=None, *, base=None):
         self.__data__ = list()
+        self.__keys__ = None
 
         if data is not None:
             self.__data__.append(data)
@@ -106,6 +126,10 @@ class _AliasList(collections.abc.Sequence):
             if isinstance(x, tuple):
                 x = r'|'.join(x)
 
+        # look up aliases for plain names
+        if isinstance(x, str) and metachar.search(x) is None:
+            return (x.lower() in self.keys)
+
         with contextlib.suppress(Exception):
             for data in self.__data__:
                 if re.fullmatch(x, data, re.IGNORECASE):
@@ -124,6 +148,13 @@ class _AliasList(collections.abc.Sequence):
             if isinstance(value, tuple):
                 value = r'|'.join(value)
 
+        # compare aliases for plain names
+        if isinstance(value, str) and metachar.search(value) is None:
+            if value.lower() not in self.keys:
+                return 0
+            value = value.lower()
+            return sum(1 for data in self.__data__ if isinstance(data, str) and data.lower() == value)
+
         with contextlib.suppress(Exception):
             return sum(1 for data in self.__data__ if re.fullmatch(value, data, re.IGNORECASE) is not None)
         return 0
@@ -159,6 +190,14 @@ class _AliasList(collections.abc.Sequence):
             if isinstance(value, tuple):
                 value = r'|'.join(value)
 
+        # compare aliases for plain names
+        if isinstance(value, str) and metachar.search(value) is None:
+            value = value.lower()
+            for index, data in enumerate(self.__data__[start:stop]):
+                if isinstance(data, str) and data.lower() == value:
+                    return index
+            return None
+
         try:
             for index, data in enumerate(self.__data__[start:stop]):
                 if re.fullmatch(value, data, re.IGNORECASE):
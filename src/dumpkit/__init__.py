@@ -6,12 +6,52 @@
 in [`dictdumper`](https://github.com/JarryShaw/dictdumper).
 
 """
+import collections.abc
+import datetime
+import enum
+import ipaddress
+import json
+import os
+import queue
+import struct
 import sys
+import threading
+import time
 
-from pcapkit.ipsuite.pcap.frame import Frame
-from pcapkit.ipsuite.pcap.header import Header
+from pcapkit.corekit.infoclass import Info
+from pcapkit.utilities.lazy import lazy_loader
 
-__all__ = ['PCAP', 'NotImplementedIO']
+###############################################################################
+# import aenum
+# from pcapkit.ipsuite.pcap.frame import Frame
+# from pcapkit.ipsuite.pcap.header import Header
+###############################################################################
+
+__all__ = ['PCAP', 'JSONLines', 'QueueIO', 'NotImplementedIO']
+
+# lazy attribute loading (PEP 562)
+__getattr__, __dir__ = lazy_loader(__name__, {
+    'Frame': 'pcapkit.ipsuite.pcap.frame',
+    'Header': 'pcapkit.ipsuite.pcap.header',
+})
+
+# default size of write buffer (in bytes)
+BUFFER_SIZE = 65536
+
+# default max length of captured packets (in octets)
+SNAPLEN = 262144
+
+# default max number of pending values in output queue
+QUEUE_SIZE = 1024
+
+# record header of PCAP frames, i.e. ts_sec, ts_usec, incl_len & orig_len
+_RECORD = {
+    'little': struct.Struct('<IIII'),
+    'big': struct.Struct('>IIII'),
+}
+
+# JSON encoder of JSON-Lines records
+_ENCODER = json.JSONEncoder(ensure_ascii=False, check_circular=False, separators=(',', ':'))
 
 
 class NotImplementedIO:
@@ -27,29 +67,401 @@ class NotImplementedIO:
         pass
 
 
+class QueueIO:
+    """Background output writer.
+
+    Values are handed to a bounded queue, which is drained by a writer
+    thread, thus dissection and serialisation of frames may overlap.
+    Exceptions raised by the writer are re-raised on the next call.
+
+    Properties:
+        * stats -- Info, queue metrics
+
+    Methods:
+        * close -- drain queue and stop writer thread
+
+    Attributes:
+        * _func -- function, output writer, i.e. `func(value, *, name)`
+        * _queue -- queue.Queue, pending values
+        * _thread -- threading.Thread, writer thread
+        * _error -- BaseException, exception raised by writer
+        * _count -- int, number of written values
+        * _depth -- int, max queue depth
+        * _stall -- int, number of stalls on full queue
+        * _stime -- float, total stall time (in seconds)
+
+    Utilities:
+        * _raise -- re-raise exception from writer thread
+        * _run -- drain queue in writer thread
+
+    """
+    ##########################################################################
+    # Properties.
+    ##########################################################################
+
+    @property
+    def stats(self):
+        """Queue metrics."""
+        return Info(
+            written=self._count,
+            pending=self._queue.qsize(),
+            max_depth=self._depth,
+            stalls=self._stall,
+            stall_time=self._stime,
+        )
+
+    ##########################################################################
+    # Methods.
+    ##########################################################################
+
+    def close(self):
+        """Drain queue and stop writer thread."""
+        if self._thread.is_alive():
+            self._queue.put(_STOP)
+            self._thread.join()
+        self._raise()
+
+    ##########################################################################
+    # Data models.
+    ##########################################################################
+
+    def __init__(self, func, *, maxsize=QUEUE_SIZE):
+        self._func = func
+        self._queue = queue.Queue(maxsize)
+        self._error = None
+        self._count = 0
+        self._depth = 0
+        self._stall = 0
+        self._stime = 0.0
+
+        self._thread = threading.Thread(target=self._run, name='pcapkit-output', daemon=True)
+        self._thread.start()
+
+    def __call__(self, value, *, name=None):
+        self._raise()
+        try:
+            self._queue.put_nowait((value, name))
+        except queue.Full:
+            start = time.perf_counter()
+            self._queue.put((value, name))
+            self._stall += 1
+            self._stime += time.perf_counter() - start
+        self._depth = max(self._depth, self._queue.qsize())
+
+    ##########################################################################
+    # Utilities.
+    ##########################################################################
+
+    def _raise(self):
+        """Re-raise exception from writer thread."""
+        if self._error is not None:
+            error, self._error = self._error, None
+            raise error
+
+    def _run(self):
+        """Drain queue in writer thread."""
+        while True:
+            item = self._queue.get()
+            if item is _STOP:
+                break
+            if self._error is not None:     # discard pending values after failure
+                continue
+            value, name = item
+            try:
+                self._func(value, name=name)
+            except BaseException as error:
+                self._error = error
+            else:
+                self._count += 1
+
+
+# sentinel to stop writer thread
+_STOP = object()
+
+
 class PCAP:
-    """PCAP file dumper."""
+    """PCAP file dumper.
+
+    Properties:
+        * kind -- str, dumper kind
+        * closed -- bool, if output file is closed
+
+    Methods:
+        * write -- batch write frames
+        * write_bytes -- write encoded frame records
+        * flush -- flush write buffer
+        * close -- close output file
+
+    Attributes:
+        * _file -- str, output file name
+        * _nsec -- bool, nanosecond-resolution file flag
+        * _size -- int, size of write buffer
+        * _byte -- str, output file byte order
+        * _fp -- io.BufferedWriter, output file (`None` if closed)
+
+    Utilities:
+        * _open -- (re)open output file
+        * _make_record -- make frame record
+
+    """
+    ##########################################################################
+    # Properties.
+    ##########################################################################
+
     @property
     def kind(self):
         return 'pcap'
 
+    @property
+    def closed(self):
+        return self._fp is None
+
+    ##########################################################################
+    # Methods.
+    ##########################################################################
+
+    def write(self, frames):
+        """Batch write frames.
+
+        Positional arguments:
+            * frames -- iterable<Info>, frame data
+
+        """
+        self._open().write(b''.join(map(self._make_record, frames)))
+
+    def write_bytes(self, data):
+        """Write encoded frame records.
+
+        Positional arguments:
+            * data -- bytes, record headers & packet data, in byte order
+                        & timestamp resolution of output file
+
+        """
+        self._open().write(data)
+
+    def flush(self):
+        """Flush write buffer."""
+        if self._fp is not None:
+            self._fp.flush()
+
+    def close(self):
+        """Close output file.
+
+        The output file will be reopened in append mode on next write.
+
+        """
+        if self._fp is not None:
+            self._fp.close()
+            self._fp = None
+
+    ##########################################################################
+    # Data models.
+    ##########################################################################
+
     def __init__(self, filename, *, protocol,
-                 byteorder=sys.byteorder, nanosecond=False):
+                 byteorder=sys.byteorder, nanosecond=False, snaplen=SNAPLEN, append=False,
+                 buffering=BUFFER_SIZE):
         self._file = filename
         self._nsec = nanosecond
+        self._size = buffering
+        self._byte = 'big' if byteorder.lower() == 'big' else 'little'
+        self._fp = None
+        if append and os.path.isfile(self._file):
+            return
+        from pcapkit.ipsuite.pcap.header import Header
         packet = Header(
             network=protocol,
             byteorder=byteorder,
             nanosecond=nanosecond,
+            snaplen=snaplen,
         ).data
-        with open(self._file, 'wb') as file:
-            file.write(packet)
+        self._fp = open(self._file, 'wb', buffering=self._size)
+        self._fp.write(packet)
 
     def __call__(self, frame, **kwargs):
-        packet = Frame(
-            frame.get('frame_info', frame),
-            packet=frame.packet,
-            nanosecond=self._nsec
-        ).data
-        with open(self._file, 'ab') as file:
-            file.write(packet)
+        self._open().write(self._make_record(frame))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def __getstate__(self):
+        self.flush()
+        state = self.__dict__.copy()
+        state['_fp'] = None
+        return state
+
+    ##########################################################################
+    # Utilities.
+    ##########################################################################
+
+    def _open(self):
+        """(Re)open output file."""
+        if self._fp is None:
+            self._fp = open(self._file, 'ab', buffering=self._size)
+        return self._fp
+
+    def _make_record(self, frame):
+        """Make frame record.
+
+        Positional arguments:
+            * frame -- Info, frame data
+
+        Returns:
+            * bytes -- record header and packet data
+
+        """
+        packet = frame.packet
+        info = getattr(frame, 'frame_info', frame)    # NB: `Info.get` makes a copy of nested `Info`
+        try:
+            header = _RECORD[self._byte].pack(info.ts_sec, info.ts_usec,
+                                              getattr(info, 'incl_len', len(packet)),
+                                              getattr(info, 'orig_len', len(packet)))
+        except AttributeError:
+            from pcapkit.ipsuite.pcap.frame import Frame
+            return Frame(info, packet=packet, nanosecond=self._nsec).data
+        return header + packet
+
+
+class JSONLines:
+    """JSON-Lines (NDJSON) file dumper.
+
+    Each dumped value is written as a self-contained JSON object in
+    one line, thus the output can be consumed whilst still being
+    written, e.g. `pcapkit in.pcap -f jsonl -o - | jq`.
+
+    Properties:
+        * kind -- str, dumper kind
+        * closed -- bool, if output file is closed
+
+    Methods:
+        * flush -- flush write buffer
+        * close -- close output file
+
+    Attributes:
+        * _file -- str, output file name (`'-'` for `stdout`)
+        * _fp -- io.BufferedWriter, output file (`None` if closed)
+
+    Utilities:
+        * _make_line -- make JSON-Lines record
+
+    """
+    ##########################################################################
+    # Properties.
+    ##########################################################################
+
+    @property
+    def kind(self):
+        return 'jsonl'
+
+    @property
+    def closed(self):
+        return self._fp is None
+
+    ##########################################################################
+    # Methods.
+    ##########################################################################
+
+    def flush(self):
+        """Flush write buffer."""
+        if self._fp is not None:
+            self._fp.flush()
+
+    def close(self):
+        """Close output file."""
+        if self._fp is None:
+            return
+        if self._fp is sys.stdout.buffer:
+            self._fp.flush()
+        else:
+            self._fp.close()
+        self._fp = None
+
+    ##########################################################################
+    # Data models.
+    ##########################################################################
+
+    def __init__(self, filename, *, buffering=BUFFER_SIZE):
+        self._file = filename
+        if filename == '-':
+            self._fp = sys.stdout.buffer
+        else:
+            self._fp = open(filename, 'wb', buffering=buffering)
+
+    def __call__(self, value, *, name=None):
+        self._fp.write(self._make_line(value))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    ##########################################################################
+    # Utilities.
+    ##########################################################################
+
+    @staticmethod
+    def _make_line(value):
+        """Make JSON-Lines record.
+
+        Positional arguments:
+            * value -- Info, content to be dumped
+
+        Returns:
+            * bytes -- UTF-8 encoded JSON object with trailing newline
+
+        """
+        return f'{_ENCODER.encode(_convert(value))}\n'.encode()
+
+
+def _convert(value):
+    """Convert value into JSON serialisable types."""
+    try:
+        converter = _CONVERTER[type(value)]
+    except KeyError:
+        converter = _CONVERTER.setdefault(type(value), _make_converter(type(value)))
+    return converter(value)
+
+
+def _make_converter(cls):
+    """Make converter for values of a type.
+
+    Positional arguments:
+        * cls -- type, type of value
+
+    Returns:
+        * function -- converter of values of `cls`
+
+    """
+    import aenum
+
+    if issubclass(cls, Info):
+        return lambda value: {key: _convert(item) for (key, item) in vars(value).items()}
+    if issubclass(cls, (enum.Enum, aenum.Enum)):
+        return lambda value: f'No.{value.value} {value.name}'
+    if issubclass(cls, (str, int, float)):
+        return lambda value: value
+    if issubclass(cls, collections.abc.Mapping):
+        return lambda value: {key: _convert(item) for (key, item) in value.items()}
+    if issubclass(cls, (bytes, bytearray, memoryview)):
+        return lambda value: bytes(value).hex()
+    if issubclass(cls, (list, tuple, range, set, frozenset)):
+        return lambda value: [_convert(item) for item in value]
+    if issubclass(cls, datetime.date):
+        return lambda value: value.strftime('%Y-%m-%dT%H:%M:%S.%fZ')
+    if issubclass(cls, (ipaddress._BaseAddress, ipaddress._BaseNetwork)):
+        return str
+    return repr
+
+
+# converters of JSON-Lines records, i.e. type -> converter
+_CONVERTER = {
+    str: lambda value: value,
+    int: lambda value: value,
+    float: lambda value: value,
+    bool: lambda value: value,
+    type(None): lambda value: value,
+}
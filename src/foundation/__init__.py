@@ -6,8 +6,16 @@ including PCAP file extraction tool `Extrator` and application
 layer protocol analyser `Analysis`.
 
 """
-from pcapkit.foundation.analysis import analyse as analyse2
-from pcapkit.foundation.extraction import *
-from pcapkit.foundation.traceflow import *
+from pcapkit.utilities.lazy import lazy_loader
 
-__all__ = ['analyse2', 'Extractor', 'TraceFlow']
+__all__ = ['analyse2', 'Extractor', 'TraceFlow', 'Columns', 'Catalog', 'RecordReader']
+
+# lazy attribute loading (PEP 562)
+__getattr__, __dir__ = lazy_loader(__name__, {
+    'analyse2': 'pcapkit.foundation.analysis:analyse',
+    'Extractor': 'pcapkit.foundation.extraction',
+    'TraceFlow': 'pcapkit.foundation.traceflow',
+    'Columns': 'pcapkit.foundation.columns',
+    'Catalog': 'pcapkit.foundation.catalog',
+    'RecordReader': 'pcapkit.foundation.records',
+})
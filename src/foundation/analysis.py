@@ -5,8 +5,21 @@
 analyse and match application layer protocol. Then, call
 corresponding modules and functions to extract the attributes.
 
+Application layer analysers are kept in the `ANALYSER`
+registry, which maps protocol names to analyser functions
+and is tried in order of registration. Third-party
+analysers may be added through `register`.
+
+Given transport layer ports, analysers hinted in the
+`PORT_HINT` table are tried first, and candidates whose
+`SIGNATURE` precheck fails on the leading bytes are skipped
+without instantiating the dissector. Dispatch statistics
+are reported through `stats`.
+
 """
+import collections
 import os
+import re
 
 from pcapkit.protocols.raw import Raw
 from pcapkit.utilities.decorators import seekset_ng
@@ -17,30 +30,139 @@ from pcapkit.utilities.exceptions import ProtocolError
 # from pcapkit.protocols.application.httpv2 import HTTPv2
 ###############################################################################
 
-__all__ = ['analyse']
+__all__ = ['analyse', 'register', 'stats', 'ANALYSER', 'PORT_HINT', 'SIGNATURE']
+
+# length of leading bytes for signature precheck
+SIGNATURE_SIZE = 16
+
+
+def analyse(file, length=None, *, analysers=None, ports=None, _termination=False):
+    """Analyse application layer packets.
 
+    Positional arguments:
+        * file -- file-like object, packet to be analysed
+        * length -- int, length of the analysing packet
 
-def analyse(file, length=None, *, _termination=False):
-    """Analyse application layer packets."""
+    Keyword arguments:
+        * analysers -- iterable<str>, names of analysers to be tried
+                        (default is None, i.e. all registered analysers)
+        * ports -- tuple<int>, source and destination ports of transport layer
+                        (default is None, i.e. no port hints)
+
+    Returns:
+        * Protocol -- analysed application layer packet, or `Raw` if none matched
+
+    """
     seekset = file.tell()
     if not _termination:
-        # HTTP/1.* analysis
-        flag, http = _analyse_httpv1(file, length, seekset=seekset)
-        if flag:
-            return http
-
         # NOTE: due to format similarity of HTTP/2 and TLS/SSL, HTTP/2 won't be analysed before TLS/SSL is implemented.
         # NB: the NOTE above is deprecated, since validations are performed
-
-        # HTTP/2 analysis
-        flag, http = _analyse_httpv2(file, length, seekset=seekset)
-        if flag:
-            return http
+        _STATS['analysed'] += 1
+        head = file.read(SIGNATURE_SIZE if length is None else min(length, SIGNATURE_SIZE))
+        file.seek(seekset, os.SEEK_SET)
+        for name, analyser in _fetch_analysers(analysers, ports):
+            signature = SIGNATURE.get(name)
+            if signature is not None and not signature(head, length):
+                _STATS['rejected'] += 1
+                continue
+            _STATS['attempted'] += 1
+            flag, packet = analyser(file, length, seekset=seekset)
+            if flag:
+                _STATS['matched'] += 1
+                return packet
 
     # raw packet analysis
     return Raw(file, length)
 
 
+def register(name, analyser, *, index=None, ports=None, signature=None):
+    """Register an application layer analyser.
+
+    Positional arguments:
+        * name -- str, protocol name of the analyser
+        * analyser -- callable, analyser function, which takes
+                        `(file, length, *, seekset)` and returns
+                        a tuple of success flag and analysed packet
+
+    Keyword arguments:
+        * index -- int, position of the analyser in the attempting order
+                        (default is None, i.e. append to the end)
+        * ports -- iterable<int>, well-known ports of the protocol, whose
+                        packets shall be tried with the analyser first
+        * signature -- callable, precheck function, which takes `(head, length)`,
+                        i.e. the leading `SIGNATURE_SIZE` bytes and length of the
+                        packet, and returns if the analyser may match
+
+    """
+    for port in (ports or ()):
+        hints = PORT_HINT.get(port, ())
+        if name not in hints:
+            PORT_HINT[port] = hints + (name,)
+    if signature is not None:
+        SIGNATURE[name] = signature
+
+    ANALYSER.pop(name, None)
+    if index is None:
+        ANALYSER[name] = analyser
+        return
+
+    items = list(ANALYSER.items())
+    items.insert(index, (name, analyser))
+    ANALYSER.clear()
+    ANALYSER.update(items)
+
+
+def stats(*, reset=False):
+    """Application layer dispatch statistics.
+
+    Keyword arguments:
+        * reset -- bool, if reset statistics after reporting (default is False)
+
+    Returns:
+        * dict -- dispatch statistics, i.e.
+            - analysed -- int, number of packets analysed
+            - hinted -- int, number of packets with hinted analysers
+            - rejected -- int, number of analysers skipped by signature precheck
+            - attempted -- int, number of dissectors instantiated
+            - matched -- int, number of packets matched by an analyser
+            - hit_rate -- float, ratio of matched packets to dissector attempts
+
+    """
+    report = dict(_STATS)
+    report['hit_rate'] = (_STATS['matched'] / _STATS['attempted']) if _STATS['attempted'] else None
+    if reset:
+        _STATS.update(dict.fromkeys(_STATS, 0))
+    return report
+
+
+def _fetch_analysers(analysers=None, ports=None):
+    """Fetch analysers in order of attempt."""
+    if analysers is None:
+        items = ANALYSER.items()
+    else:
+        names = {name.lower() for name in analysers}
+        items = [(name, analyser) for (name, analyser) in ANALYSER.items() if name.lower() in names]
+
+    hints = tuple(name for port in (ports or ()) for name in PORT_HINT.get(port, ()))
+    if not hints:
+        return tuple(items)
+    _STATS['hinted'] += 1
+    order = {name: index for (index, name) in enumerate(reversed(hints))}
+    return tuple(sorted(items, key=lambda item: -order.get(item[0], -1)))
+
+
+def _signature_httpv1(head, length):
+    """Check if packet starts with HTTP/1.* method or version."""
+    return _RE_HTTPV1.match(head) is not None
+
+
+def _signature_httpv2(head, length):
+    """Check if packet starts with a valid HTTP/2 frame header."""
+    if length is None or len(head) < 9:
+        return True     # length unknown, leave to the dissector
+    return int.from_bytes(head[:3], 'big') == length and not head[5] & 0x80
+
+
 @seekset_ng
 def _analyse_httpv1(file, length, *, seekset=os.SEEK_SET):
     try:
@@ -59,3 +181,30 @@ def _analyse_httpv2(file, length, *, seekset=os.SEEK_SET):
     except ProtocolError:
         return False, None
     return True, http
+
+
+# HTTP/1.* start-line prefixes
+_RE_HTTPV1 = re.compile(rb'GET|HEAD|POST|PUT|DELETE|CONNECT|OPTIONS|TRACE|HTTP/')
+
+# dispatch statistics
+_STATS = collections.OrderedDict.fromkeys(['analysed', 'hinted', 'rejected', 'attempted', 'matched'], 0)
+
+# application layer analysers, in order of attempt
+ANALYSER = collections.OrderedDict([
+    ('HTTPv1', _analyse_httpv1),    # HTTP/1.* analysis
+    ('HTTPv2', _analyse_httpv2),    # HTTP/2 analysis
+])
+
+# analysers to be tried first, i.e. transport layer port -> names of analysers
+PORT_HINT = {
+    80: ('HTTPv1', 'HTTPv2'),       # HTTP
+    8000: ('HTTPv1', 'HTTPv2'),     # HTTP (alternate)
+    8008: ('HTTPv1', 'HTTPv2'),     # HTTP (alternate)
+    8080: ('HTTPv1', 'HTTPv2'),     # HTTP (alternate)
+}
+
+# signature prechecks, i.e. name of analyser -> precheck function
+SIGNATURE = {
+    'HTTPv1': _signature_httpv1,    # HTTP/1.* start-line
+    'HTTPv2': _signature_httpv2,    # HTTP/2 frame header
+}
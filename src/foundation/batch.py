@@ -0,0 +1,184 @@
+# -*- coding: utf-8 -*-
+"""batch extraction
+
+`pcapkit.foundation.batch` contains function `extract_many`,
+which extracts a batch of PCAP files with one `Extractor` per
+file inside a process pool. Workers import `pcapkit` once on
+start-up, and results, i.e. frame summary, flow index and
+reassembled datagrams, stream back as files complete, which
+may be aggregated through a reducer, e.g. `summarise`.
+
+"""
+import collections
+import concurrent.futures
+import functools
+import importlib
+import os
+
+from pcapkit.corekit.infoclass import Info
+
+###############################################################################
+# from pcapkit.foundation.extraction import Extractor
+###############################################################################
+
+__all__ = ['extract_many', 'summarise', 'SUMMARY']
+
+# modules imported by workers on start-up
+WARM_MODULES = (
+    'pcapkit.foundation.extraction',
+    'pcapkit.toolkit.default',
+    'pcapkit.protocols.link.ethernet',
+    'pcapkit.protocols.internet.ipv4',
+    'pcapkit.protocols.internet.ipv6',
+    'pcapkit.protocols.transport.tcp',
+    'pcapkit.protocols.transport.udp',
+)
+
+# empty summary, i.e. initial value of `summarise`
+SUMMARY = Info(files=0, errors=(), frames=0, bytes=0, start=None, end=None, protocols=dict(), flows=0)
+
+
+def extract_many(paths, *, workers=None, reducer=None, initial=None, **kwargs):
+    """Extract PCAP files in a process pool.
+
+    Positional arguments:
+        * paths -- iterable<str>, PCAP file names
+
+    Keyword arguments:
+        * workers -- int, number of worker processes (default is None, i.e. number of CPUs)
+        * reducer -- function, aggregate results, i.e. `reducer(total, result)`
+                        (default is None, i.e. results streamed back as iterator)
+        * initial -- object, initial value of aggregation (default is None, i.e. `SUMMARY`
+                        for `summarise`, or else first result)
+        * kwargs -- extraction & reassembly & trace settings of `Extractor`
+
+    Returns:
+        * iterator<Info> -- results of files in order of completion (if no `reducer`)
+            |--> fin -- str, PCAP file name
+            |--> frames -- int, number of frames
+            |--> bytes -- int, actual length of packets
+            |--> start -- float, UNIX-Epoch timestamp of first frame
+            |--> end -- float, UNIX-Epoch timestamp of last frame
+            |--> protocols -- Info, number of frames per protocol chain
+            |--> trace -- tuple<Info>, flow index of `TraceFlow` (if `trace` set)
+            |--> reassembly -- Info, reassembled datagrams (if `ip`/`ipv4`/`ipv6`/`tcp` set)
+            |--> error -- str, exception raised in extraction (`None` if succeeded)
+        * object -- aggregation of results (if `reducer` given)
+
+    Files are extracted without output files, thus `fout`, `format`,
+    `files`, `nofile`, `auto` & `store` are not accepted. Exceptions
+    raised whilst extracting a file are reported in its result.
+
+    """
+    results = _extract_many(list(paths), workers=workers or os.cpu_count() or 1, kwargs=kwargs)
+    if reducer is None:
+        return results
+    if initial is None and reducer is summarise:
+        initial = SUMMARY
+    if initial is None:
+        return functools.reduce(reducer, results)
+    return functools.reduce(reducer, results, initial)
+
+
+def summarise(total, result):
+    """Aggregate statistics of results, as a reducer of `extract_many`.
+
+    Positional arguments:
+        * total -- Info, aggregated statistics (or first result)
+        * result -- Info, result of a file
+
+    Returns:
+        * Info -- aggregated statistics
+            |--> files -- int, number of files
+            |--> errors -- tuple<str>, PCAP file names failed
+            |--> frames -- int, number of frames
+            |--> bytes -- int, actual length of packets
+            |--> start -- float, UNIX-Epoch timestamp of first frame
+            |--> end -- float, UNIX-Epoch timestamp of last frame
+            |--> protocols -- Info, number of frames per protocol chain
+            |--> flows -- int, number of traced flows
+
+    """
+    if 'files' not in total:    # first result as initial value
+        total = summarise(SUMMARY, total)
+
+    protocols = collections.Counter(total.protocols)
+    protocols.update(result.protocols)
+    starts = [time for time in (total.start, result.start) if time is not None]
+    ends = [time for time in (total.end, result.end) if time is not None]
+    return Info(
+        files=total.files + 1,
+        errors=total.errors + ((result.fin,) if result.error is not None else ()),
+        frames=total.frames + result.frames,
+        bytes=total.bytes + result.bytes,
+        start=min(starts) if starts else None,
+        end=max(ends) if ends else None,
+        protocols=dict(protocols),
+        flows=total.flows + len(result.trace or ()),
+    )
+
+
+def _extract_many(paths, *, workers, kwargs):
+    """Yield results of files in order of completion."""
+    with concurrent.futures.ProcessPoolExecutor(max_workers=workers, initializer=_initialise) as executor:
+        futures = [executor.submit(_extract, path, kwargs) for path in paths]
+        try:
+            for future in concurrent.futures.as_completed(futures):
+                yield future.result()
+        finally:
+            for future in futures:
+                future.cancel()
+
+
+def _initialise():
+    """Import modules in worker on start-up."""
+    for module in WARM_MODULES:
+        importlib.import_module(module)
+
+
+def _extract(path, kwargs):
+    """Extract a PCAP file in worker.
+
+    Positional arguments:
+        * path -- str, PCAP file name
+        * kwargs -- dict, settings of `Extractor`
+
+    Returns:
+        * Info -- result of file
+
+    """
+    from pcapkit.foundation.extraction import Extractor
+
+    frames = length = 0
+    start = end = None
+    protocols = collections.Counter()
+    trace = reassembly = error = None
+    try:
+        extractor = Extractor(fin=path, nofile=True, auto=False, store=False, **kwargs)
+        for frame in extractor:
+            info = frame.info
+            frames += 1
+            length += info.frame_info.orig_len
+            if start is None:
+                start = info.time_epoch
+            end = info.time_epoch
+            protocols[str(frame.protochain)] += 1
+
+        if kwargs.get('trace'):
+            trace = extractor.trace
+        if any(kwargs.get(name) for name in ('ip', 'ipv4', 'ipv6', 'tcp')):
+            reassembly = extractor.reassembly
+    except Exception as exc:
+        error = f'{type(exc).__name__}: {exc}'
+
+    return Info(
+        fin=path,
+        frames=frames,
+        bytes=length,
+        start=start,
+        end=end,
+        protocols=dict(protocols),
+        trace=trace,
+        reassembly=reassembly,
+        error=error,
+    )
@@ -0,0 +1,383 @@
+# -*- coding: utf-8 -*-
+"""capture catalog
+
+`pcapkit.foundation.catalog` contains class `Catalog`,
+which ingests PCAP files into a local SQLite database, i.e.
+frame offsets, timestamps, 5-tuples, protocol chains and
+TCP flow labels (as of `TraceFlow`), with indexes on common
+lookup columns. Query results map back to frames through
+the offset index, thus no full extraction is needed.
+
+"""
+import os
+import sqlite3
+
+###############################################################################
+# from pcapkit.foundation.extraction import Extractor
+# from pcapkit.foundation.traceflow import TraceFlow
+# from pcapkit.protocols.pcap.frame import Frame
+# from pcapkit.protocols.pcap.header import Header
+# from pcapkit.toolkit.default import frame_layers, tcp_traceflow
+###############################################################################
+
+__all__ = ['Catalog']
+
+# number of frames inserted at once
+BATCH_SIZE = 10000
+
+# length of PCAP global header & frame record header
+_GLOBAL_HEADER = 24
+_RECORD_HEADER = 16
+
+# database schema
+_SCHEMA = '''
+CREATE TABLE IF NOT EXISTS captures (
+    id INTEGER PRIMARY KEY,
+    path TEXT UNIQUE NOT NULL,
+    size INTEGER,
+    mtime REAL,
+    frames INTEGER
+);
+CREATE TABLE IF NOT EXISTS frames (
+    capture INTEGER NOT NULL REFERENCES captures (id) ON DELETE CASCADE,
+    number INTEGER NOT NULL,
+    offset INTEGER NOT NULL,
+    time REAL,
+    length INTEGER,
+    protocols TEXT,
+    ip_proto INTEGER,
+    src TEXT,
+    srcport INTEGER,
+    dst TEXT,
+    dstport INTEGER,
+    flow TEXT,
+    PRIMARY KEY (capture, number)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS frames_time ON frames (time);
+CREATE INDEX IF NOT EXISTS frames_src ON frames (src, srcport, time);
+CREATE INDEX IF NOT EXISTS frames_dst ON frames (dst, dstport, time);
+CREATE INDEX IF NOT EXISTS frames_flow ON frames (flow);
+'''
+
+# frame columns
+_COLUMNS = ('capture', 'number', 'offset', 'time', 'length', 'protocols',
+            'ip_proto', 'src', 'srcport', 'dst', 'dstport', 'flow')
+
+
+class Catalog:
+    """SQLite-indexed capture catalog.
+
+    Properties:
+        * database -- str, database file name
+        * captures -- tuple<Info>, ingested captures
+
+    Methods:
+        * ingest -- ingest PCAP files
+        * query -- query frame records
+        * read -- read frames of records
+        * locate -- locate first frame at or after timestamp
+        * close -- close database
+
+    Attributes:
+        * _dbnm -- str, database file name
+        * _conn -- sqlite3.Connection, database connection
+        * _bsize -- int, number of frames inserted at once
+
+    Utilities:
+        * _ingest -- ingest a PCAP file
+        * _make_row -- make frame record
+
+    """
+    ##########################################################################
+    # Properties.
+    ##########################################################################
+
+    @property
+    def database(self):
+        """Database file name."""
+        return self._dbnm
+
+    @property
+    def captures(self):
+        """Ingested captures."""
+        from pcapkit.corekit.infoclass import Info
+
+        cursor = self._conn.execute('SELECT id, path, size, mtime, frames FROM captures ORDER BY id')
+        return tuple(Info(dict(zip(('id', 'path', 'size', 'mtime', 'frames'), row))) for row in cursor)
+
+    ##########################################################################
+    # Methods.
+    ##########################################################################
+
+    def ingest(self, *files, layer=None, protocol=None):
+        """Ingest PCAP files.
+
+        Positional arguments:
+            * files -- str, PCAP file names
+
+        Keyword arguments:
+            * layer -- str, extract til which layer
+            * protocol -- str, extract til which protocol
+
+        Returns:
+            * int -- number of ingested frames
+
+        Captures already ingested are skipped, unless modified since.
+
+        """
+        count = 0
+        for file in files:
+            count += self._ingest(os.path.realpath(file), layer=layer, protocol=protocol)
+        return count
+
+    def query(self, *, host=None, port=None, src=None, srcport=None, dst=None, dstport=None,
+              start=None, end=None, flow=None, protocol=None, capture=None, limit=None):
+        """Query frame records.
+
+        Keyword arguments:
+            * host -- str, source or destination IP address
+            * port -- int, source or destination port
+            * src -- str, source IP address
+            * srcport -- int, source port
+            * dst -- str, destination IP address
+            * dstport -- int, destination port
+            * start -- float, start of time range (inclusive)
+            * end -- float, end of time range (exclusive)
+            * flow -- str, TCP flow label
+            * protocol -- str, protocol name in protocol chain
+            * capture -- str, PCAP file name
+            * limit -- int, max number of records
+
+        Returns:
+            * tuple<Info> -- frame records, in order of capture & frame number
+
+        """
+        from pcapkit.corekit.infoclass import Info
+
+        clauses, params = list(), list()
+        if host is not None and port is not None:
+            clauses.append('((src = ? AND srcport = ?) OR (dst = ? AND dstport = ?))')
+            params += [str(host), port, str(host), port]
+        elif host is not None:
+            clauses.append('(src = ? OR dst = ?)')
+            params += [str(host), str(host)]
+        elif port is not None:
+            clauses.append('(srcport = ? OR dstport = ?)')
+            params += [port, port]
+        for (column, value) in (('src', src), ('srcport', srcport), ('dst', dst), ('dstport', dstport),
+                                ('flow', flow)):
+            if value is not None:
+                clauses.append(f'{column} = ?')
+                params.append(str(value) if column in ('src', 'dst') else value)
+        if start is not None:
+            clauses.append('time >= ?')
+            params.append(start)
+        if end is not None:
+            clauses.append('time < ?')
+            params.append(end)
+        if protocol is not None:
+            clauses.append("(':' || protocols || ':') LIKE ?")
+            params.append(f'%:{protocol}:%')
+        if capture is not None:
+            clauses.append('capture = (SELECT id FROM captures WHERE path = ?)')
+            params.append(os.path.realpath(capture))
+
+        statement = (f"SELECT captures.path, {', '.join(_COLUMNS[1:])} FROM frames "
+                     'JOIN captures ON captures.id = frames.capture')
+        if clauses:
+            statement += f" WHERE {' AND '.join(clauses)}"
+        statement += ' ORDER BY capture, number'
+        if limit is not None:
+            statement += ' LIMIT ?'
+            params.append(limit)
+
+        cursor = self._conn.execute(statement, params)
+        return tuple(Info(dict(zip(('capture',) + _COLUMNS[1:], row))) for row in cursor)
+
+    def read(self, records):
+        """Read frames of records.
+
+        Positional arguments:
+            * records -- iterable<Info>, frame records from `query`
+
+        Returns:
+            * tuple<Frame> -- extracted frames
+
+        """
+        from pcapkit.protocols.pcap.frame import Frame
+        from pcapkit.protocols.pcap.header import Header
+
+        frames = list()
+        files = dict()
+        try:
+            for record in records:
+                if record.capture not in files:
+                    file = open(record.capture, 'rb')
+                    files[record.capture] = (file, Header(file))
+                file, header = files[record.capture]
+                file.seek(record.offset, os.SEEK_SET)
+                frames.append(Frame(file, num=record.number, proto=header.protocol,
+                                    nanosecond=header.nanosecond))
+        finally:
+            for (file, _) in files.values():
+                file.close()
+        return tuple(frames)
+
+    def locate(self, capture, timestamp):
+        """Locate first frame at or after timestamp.
+
+        Positional arguments:
+            * capture -- str, PCAP file name
+            * timestamp -- float, UNIX-Epoch timestamp
+
+        Returns:
+            * Info -- frame number & offset of frame record header
+                        (`None` if capture not ingested or modified since)
+
+        """
+        from pcapkit.corekit.infoclass import Info
+
+        path = os.path.realpath(capture)
+        row = self._conn.execute('SELECT id, size, mtime, frames FROM captures WHERE path = ?', (path,)).fetchone()
+        if row is None:
+            return None
+        stat = os.stat(path)
+        if row[1:3] != (stat.st_size, stat.st_mtime):
+            return None
+
+        location = self._conn.execute('SELECT number, offset FROM frames WHERE capture = ? AND time >= ? '
+                                      'ORDER BY time, number LIMIT 1', (row[0], timestamp)).fetchone()
+        if location is None:
+            return Info(number=row[3] + 1, offset=stat.st_size)
+        return Info(number=location[0], offset=location[1])
+
+    def close(self):
+        """Close database."""
+        self._conn.close()
+
+    ##########################################################################
+    # Data models.
+    ##########################################################################
+
+    # Not hashable
+    __hash__ = None
+
+    def __init__(self, database='catalog.db', *, batch_size=BATCH_SIZE):
+        """Initialise instance.
+
+        Positional arguments:
+            * database -- str, database file name
+
+        Keyword arguments:
+            * batch_size -- int, number of frames inserted at once
+
+        """
+        self._dbnm = database
+        self._bsize = max(batch_size, 1)
+        self._conn = sqlite3.connect(database)
+        self._conn.execute('PRAGMA foreign_keys = ON')
+        self._conn.executescript(_SCHEMA)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    ##########################################################################
+    # Utilities.
+    ##########################################################################
+
+    def _ingest(self, path, *, layer=None, protocol=None):
+        """Ingest a PCAP file.
+
+        Positional arguments:
+            * path -- str, real path of PCAP file
+
+        Keyword arguments:
+            * layer -- str, extract til which layer
+            * protocol -- str, extract til which protocol
+
+        Returns:
+            * int -- number of ingested frames
+
+        """
+        from pcapkit.foundation.extraction import Extractor
+        from pcapkit.foundation.traceflow import TraceFlow
+        from pcapkit.toolkit.default import tcp_traceflow
+
+        stat = os.stat(path)
+        row = self._conn.execute('SELECT id, size, mtime FROM captures WHERE path = ?', (path,)).fetchone()
+        if row is not None:
+            if row[1:] == (stat.st_size, stat.st_mtime):
+                return 0
+            with self._conn:
+                self._conn.execute('DELETE FROM captures WHERE id = ?', (row[0],))
+
+        extractor = Extractor(fin=path, extension=False, store=False, nofile=True, auto=False,
+                              layer=layer, protocol=protocol)
+        tracer = TraceFlow()
+        statement = f"INSERT INTO frames VALUES ({', '.join('?' * len(_COLUMNS))})"
+
+        with self._conn:
+            capture = self._conn.execute('INSERT INTO captures (path, size, mtime) VALUES (?, ?, ?)',
+                                         (path, stat.st_size, stat.st_mtime)).lastrowid
+
+            count = 0
+            offset = _GLOBAL_HEADER
+            batch = list()
+            for frame in extractor:
+                flag, data = tcp_traceflow(frame, data_link=extractor._dlink)
+                flow = tracer.trace(data, _check=False) if flag else None
+
+                batch.append(self._make_row(frame, capture=capture, offset=offset, flow=flow))
+                offset += _RECORD_HEADER + frame.info.frame_info.incl_len
+                count += 1
+
+                if len(batch) >= self._bsize:
+                    self._conn.executemany(statement, batch)
+                    batch.clear()
+            self._conn.executemany(statement, batch)
+
+            self._conn.execute('UPDATE captures SET frames = ? WHERE id = ?', (count, capture))
+        return count
+
+    @staticmethod
+    def _make_row(frame, *, capture, offset, flow):
+        """Make frame record.
+
+        Positional arguments:
+            * frame -- Frame, extracted frame
+
+        Keyword arguments:
+            * capture -- int, capture ID
+            * offset -- int, offset of frame record header in PCAP file
+            * flow -- str, TCP flow label
+
+        Returns:
+            * tuple -- frame record
+
+        """
+        from pcapkit.toolkit.default import frame_layers
+
+        # outermost IP & transport, as of reassembly and flow tracing
+        layers = frame_layers(frame)
+        ip = layers.get('IPv4', layers.get('IPv6'))
+        transport = layers.get('TCP', layers.get('UDP'))
+
+        info = frame.info
+        row = [capture, info.number, offset, info.time_epoch, info.frame_info.orig_len, str(frame.protochain)]
+
+        if ip is None:
+            row += [None, None, None, None, None]
+        else:
+            ip_info = ip.info
+            ip_proto = ip_info.proto if type(ip).__name__ == 'IPv4' else ip_info.protocol
+            if transport is None:
+                row += [int(ip_proto), str(ip_info.src), None, str(ip_info.dst), None]
+            else:
+                transport_info = transport.info
+                row += [int(ip_proto), str(ip_info.src), transport_info.srcport,
+                        str(ip_info.dst), transport_info.dstport]
+        row.append(flow)
+        return tuple(row)
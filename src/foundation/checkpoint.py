@@ -0,0 +1,62 @@
+# -*- coding: utf-8 -*-
+"""checkpoint of extraction state
+
+`pcapkit.foundation.checkpoint` saves and loads states of
+reassembly buffers and flow tracers, so that consecutive
+(e.g. rolling) capture files can be processed incrementally.
+States consist of built-in types only, which are stored as
+a versioned pickle and loaded without resolving any global
+objects.
+
+"""
+import pickle
+
+from pcapkit.utilities.exceptions import FileError, VersionError
+
+__all__ = ['dump', 'load']
+
+# checkpoint file magic number & format version
+MAGIC = b'PCAPKIT-CKPT'
+VERSION = 1
+
+
+class _Unpickler(pickle.Unpickler):
+    """Unpickler refusing any global objects."""
+
+    def find_class(self, module, name):
+        raise pickle.UnpicklingError(f'unexpected object {module}.{name}')
+
+
+def dump(state, file):
+    """Save checkpoint state.
+
+    Positional arguments:
+        * state -- dict, checkpoint state, which consists of built-in types only
+        * file -- str, checkpoint file name
+
+    """
+    with open(file, 'wb') as ckpt:
+        ckpt.write(MAGIC)
+        pickle.dump((VERSION, state), ckpt, protocol=4)
+
+
+def load(file):
+    """Load checkpoint state.
+
+    Positional arguments:
+        * file -- str, checkpoint file name
+
+    Returns:
+        * dict -- checkpoint state
+
+    """
+    with open(file, 'rb') as ckpt:
+        if ckpt.read(len(MAGIC)) != MAGIC:
+            raise FileError(5, 'Unknown file format', file)
+        try:
+            version, state = _Unpickler(ckpt).load()
+        except (pickle.UnpicklingError, EOFError, TypeError, ValueError):
+            raise FileError(5, 'Malformed checkpoint', file) from None
+    if version != VERSION:
+        raise VersionError(f'Unknown checkpoint version {version}')
+    return state
@@ -0,0 +1,234 @@
+# -*- coding: utf-8 -*-
+"""columnar export
+
+`pcapkit.foundation.columns` contains class `Columns`,
+which collects per-frame fields, i.e. timestamps, lengths,
+IP addresses (as integers), ports, protocol numbers and TCP
+flags, into a growable NumPy structured array, rather than
+nested `Info` trees. The array can be saved as `.npy` (one
+structured array) or `.npz` (one array per column).
+
+"""
+from pcapkit.utilities.exceptions import ModuleNotFound
+
+###############################################################################
+# import numpy
+# from pcapkit.toolkit.default import frame_layers
+###############################################################################
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+__all__ = ['Columns']
+
+# initial capacity of column arrays (in frames)
+CAPACITY = 4096
+
+# number of frames filled into column arrays at once
+BATCH_SIZE = 1024
+
+# columns, i.e. (name, dtype[, shape])
+COLUMNS = [
+    ('number', 'u4'),           # frame number
+    ('time', 'f8'),             # UNIX-Epoch timestamp
+    ('incl_len', 'u4'),         # number of octets of packet saved in file
+    ('orig_len', 'u4'),         # actual length of packet
+    ('ip_version', 'u1'),       # IP version (0 if not IP)
+    ('ip_proto', 'u1'),         # IP protocol number, i.e. protocol of IPv4 or last next header of IPv6
+    ('src', 'u4'),              # IPv4 source address
+    ('dst', 'u4'),              # IPv4 destination address
+    ('src6', 'u8', (2,)),       # IPv6 source address, i.e. (high, low) 64-bit words
+    ('dst6', 'u8', (2,)),       # IPv6 destination address, i.e. (high, low) 64-bit words
+    ('srcport', 'u2'),          # TCP/UDP source port
+    ('dstport', 'u2'),          # TCP/UDP destination port
+    ('tcp_flags', 'u2'),        # TCP flags, i.e. NS, CWR, ECE, URG, ACK, PSH, RST, SYN, FIN bits
+]
+
+# lower 64 bits of an IPv6 address
+_MASK = 0xFFFF_FFFF_FFFF_FFFF
+
+
+class Columns:
+    """Columnar export of frames.
+
+    Properties:
+        * array -- numpy.ndarray, structured array of filled frames
+        * length -- int, number of filled frames
+
+    Methods:
+        * append -- append a frame
+        * extend -- append frames
+        * flush -- fill pending frames into column arrays
+        * save -- save columns as `.npy` or `.npz` file
+
+    Attributes:
+        * _array -- numpy.ndarray, preallocated structured array
+        * _count -- int, number of filled frames
+        * _batch -- list<tuple>, pending rows
+        * _bsize -- int, number of rows filled at once
+
+    Utilities:
+        * _make_row -- make row out of frame
+        * _grow -- grow column arrays
+
+    """
+    ##########################################################################
+    # Properties.
+    ##########################################################################
+
+    @property
+    def array(self):
+        """Structured array of filled frames."""
+        self.flush()
+        return self._array[:self._count]
+
+    @property
+    def length(self):
+        """Number of filled frames."""
+        return self._count + len(self._batch)
+
+    ##########################################################################
+    # Methods.
+    ##########################################################################
+
+    def append(self, frame):
+        """Append a frame.
+
+        Positional arguments:
+            * frame -- Frame, extracted frame
+
+        """
+        self._batch.append(self._make_row(frame))
+        if len(self._batch) >= self._bsize:
+            self.flush()
+
+    def extend(self, frames):
+        """Append frames.
+
+        Positional arguments:
+            * frames -- iterable<Frame>, extracted frames
+
+        """
+        for frame in frames:
+            self.append(frame)
+        self.flush()
+
+    def flush(self):
+        """Fill pending frames into column arrays."""
+        if not self._batch:
+            return
+        start, stop = self._count, self._count + len(self._batch)
+        if stop > len(self._array):
+            self._grow(stop)
+        self._array[start:stop] = self._batch
+        self._count = stop
+        self._batch.clear()
+
+    def save(self, file):
+        """Save columns as `.npy` or `.npz` file.
+
+        Positional arguments:
+            * file -- str, file name, where `.npz` files hold one array per column,
+                        and others hold one structured array
+
+        """
+        array = self.array
+        if str(file).endswith('.npz'):
+            numpy.savez(file, **{name: array[name] for name in array.dtype.names})
+        else:
+            numpy.save(file, array)
+
+    ##########################################################################
+    # Data models.
+    ##########################################################################
+
+    def __init__(self, *, capacity=CAPACITY, batch_size=BATCH_SIZE):
+        """Initialise instance.
+
+        Keyword arguments:
+            * capacity -- int, initial capacity of column arrays (in frames)
+            * batch_size -- int, number of frames filled into column arrays at once
+
+        """
+        if numpy is None:
+            raise ModuleNotFound("No module named 'numpy'", name='numpy')
+        self._array = numpy.zeros(max(capacity, 1), dtype=COLUMNS)
+        self._count = 0
+        self._batch = list()
+        self._bsize = max(batch_size, 1)
+
+    def __len__(self):
+        return self.length
+
+    def __call__(self, frame):
+        """Append a frame.
+
+        Positional arguments:
+            * frame -- Frame, extracted frame
+
+        """
+        self.append(frame)
+
+    ##########################################################################
+    # Utilities.
+    ##########################################################################
+
+    def _grow(self, size):
+        """Grow column arrays.
+
+        Positional arguments:
+            * size -- int, minimum capacity (in frames)
+
+        """
+        capacity = len(self._array)
+        while capacity < size:
+            capacity *= 2
+        array = numpy.zeros(capacity, dtype=COLUMNS)
+        array[:self._count] = self._array[:self._count]
+        self._array = array
+
+    @staticmethod
+    def _make_row(frame):
+        """Make row out of frame.
+
+        Positional arguments:
+            * frame -- Frame, extracted frame
+
+        Returns:
+            * tuple -- row of columns
+
+        """
+        from pcapkit.toolkit.default import frame_layers
+
+        # outermost IP & transport, as of reassembly and flow tracing
+        layers = frame_layers(frame)
+        ip = layers.get('IPv4', layers.get('IPv6'))
+        transport = layers.get('TCP', layers.get('UDP'))
+
+        info = frame.info
+        frame_info = info.frame_info
+        row = [info.number, info.time_epoch, frame_info.incl_len, frame_info.orig_len]
+
+        if ip is None:
+            row += [0, 0, 0, 0, (0, 0), (0, 0)]
+        elif type(ip).__name__ == 'IPv4':
+            ip_info = ip.info
+            row += [4, ip_info.proto, int(ip_info.src), int(ip_info.dst), (0, 0), (0, 0)]
+        else:
+            ip_info = ip.info
+            src, dst = int(ip_info.src), int(ip_info.dst)
+            row += [6, ip_info.protocol, 0, 0, (src >> 64, src & _MASK), (dst >> 64, dst & _MASK)]
+
+        if transport is None:
+            row += [0, 0, 0]
+        else:
+            transport_info = transport.info
+            if type(transport).__name__ == 'TCP':
+                header = transport_info.packet.header
+                flags = ((header[12] & 0x01) << 8) | header[13]
+            else:
+                flags = 0
+            row += [transport_info.srcport, transport_info.dstport, flags]
+        return tuple(row)
@@ -21,18 +21,18 @@ import sys
 import textwrap
 import time
 import traceback
-import warnings
 
 from pcapkit.corekit.infoclass import Info
+from pcapkit.foundation.timeslice import make_time, peek_time, seek_time
 from pcapkit.protocols.pcap.frame import Frame
 from pcapkit.protocols.pcap.header import Header
 from pcapkit.protocols.transport.transport import TP_PROTO
 from pcapkit.utilities.exceptions import (CallableError, FileNotFound,
                                           FormatError, IterableError,
-                                          UnsupportedCall, stacklevel)
+                                          UnsupportedCall)
 from pcapkit.utilities.warnings import (AttributeWarning, DPKTWarning,
                                         EngineWarning, FormatWarning,
-                                        LayerWarning, ProtocolWarning)
+                                        LayerWarning, ProtocolWarning, warn)
 
 ###############################################################################
 # import enum
@@ -45,8 +45,7 @@ from pcapkit.utilities.warnings import (AttributeWarning, DPKTWarning,
 # from pcapkit.reassembly.ipv4 import IPv4_Reassembly
 # from pcapkit.reassembly.ipv6 import IPv6_Reassembly
 # from pcapkit.reassembly.tcp import TCP_Reassembly
-# from pcapkit.toolkit.default import (ipv4_reassembly, ipv6_reassembly,
-#                                      tcp_reassembly, tcp_traceflow)
+# from pcapkit.toolkit.default import frame_records
 # from pcapkit.toolkit.dpkt import (ipv4_reassembly, ipv6_reassembly,
 #                                   packet2chain, packet2dict, tcp_reassembly,
 #                                   tcp_traceflow)
@@ -110,6 +109,8 @@ class Extractor:
             |--> tcp -- tuple<TCP_Reassembly>, TCP payload fragment reassembly
             |--> ipv4 -- tuple<IPv4_Reassembly>, IPv4 frame fragment reassembly
             |--> ipv6 -- tuple<IPv6_Reassembly>, IPv6 frame fragment reassembly
+        * output_stats -- Info, metrics of background output queue
+        * flows -- tuple<Info>, statistics of traced flows
 
     Methods:
         * make_name -- formatting input & output file name
@@ -126,6 +127,7 @@ class Extractor:
 
         * _ifile -- FileIO, input file object
         * _ofile -- object, temperory output writer
+        * _oqueue -- QueueIO, background output writer
 
         * _frnum -- int, frame number
         * _frame -- list, each item contains `Info` of a record/package
@@ -152,8 +154,16 @@ class Extractor:
         * _ipv6 -- bool, flag if perform IPv6 reassembly
         * _tcp -- bool, flag if perform TCP payload reassembly
 
+        * _stime -- float, start of time range
+        * _etime -- float, end of time range
+        * _index -- str or Catalog, capture catalog to locate start of time range
+
     Utilities:
         * _read_frame -- read frames
+        * _dump_output -- dump frame to output file(s)
+        * _write_output -- write frame to output file(s)
+        * _load_checkpoint -- restore reassembly & trace state from checkpoint
+        * _dump_checkpoint -- save reassembly & trace state to checkpoint
         * _tcp_reassembly -- store data for TCP reassembly
         * _ipv4_reassembly -- store data for IPv4 reassembly
         * _ipv6_reassembly -- store data for IPv6 reassembly
@@ -222,10 +232,24 @@ class Extractor:
             return self._trace.index
         raise UnsupportedCall("'Extractor(trace=False)' object has no attribute 'trace'")
 
+    @property
+    def flows(self):
+        if self._flag_t and self._trace._stats:
+            return self._trace.flows
+        raise UnsupportedCall("'Extractor(trace_stats=False)' object has no attribute 'flows'")
+
     @property
     def engine(self):
         return self._exeng
 
+    @property
+    def output_stats(self):
+        if not self._flag_o:
+            raise UnsupportedCall("'Extractor(threaded=False)' object has no attribute 'output_stats'")
+        if self._oqueue is None:
+            return None
+        return self._oqueue.stats
+
     ##########################################################################
     # Methods.
     ##########################################################################
@@ -250,19 +274,19 @@ class Extractor:
             self._flag_m = flag = bool(flag and (self._flag_a and CPU_CNT > 1))
             if self._flag_m:
                 return self._run_pipeline(engine)
-            warnings.warn(f'extraction engine Pipeline Multiprocessing is not available; '
-                          'using default engine instead', EngineWarning, stacklevel=stacklevel())
+            warn(f'extraction engine Pipeline Multiprocessing is not available; '
+                 'using default engine instead', EngineWarning)
         elif self._exeng == 'server':
             flag, engine = self.import_test('multiprocessing', name='Server Multiprocessing')
             self._flag_m = flag = bool(flag and (self._flag_a and CPU_CNT > 2))
             if self._flag_m:
                 return self._run_server(engine)
-            warnings.warn(f'extraction engine Server Multiprocessing is not available; '
-                          'using default engine instead', EngineWarning, stacklevel=stacklevel())
+            warn(f'extraction engine Server Multiprocessing is not available; '
+                 'using default engine instead', EngineWarning)
         elif self._exeng not in ('default', 'pcapkit'):
             flag = False
-            warnings.warn(f'unsupported extraction engine: {self._exeng}; '
-                          'using default engine instead', EngineWarning, stacklevel=stacklevel())
+            warn(f'unsupported extraction engine: {self._exeng}; '
+                 'using default engine instead', EngineWarning)
 
         # using default/pcapkit engine
         self._exeng = self._exeng if flag else 'default'
@@ -273,14 +297,14 @@ class Extractor:
         layer = self._exlyr
         if layer is not None:
             if layer not in LAYER_LIST:
-                warnings.warn(f'unrecognised layer: {layer}', LayerWarning, stacklevel=stacklevel())
+                warn(f'unrecognised layer: {layer}', LayerWarning)
 
         protocol = self._exptl
         if protocol is not None:
             def check_protocol(*args):
                 for arg in args:
                     if arg.lower() not in PROTO_LIST:
-                        warnings.warn(f'unrecognised protocol: {protocol}', ProtocolWarning, stacklevel=stacklevel())
+                        warn(f'unrecognised protocol: {protocol}', ProtocolWarning)
             if isinstance(protocol, tuple):
                 check_protocol(*protocol)
             else:
@@ -292,8 +316,8 @@ class Extractor:
             engine = importlib.import_module(engine)
             return True, engine
         except ImportError:
-            warnings.warn(f"extraction engine '{name or engine}' not available; "
-                          'using default engine instead', EngineWarning, stacklevel=stacklevel())
+            warn(f"extraction engine '{name or engine}' not available; "
+                 'using default engine instead', EngineWarning)
         return False, None
 
     @classmethod
@@ -330,9 +354,12 @@ class Extractor:
                     mkdir(ofnm)
                 else:
                     ofnm = f'out.{ext}'
+            elif fout == '-' and fmt == 'jsonl':    # stream to stdout
+                files = False
+                ofnm = fout
             else:
                 fext = os.path.splitext(fout)[1]
-                mkdir(os.path.split(fout)[1])
+                mkdir(os.path.split(fout)[0])
                 if fext:
                     files = False
                     ofnm = fout
@@ -365,6 +392,9 @@ class Extractor:
         self._dlink = self._gbhdr.protocol
         self._nnsec = self._gbhdr.nanosecond
 
+        if self._stime is not None:
+            self._frnum = seek_time(self._ifile, self._stime, header=self._gbhdr, index=self._index) or 0
+
         if self._trace is not NotImplemented:
             self._trace._endian = self._gbhdr.byteorder
             self._trace._nnsecd = self._gbhdr.nanosecond
@@ -374,6 +404,8 @@ class Extractor:
                 ofile = self._ofile(f'{self._ofnm}/Global Header.{self._fext}')
                 ofile(self._gbhdr.info, name='Global Header')
                 self._type = ofile.kind
+                if hasattr(ofile, 'close'):
+                    ofile.close()
             else:
                 self._ofile(self._gbhdr.info, name='Global Header')
                 self._type = self._ofile.kind
@@ -399,17 +431,24 @@ class Extractor:
                  fin=None, fout=None, format=None,                          # basic settings
                  auto=True, extension=True, store=True,                     # internal settings
                  files=False, nofile=False, verbose=False,                  # output settings
+                 threaded=False,                                            # output settings
                  engine=None, layer=None, protocol=None,                    # extraction settings
                  ip=False, ipv4=False, ipv6=False, tcp=False, strict=True,  # reassembly settings
+                 analysis=True, lazy=False, analysers=None,                 # reassembly settings
                  trace=False, trace_fout=None, trace_format=None,           # trace settings
-                 trace_byteorder=sys.byteorder, trace_nanosecond=False):    # trace settings
+                 trace_byteorder=sys.byteorder, trace_nanosecond=False,     # trace settings
+                 trace_max_files=None, trace_buffering=None,                # trace settings
+                 trace_stats=False, trace_active_timeout=None,              # trace settings
+                 trace_idle_timeout=None, trace_export=None,                # trace settings
+                 start_time=None, end_time=None, index=None,                # slicing settings
+                 resume=None, checkpoint=None):                             # checkpoint settings
         """Initialise PCAP Reader.
 
         Keyword arguments:
             * fin  -- str, file name to be read; if file not exist, raise an error
-            * fout -- str, file name to be written
+            * fout -- str, file name to be written ('-' for stdout with 'jsonl' format)
             * format  -- str, file format of output
-                            <keyword> 'plist' / 'json' / 'tree' / 'html'
+                            <keyword> 'plist' / 'json' / 'jsonl' / 'tree' / 'html'
 
             * auto -- bool, if automatically run till EOF (default is True)
                             <keyword> True / False
@@ -424,6 +463,8 @@ class Extractor:
                             <keyword> True / False
             * verbose -- bool, if print verbose output information (default is False)
                             <keyword> True / False
+            * threaded -- bool, if serialise output in a background thread (default is False)
+                            <keyword> True / False
 
             * engine -- str, extraction engine to be used
                             <keyword> 'default | pcapkit'
@@ -442,6 +483,12 @@ class Extractor:
                             <keyword> True / False
             * strict -- bool, if set strict flag for reassembly (default is True)
                             <keyword> True / False
+            * analysis -- bool, if analyse application layer of reassembled TCP payloads (default is True)
+                            <keyword> True / False
+            * lazy -- bool, if postpone analysis of reassembled TCP payloads till accessed (default is False)
+                            <keyword> True / False
+            * analysers -- iterable<str>, application layer analysers to be tried (default is None, i.e. all)
+                            <keyword> registered analyser name
 
             * trace -- bool, if trace TCP traffic flows (default is False)
                             <keyword> True / False
@@ -452,7 +499,31 @@ class Extractor:
                             <keyword> 'little' / 'big'
             * trace_nanosecond -- bool, output nanosecond-resolution file flag
                             <keyword> True / False
-
+            * trace_max_files -- int, max number of flow outputs with open file handles
+                            (default is None, i.e. `pcapkit.foundation.traceflow.FILE_LIMIT`)
+            * trace_buffering -- int, size of write buffer of flow outputs
+                            (default is None, i.e. `pcapkit.foundation.traceflow.BUFFER_SIZE`)
+            * trace_stats -- bool, if keep NetFlow-style statistics of flows (default is False)
+                            <keyword> True / False
+            * trace_active_timeout -- float, time (in seconds) after which a flow is expired
+                            since its first packet
+                            (default is None, i.e. `pcapkit.foundation.traceflow.ACTIVE_TIMEOUT`)
+            * trace_idle_timeout -- float, time (in seconds) after which a flow is expired
+                            since its last packet
+                            (default is None, i.e. `pcapkit.foundation.traceflow.IDLE_TIMEOUT`)
+            * trace_export -- function, called with `FlowRecord` of each flow as it expires
+                            (default is None, i.e. kept in `flows`)
+
+            * start_time -- float / datetime.datetime / str, extract frames at or after
+                            which timestamp (default is None, i.e. from first frame)
+            * end_time -- float / datetime.datetime / str, extract frames before
+                            which timestamp (default is None, i.e. til EOF)
+            * index -- str or Catalog, capture catalog to locate `start_time`
+                            (default is None, i.e. binary search over record timestamps)
+
+            * resume -- str, checkpoint file to restore reassembly & trace state from
+            * checkpoint -- str, checkpoint file to save reassembly & trace state to
+                            when extraction finished
 
         """
         ifnm, ofnm, fmt, ext, files = \
@@ -470,6 +541,7 @@ class Extractor:
         self._flag_m = False            # multiprocessing flag
         self._flag_q = nofile           # no output flag
         self._flag_t = trace            # trace flag
+        self._flag_o = threaded         # threaded output flag
         self._flag_v = verbose          # verbose output flag
 
         self._frnum = 0                 # frame number
@@ -478,6 +550,12 @@ class Extractor:
 
         self._reasm = [None] * 3        # frame record for reassembly (IPv4 / IPv6 / TCP)
         self._trace = NotImplemented    # flow tracer
+        self._oqueue = None             # background output writer
+        self._ckpnt = checkpoint        # checkpoint file name
+
+        self._stime = make_time(start_time)     # start of time range
+        self._etime = make_time(end_time)       # end of time range
+        self._index = index                     # capture catalog
 
         self._ipv4 = ipv4 or ip         # IPv4 Reassembly
         self._ipv6 = ipv6 or ip         # IPv6 Reassembly
@@ -487,6 +565,11 @@ class Extractor:
         self._exlyr = (layer or 'none').capitalize()        # extract til layer
         self._exeng = (engine or 'default').lower()         # extract using engine
 
+        if (self._stime is not None or self._etime is not None) and self._exeng not in ('default', 'pcapkit'):
+            warn(f"'Extractor(engine={self._exeng})' does not support time range slicing; "
+                 'using default engine instead', EngineWarning)
+            self._exeng = 'default'
+
         if self._ipv4:
             from pcapkit.reassembly.ipv4 import IPv4_Reassembly
             self._reasm[0] = IPv4_Reassembly(strict=strict)
@@ -495,16 +578,26 @@ class Extractor:
             self._reasm[1] = IPv6_Reassembly(strict=strict)
         if self._tcp:
             from pcapkit.reassembly.tcp import TCP_Reassembly
-            self._reasm[2] = TCP_Reassembly(strict=strict)
+            self._reasm[2] = TCP_Reassembly(strict=strict, analysis=analysis,
+                                            lazy=lazy, analysers=analysers)
 
         if trace:
-            from pcapkit.foundation.traceflow import TraceFlow
+            from pcapkit.foundation.traceflow import (ACTIVE_TIMEOUT, BUFFER_SIZE, FILE_LIMIT,
+                                                      IDLE_TIMEOUT, TraceFlow)
             if self._exeng in ('pyshark',) and re.fullmatch('pcap', str(trace_format), re.IGNORECASE):
-                warnings.warn(f"'Extractor(engine={self._exeng})' does not support 'trace_format={trace_format}'; "
-                              "using 'trace_format=None' instead", FormatWarning, stacklevel=stacklevel())
+                warn(f"'Extractor(engine={self._exeng})' does not support 'trace_format={trace_format}'; "
+                     "using 'trace_format=None' instead", FormatWarning)
                 trace_format = None
             self._trace = TraceFlow(fout=trace_fout, format=trace_format,
-                                    byteorder=trace_byteorder, nanosecond=trace_nanosecond)
+                                    byteorder=trace_byteorder, nanosecond=trace_nanosecond,
+                                    max_files=trace_max_files or FILE_LIMIT,
+                                    buffering=trace_buffering or BUFFER_SIZE,
+                                    stats=trace_stats, export=trace_export,
+                                    active_timeout=trace_active_timeout or ACTIVE_TIMEOUT,
+                                    idle_timeout=trace_idle_timeout or IDLE_TIMEOUT)
+
+        if resume is not None:
+            self._load_checkpoint(resume)
 
         self._ifile = open(ifnm, 'rb')                                      # input file
         if not self._flag_q:
@@ -512,6 +605,8 @@ class Extractor:
                 from dictdumper import PLIST as output                      # output PLIST file
             elif fmt == 'json':
                 from dictdumper import JSON as output                       # output JSON file
+            elif fmt == 'jsonl':
+                from pcapkit.dumpkit import JSONLines as output             # output JSON-Lines file
             elif fmt == 'tree':
                 from dictdumper import Tree as output                       # output treeview text file
             elif fmt == 'html':
@@ -520,8 +615,8 @@ class Extractor:
                 from dictdumper import XML as output                        # output XML file
             else:
                 from pcapkit.dumpkit import NotImplementedIO as output      # no output file
-                warnings.warn(f'unsupported output format: {fmt}; disabled file output feature',
-                              FormatWarning, stacklevel=stacklevel())
+                warn(f'unsupported output format: {fmt}; disabled file output feature',
+                     FormatWarning)
 
             class DictDumper(output):
                 @classmethod
@@ -578,6 +673,53 @@ class Extractor:
         self._extmp = None
         self._flag_e = True
         self._ifile.close()
+        if self._oqueue is not None:
+            self._oqueue.close()
+        if not (self._flag_q or self._flag_f) and hasattr(self._ofile, 'close'):
+            self._ofile.close()
+        if self._flag_t:
+            self._trace.close()
+            if self._ckpnt is None:
+                self._trace.expire()
+        self._dump_checkpoint()
+
+    def _dump_output(self, info, *, name):
+        """Dump frame to output file(s).
+
+        Positional arguments:
+            * info -- Info, frame data
+
+        Keyword arguments:
+            * name -- str, frame name
+
+        Frames are handed to the background output writer if
+        `threaded` flag is set, which is started on first frame.
+
+        """
+        if not self._flag_o:
+            return self._write_output(info, name=name)
+        if self._oqueue is None:
+            from pcapkit.dumpkit import QueueIO
+            self._oqueue = QueueIO(self._write_output)
+        return self._oqueue(info, name=name)
+
+    def _write_output(self, info, *, name):
+        """Write frame to output file(s).
+
+        Positional arguments:
+            * info -- Info, frame data
+
+        Keyword arguments:
+            * name -- str, frame name
+
+        """
+        if self._flag_f:
+            ofile = self._ofile(f'{self._ofnm}/{name}.{self._fext}')
+            ofile(info, name=name)
+            if hasattr(ofile, 'close'):
+                ofile.close()
+        else:
+            self._ofile(info, name=name)
 
     def _aftermathmp(self):
         """Aftermath for multiprocessing."""
@@ -608,6 +750,32 @@ class Extractor:
         self._aftermathmp()
         self._ifile.close()
         self._flag_e = True
+        if self._flag_t and self._ckpnt is None:
+            self._trace.expire()
+        self._dump_checkpoint()
+
+    def _load_checkpoint(self, fin):
+        """Restore reassembly & trace state from checkpoint."""
+        from pcapkit.foundation.checkpoint import load
+        state = load(fin)
+
+        for (reasm, name) in zip(self._reasm, ('ipv4', 'ipv6', 'tcp')):
+            if reasm is not None and state.get(name) is not None:
+                reasm.restore(state[name])
+        if self._flag_t and state.get('trace') is not None:
+            self._trace.restore(state['trace'])
+
+    def _dump_checkpoint(self):
+        """Save reassembly & trace state to checkpoint."""
+        if self._ckpnt is None:
+            return
+        from pcapkit.foundation.checkpoint import dump
+        dump(dict(
+            ipv4=self._reasm[0].checkpoint(frames=self._frnum) if self._ipv4 else None,
+            ipv6=self._reasm[1].checkpoint(frames=self._frnum) if self._ipv6 else None,
+            tcp=self._reasm[2].checkpoint(frames=self._frnum) if self._tcp else None,
+            trace=self._trace.checkpoint(frames=self._frnum) if self._flag_t else None,
+        ), self._ckpnt)
 
     def _read_frame(self):
         """Headquarters for frame reader."""
@@ -629,11 +797,14 @@ class Extractor:
         - Write plist & append Info.
 
         """
-        from pcapkit.toolkit.default import (ipv4_reassembly, ipv6_reassembly,
-                                             tcp_reassembly, tcp_traceflow)
+        from pcapkit.toolkit.default import frame_records
 
         # read frame header
         if not self._flag_m:
+            if self._etime is not None:
+                timestamp = peek_time(self._ifile, header=self._gbhdr)
+                if timestamp is None or timestamp >= self._etime:
+                    raise EOFError
             frame = Frame(self._ifile, num=self._frnum+1, proto=self._dlink,
                           layer=self._exlyr, protocol=self._exptl, nanosecond=self._nnsec)
             self._frnum += 1
@@ -645,31 +816,17 @@ class Extractor:
         # write plist
         frnum = f'Frame {self._frnum}'
         if not self._flag_q:
-            if self._flag_f:
-                ofile = self._ofile(f'{self._ofnm}/{frnum}.{self._fext}')
-                ofile(frame.info, name=frnum)
-            else:
-                self._ofile(frame.info, name=frnum)
-
-        # record fragments
-        if self._ipv4:
-            flag, data = ipv4_reassembly(frame)
-            if flag:
-                self._reasm[0](data)
-        if self._ipv6:
-            flag, data = ipv6_reassembly(frame)
-            if flag:
-                self._reasm[1](data)
-        if self._tcp:
-            flag, data = tcp_reassembly(frame)
-            if flag:
-                self._reasm[2](data)
-
-        # trace flows
-        if self._flag_t:
-            flag, data = tcp_traceflow(frame, data_link=self._dlink)
-            if flag:
-                self._trace(data)
+            self._dump_output(frame.info, name=frnum)
+
+        # record fragments & trace flows
+        if self._ipv4 or self._ipv6 or self._tcp or self._flag_t:
+            records = frame_records(frame, ipv4=self._ipv4, ipv6=self._ipv6, tcp=self._tcp,
+                                    trace=self._flag_t, data_link=self._dlink)
+            for (reasm, data) in zip(self._reasm, records):
+                if data is not None:
+                    reasm._trusted_call(data)
+            if records[3] is not None:
+                self._trace(records[3])
 
         # record frames
         if self._exeng == 'pipeline':
@@ -697,13 +854,13 @@ class Extractor:
         """Call scapy.all.sniff to extract PCAP files."""
         # if not self._flag_a:
         #     self._flag_a = True
-        #     warnings.warn(f"'Extractor(engine=scapy)' object is not iterable; "
-        #                     "so 'auto=False' will be ignored", AttributeWarning, stacklevel=stacklevel())
+        #     warn(f"'Extractor(engine=scapy)' object is not iterable; "
+        #            "so 'auto=False' will be ignored", AttributeWarning)
 
         if self._exlyr != 'None' or self._exptl != 'null':
-            warnings.warn("'Extractor(engine=scapy)' does not support protocol and layer threshold; "
-                          f"'layer={self._exlyr}' and 'protocol={self._exptl}' ignored",
-                          AttributeWarning, stacklevel=stacklevel())
+            warn("'Extractor(engine=scapy)' does not support protocol and layer threshold; "
+                 f"'layer={self._exlyr}' and 'protocol={self._exptl}' ignored",
+                 AttributeWarning)
 
         # extract & analyse file
         self._expkg = scapy_all
@@ -731,11 +888,7 @@ class Extractor:
         frnum = f'Frame {self._frnum}'
         if not self._flag_q:
             info = packet2dict(packet)
-            if self._flag_f:
-                ofile = self._ofile(f'{self._ofnm}/{frnum}.{self._fext}')
-                ofile(info, name=frnum)
-            else:
-                self._ofile(info, name=frnum)
+            self._dump_output(info, name=frnum)
 
         # record frames
         if self._flag_d:
@@ -769,13 +922,13 @@ class Extractor:
         """Call dpkt.pcap.Reader to extract PCAP files."""
         # if not self._flag_a:
         #     self._flag_a = True
-        #     warnings.warn(f"'Extractor(engine=dpkt)' object is not iterable; "
-        #                     "so 'auto=False' will be ignored", AttributeWarning, stacklevel=stacklevel())
+        #     warn(f"'Extractor(engine=dpkt)' object is not iterable; "
+        #            "so 'auto=False' will be ignored", AttributeWarning)
 
         if self._exlyr != 'None' or self._exptl != 'null':
-            warnings.warn("'Extractor(engine=dpkt)' does not support protocol and layer threshold; "
-                          f"'layer={self._exlyr}' and 'protocol={self._exptl}' ignored",
-                          AttributeWarning, stacklevel=stacklevel())
+            warn("'Extractor(engine=dpkt)' does not support protocol and layer threshold; "
+                 f"'layer={self._exlyr}' and 'protocol={self._exptl}' ignored",
+                 AttributeWarning)
 
         # extract global header
         self.record_header()
@@ -805,8 +958,8 @@ class Extractor:
         elif self._dlink.value == 229:
             packet = self._expkg.ip6.IP6(packet)
         else:
-            warnings.warn('unrecognised link layer protocol; all analysis functions ignored',
-                          DPKTWarning, stacklevel=stacklevel())
+            warn('unrecognised link layer protocol; all analysis functions ignored',
+                 DPKTWarning)
             self._frnum += 1
             if self._flag_d:
                 self._frame.append(packet)
@@ -822,11 +975,7 @@ class Extractor:
         frnum = f'Frame {self._frnum}'
         if not self._flag_q:
             info = packet2dict(packet, timestamp, data_link=self._dlink)
-            if self._flag_f:
-                ofile = self._ofile(f'{self._ofnm}/{frnum}.{self._fext}')
-                ofile(info, name=frnum)
-            else:
-                self._ofile(info, name=frnum)
+            self._dump_output(info, name=frnum)
 
         # record frames
         if self._flag_d:
@@ -860,20 +1009,20 @@ class Extractor:
         """Call pyshark.FileCapture to extract PCAP files."""
         # if not self._flag_a:
         #     self._flag_a = True
-        #     warnings.warn(f"'Extractor(engine=pyshark)' object is not iterable; "
-        #                     "so 'auto=False' will be ignored", AttributeWarning, stacklevel=stacklevel())
+        #     warn(f"'Extractor(engine=pyshark)' object is not iterable; "
+        #            "so 'auto=False' will be ignored", AttributeWarning)
 
         if self._exlyr != 'None' or self._exptl != 'null':
-            warnings.warn("'Extractor(engine=pyshark)' does not support protocol and layer threshold; "
-                          f"'layer={self._exlyr}' and 'protocol={self._exptl}' ignored",
-                          AttributeWarning, stacklevel=stacklevel())
+            warn("'Extractor(engine=pyshark)' does not support protocol and layer threshold; "
+                 f"'layer={self._exlyr}' and 'protocol={self._exptl}' ignored",
+                 AttributeWarning)
 
         if (self._ipv4 or self._ipv6 or self._tcp):
             self._ipv4 = self._ipv6 = self._tcp = False
             self._reasm = [None] * 3
-            warnings.warn("'Extractor(engine=pyshark)' object dose not support reassembly; "
-                          f"so 'ipv4={self._ipv4}', 'ipv6={self._ipv6}' and 'tcp={self._tcp}' will be ignored",
-                          AttributeWarning, stacklevel=stacklevel())
+            warn("'Extractor(engine=pyshark)' object dose not support reassembly; "
+                 f"so 'ipv4={self._ipv4}', 'ipv6={self._ipv6}' and 'tcp={self._tcp}' will be ignored",
+                 AttributeWarning)
 
         # extract & analyse file
         self._expkg = pyshark
@@ -903,11 +1052,7 @@ class Extractor:
         frnum = f'Frame {self._frnum}'
         if not self._flag_q:
             info = packet2dict(packet)
-            if self._flag_f:
-                ofile = self._ofile(f'{self._ofnm}/{frnum}.{self._fext}')
-                ofile(info, name=frnum)
-            else:
-                self._ofile(info, name=frnum)
+            self._dump_output(info, name=frnum)
 
         # record frames
         if self._flag_d:
@@ -929,8 +1074,8 @@ class Extractor:
 
         if not self._flag_q:
             self._flag_q = True
-            warnings.warn("'Extractor(engine=pipeline)' does not support output; "
-                          f"'fout={self._ofnm}' ignored", AttributeWarning, stacklevel=stacklevel())
+            warn("'Extractor(engine=pipeline)' does not support output; "
+                 f"'fout={self._ofnm}' ignored", AttributeWarning)
 
         self._frnum = 1                                                 # frame number (revised)
         self._expkg = multiprocessing                                   # multiprocessing module
@@ -1028,8 +1173,8 @@ class Extractor:
 
         if not self._flag_q:
             self._flag_q = True
-            warnings.warn("'Extractor(engine=pipeline)' does not support output; "
-                          f"'fout={self._ofnm}' ignored", AttributeWarning, stacklevel=stacklevel())
+            warn("'Extractor(engine=pipeline)' does not support output; "
+                 f"'fout={self._ofnm}' ignored", AttributeWarning)
 
         self._frnum = 1                                                 # frame number (revised)
         self._expkg = multiprocessing                                   # multiprocessing module
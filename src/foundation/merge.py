@@ -0,0 +1,138 @@
+# -*- coding: utf-8 -*-
+"""merge PCAP files
+
+`pcapkit.foundation.merge` contains function `merge`,
+which merges frame records of PCAP files, e.g. captured from
+several taps, into one time-ordered PCAP file. Records are
+read in blocks (as of `RecordReader`) and merged through a
+heap over the inputs, without dissecting packets, thus memory
+is bounded by the number of inputs rather than their size.
+
+"""
+import collections
+import heapq
+import itertools
+
+from pcapkit.corekit.infoclass import Info
+from pcapkit.utilities.exceptions import FileError
+
+###############################################################################
+# from pcapkit.dumpkit import PCAP
+# from pcapkit.foundation.records import RecordReader
+###############################################################################
+
+__all__ = ['merge']
+
+# number of frame records written at once
+BATCH_SIZE = 1024
+
+
+def merge(files, fout, *, dedup=None, byteorder=None, nanosecond=None, buffering=None):
+    """Merge PCAP files by timestamp.
+
+    Positional arguments:
+        * files -- iterable<str>, PCAP file names
+        * fout -- str, output file name
+
+    Keyword arguments:
+        * dedup -- float, time window (in seconds) for suppression of exact
+                        duplicate packets (default is None, i.e. no suppression)
+        * byteorder -- str, output file byte order (default is None, i.e. as first input)
+        * nanosecond -- bool, nanosecond-resolution output file flag
+                        (default is None, i.e. if any input is of nanosecond resolution)
+        * buffering -- int, size of read blocks of each input
+                        (default is None, i.e. `pcapkit.foundation.records.BLOCK_SIZE`)
+
+    Returns:
+        * Info -- merge report
+            |--> fout -- str, output file name
+            |--> frames -- int, number of merged frames
+            |--> duplicates -- int, number of suppressed duplicate frames
+
+    Frames of the same timestamp are merged in order of inputs. All
+    inputs must be of the same data link type. Snapshot length of
+    output file is the largest of inputs.
+
+    """
+    from pcapkit.dumpkit import PCAP
+    from pcapkit.foundation.records import BLOCK_SIZE, RecordReader
+
+    readers = list()
+    try:
+        for fin in files:
+            readers.append(RecordReader(fin, buffering=buffering or BLOCK_SIZE))
+        if not readers:
+            raise FileError(5, 'No input file', fout)
+
+        protocol = readers[0].protocol
+        for reader in readers:
+            if reader.protocol != protocol:
+                raise FileError(5, f'Mismatched data link type: {reader.protocol} (expected {protocol})',
+                                reader.name)
+        if byteorder is None:
+            byteorder = readers[0].byteorder
+        if nanosecond is None:
+            nanosecond = any(reader.nanosecond for reader in readers)
+        snaplen = max(reader.snaplen for reader in readers)
+
+        with PCAP(fout, protocol=protocol, byteorder=byteorder, nanosecond=nanosecond,
+                  snaplen=snaplen) as output:
+            frames, duplicates = _merge(readers, output, dedup=dedup, byteorder=output._byte,
+                                        nanosecond=nanosecond)
+    finally:
+        for reader in readers:
+            reader.close()
+
+    return Info(
+        fout=fout,
+        frames=frames,
+        duplicates=duplicates,
+    )
+
+
+def _merge(readers, output, *, dedup, byteorder, nanosecond):
+    """Merge frame records into output file.
+
+    Positional arguments:
+        * readers -- list<RecordReader>, readers of input files
+        * output -- PCAP, output file
+
+    Keyword arguments:
+        * dedup -- float, time window (in seconds) for suppression of duplicates
+        * byteorder -- str, output file byte order
+        * nanosecond -- bool, nanosecond-resolution output file flag
+
+    Returns:
+        * tuple<int, int> -- number of merged frames & suppressed duplicates
+
+    """
+    streams = [zip(reader, itertools.repeat(reader)) for reader in readers]
+    window = None if dedup is None else int(dedup * 1_000_000_000)
+    recent = collections.deque()    # packets within window, i.e. (timestamp, packet)
+    seen = set()                    # packets within window
+
+    frames = duplicates = 0
+    batch = list()
+    for (record, reader) in heapq.merge(*streams, key=_timestamp):
+        if window is not None:
+            timestamp, packet = record[0], record[5][16:]
+            while recent and recent[0][0] < timestamp - window:
+                seen.discard(recent.popleft()[1])
+            if packet in seen:
+                duplicates += 1
+                continue
+            recent.append((timestamp, packet))
+            seen.add(packet)
+
+        batch.append(reader.encode(record, byteorder=byteorder, nanosecond=nanosecond))
+        frames += 1
+        if len(batch) >= BATCH_SIZE:
+            output.write_bytes(b''.join(batch))
+            batch.clear()
+    output.write_bytes(b''.join(batch))
+    return frames, duplicates
+
+
+def _timestamp(item):
+    """Sort key of frame records, i.e. timestamp in nanoseconds."""
+    return item[0][0]
@@ -0,0 +1,193 @@
+# -*- coding: utf-8 -*-
+"""raw frame records
+
+`pcapkit.foundation.records` contains class `RecordReader`,
+which reads frame records of PCAP files in blocks, without
+dissecting packets. Records are copied as is, or re-encoded
+in byte order & timestamp resolution of the output file, thus
+utilities such as merging and splitting of captures need not
+go through `Extractor`.
+
+"""
+import os
+import struct
+
+###############################################################################
+# from pcapkit.protocols.pcap.header import Header
+###############################################################################
+
+__all__ = ['RecordReader']
+
+# default size of read blocks (in bytes)
+BLOCK_SIZE = 262144
+
+# record header of PCAP frames, i.e. ts_sec, ts_usec, incl_len & orig_len
+_RECORD = {
+    'little': struct.Struct('<IIII'),
+    'big': struct.Struct('>IIII'),
+}
+
+# length of PCAP frame record header
+_RECORD_HEADER = 16
+
+
+class RecordReader:
+    """Read raw frame records of PCAP file.
+
+    Iterating a reader yields frame records, i.e. tuples of timestamp
+    (in nanoseconds), `ts_sec`, `ts_usec`, `incl_len`, `orig_len` and
+    the whole record (header & packet data, as `bytes`).
+
+    Properties:
+        * name -- str, PCAP file name
+        * header -- Header, global header
+        * protocol -- LinkType, data link type
+        * byteorder -- str, byte order of PCAP file
+        * nanosecond -- bool, nanosecond-resolution file flag
+        * snaplen -- int, max length of captured packets
+
+    Methods:
+        * encode -- encode frame record for output file
+        * close -- close PCAP file
+
+    Attributes:
+        * _file -- io.BufferedReader, PCAP file
+        * _header -- Header, global header
+        * _record -- struct.Struct, record header
+        * _scale -- int, nanoseconds per unit of `ts_usec`
+        * _bsize -- int, size of read blocks
+
+    Utilities:
+        * _read -- read frame records in blocks
+
+    """
+    ##########################################################################
+    # Properties.
+    ##########################################################################
+
+    @property
+    def name(self):
+        """PCAP file name."""
+        return self._file.name
+
+    @property
+    def header(self):
+        """Global header."""
+        return self._header
+
+    @property
+    def protocol(self):
+        """Data link type."""
+        return self._header.protocol
+
+    @property
+    def byteorder(self):
+        """Byte order of PCAP file."""
+        return self._header.byteorder
+
+    @property
+    def nanosecond(self):
+        """Nanosecond-resolution file flag."""
+        return self._header.nanosecond
+
+    @property
+    def snaplen(self):
+        """Max length of captured packets."""
+        return self._header.info.snaplen
+
+    ##########################################################################
+    # Methods.
+    ##########################################################################
+
+    def encode(self, record, *, byteorder, nanosecond):
+        """Encode frame record for output file.
+
+        Positional arguments:
+            * record -- tuple, frame record
+
+        Keyword arguments:
+            * byteorder -- str, byte order of output file
+            * nanosecond -- bool, nanosecond-resolution output file flag
+
+        Returns:
+            * bytes -- record header & packet data
+
+        Records are copied as is when output file is of same byte order
+        & timestamp resolution, or else their headers are re-encoded.
+
+        """
+        _, ts_sec, ts_usec, incl_len, orig_len, data = record
+        if byteorder == self.byteorder and nanosecond == self.nanosecond:
+            return data
+        if nanosecond != self.nanosecond:
+            ts_usec = ts_usec * 1000 if nanosecond else ts_usec // 1000
+        return _RECORD[byteorder].pack(ts_sec, ts_usec, incl_len, orig_len) + data[_RECORD_HEADER:]
+
+    def close(self):
+        """Close PCAP file."""
+        self._file.close()
+
+    ##########################################################################
+    # Data models.
+    ##########################################################################
+
+    def __init__(self, fin, *, buffering=BLOCK_SIZE):
+        """Initialise instance.
+
+        Positional arguments:
+            * fin -- str, PCAP file name
+
+        Keyword arguments:
+            * buffering -- int, size of read blocks
+
+        """
+        from pcapkit.protocols.pcap.header import Header
+
+        self._file = open(fin, 'rb')
+        self._header = Header(self._file)
+        self._file.seek(self._header.length, os.SEEK_SET)
+        self._record = _RECORD[self._header.byteorder]
+        self._scale = 1 if self._header.nanosecond else 1000
+        self._bsize = max(buffering, _RECORD_HEADER)
+
+    def __iter__(self):
+        return self._read()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    ##########################################################################
+    # Utilities.
+    ##########################################################################
+
+    def _read(self):
+        """Read frame records in blocks.
+
+        Records spanning over blocks are carried over to the next
+        block, so that memory is bounded by size of read blocks and
+        the longest record. A truncated record at EOF is dropped.
+
+        """
+        unpack = self._record.unpack_from
+        scale = self._scale
+        buffer = b''
+        while True:
+            block = self._file.read(self._bsize)
+            if not block:
+                break
+            buffer = buffer + block if buffer else block
+
+            offset = 0
+            length = len(buffer)
+            while offset + _RECORD_HEADER <= length:
+                ts_sec, ts_usec, incl_len, orig_len = unpack(buffer, offset)
+                stop = offset + _RECORD_HEADER + incl_len
+                if stop > length:
+                    break
+                yield (ts_sec * 1_000_000_000 + ts_usec * scale, ts_sec, ts_usec,
+                       incl_len, orig_len, buffer[offset:stop])
+                offset = stop
+            buffer = buffer[offset:]
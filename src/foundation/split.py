@@ -0,0 +1,102 @@
+# -*- coding: utf-8 -*-
+"""split PCAP files
+
+`pcapkit.foundation.split` contains function `split`,
+which splits a PCAP file into rotated PCAP files by size,
+time or frame count. Frame records are read in blocks (as of
+`RecordReader`) and copied as is into a persistent buffered
+writer (as of `dumpkit.PCAP`), without dissecting packets.
+
+"""
+import os
+
+from pcapkit.corekit.infoclass import Info
+from pcapkit.utilities.exceptions import FormatError
+
+###############################################################################
+# from pcapkit.dumpkit import PCAP
+# from pcapkit.foundation.records import RecordReader
+###############################################################################
+
+__all__ = ['split']
+
+# length of PCAP global header
+_GLOBAL_HEADER = 24
+
+
+def split(fin, fout=None, *, by='count', limit, buffering=None):
+    """Split PCAP file by size, time or frame count.
+
+    Positional arguments:
+        * fin -- str, file name to be read
+        * fout -- str, prefix of output file names, i.e. `{fout}_{index:05d}.pcap`
+                        (default is None, i.e. input file name without extension)
+
+    Keyword arguments:
+        * by -- str, criterion of rotation
+                        <keyword> 'size' / 'time' / 'count'
+        * limit -- int / float, max size of output files (in bytes), time span of
+                        output files (in seconds), or max number of frames of output files
+        * buffering -- int, size of read blocks
+                        (default is None, i.e. `pcapkit.foundation.records.BLOCK_SIZE`)
+
+    Returns:
+        * Info -- split report
+            |--> files -- tuple<str>, output file names
+            |--> frames -- int, number of frames
+
+    Time spans are aligned to the first frame, and spans without
+    frames make no output files. Each output file holds at least one
+    frame, even if it is larger than `limit` in size.
+
+    """
+    from pcapkit.dumpkit import PCAP
+    from pcapkit.foundation.records import BLOCK_SIZE, RecordReader
+
+    if by not in ('size', 'time', 'count'):
+        raise FormatError(f'Unsupported split criterion: {by}')
+    if not limit > 0:
+        raise FormatError(f'Invalid split limit: {limit}')
+    if fout is None:
+        fout = os.path.splitext(fin)[0]
+
+    files = list()
+    frames = 0
+    output = None
+    with RecordReader(fin, buffering=buffering or BLOCK_SIZE) as reader:
+        kwargs = dict(protocol=reader.protocol, byteorder=reader.byteorder, nanosecond=reader.nanosecond,
+                      snaplen=reader.snaplen)
+        span = int(limit * 1_000_000_000) if by == 'time' else None
+        try:
+            for record in reader:
+                length = len(record[5])
+                if output is None:
+                    rotate = True
+                elif by == 'count':
+                    rotate = count >= limit
+                elif by == 'size':
+                    rotate = size + length > limit
+                else:
+                    rotate = record[0] >= start + span
+
+                if rotate:
+                    if output is not None:
+                        output.close()
+                    if by == 'time':
+                        start = record[0] if output is None else start + (record[0] - start) // span * span
+                    files.append(f'{fout}_{len(files):05d}.pcap')
+                    output = PCAP(files[-1], **kwargs)
+                    count, size = 0, _GLOBAL_HEADER
+
+                output.write_bytes(record[5])
+                count += 1
+                size += length
+                frames += 1
+        finally:
+            if output is not None:
+                output.close()
+
+    return Info(
+        files=tuple(files),
+        frames=frames,
+    )
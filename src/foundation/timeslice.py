@@ -0,0 +1,311 @@
+# -*- coding: utf-8 -*-
+"""time range slicing
+
+`pcapkit.foundation.timeslice` locates frames of a time
+range in PCAP files, so that frames before the range are
+neither read nor dissected. The first frame of the range is
+looked up in a capture catalog (as of `Catalog`) if given,
+or else found through galloping & binary search over record
+timestamps, where record headers are resynchronised from
+arbitrary file offsets. Captures are assumed to be in (mostly)
+time order.
+
+"""
+import datetime
+import os
+import struct
+
+###############################################################################
+# from pcapkit.foundation.catalog import Catalog
+###############################################################################
+
+__all__ = ['make_time', 'seek_time', 'peek_time']
+
+# size of blocks read on resynchronisation & window of linear scan (in bytes)
+BLOCK_SIZE = 65536
+
+# number of consecutive record headers validated on resynchronisation
+PROBE_DEPTH = 3
+
+# record header of PCAP frames, i.e. ts_sec, ts_usec, incl_len & orig_len
+_RECORD = {
+    'little': struct.Struct('<IIII'),
+    'big': struct.Struct('>IIII'),
+}
+
+# length of PCAP frame record header
+_RECORD_HEADER = 16
+
+# max length of packets when snapshot length not set
+_SNAPLEN = 262144
+
+
+def make_time(value):
+    """Make UNIX-Epoch timestamp.
+
+    Positional arguments:
+        * value -- int / float / datetime.datetime / str, timestamp, where strings
+                        are either numbers or in ISO 8601 format, and naive datetimes
+                        are in local time (as `Frame.info.time`)
+
+    Returns:
+        * float -- UNIX-Epoch timestamp (`None` if `value` is `None`)
+
+    """
+    if value is None:
+        return None
+    if isinstance(value, str):
+        try:
+            return float(value)
+        except ValueError:
+            value = datetime.datetime.fromisoformat(value)
+    if isinstance(value, datetime.datetime):
+        return value.timestamp()
+    return float(value)
+
+
+def seek_time(file, timestamp, *, header, index=None):
+    """Seek to first frame at or after timestamp.
+
+    Positional arguments:
+        * file -- io.BufferedReader, PCAP file (after global header)
+        * timestamp -- float, UNIX-Epoch timestamp
+
+    Keyword arguments:
+        * header -- Header, global header of PCAP file
+        * index -- str or Catalog, capture catalog (default is None, i.e. binary search)
+
+    Returns:
+        * int -- number of frames skipped (`None` if unknown, i.e. without catalog)
+
+    """
+    if index is not None:
+        from pcapkit.foundation.catalog import Catalog
+
+        catalog = index if isinstance(index, Catalog) else Catalog(index)
+        try:
+            location = catalog.locate(file.name, timestamp)
+        finally:
+            if catalog is not index:
+                catalog.close()
+        if location is not None:
+            file.seek(location.offset, os.SEEK_SET)
+            return location.number - 1
+
+    scanner = _Scanner(file, header=header)
+    file.seek(scanner.search(timestamp), os.SEEK_SET)
+    return None
+
+
+def peek_time(file, *, header):
+    """Peek timestamp of next frame.
+
+    Positional arguments:
+        * file -- io.BufferedReader, PCAP file
+
+    Keyword arguments:
+        * header -- Header, global header of PCAP file
+
+    Returns:
+        * float -- UNIX-Epoch timestamp of next frame (`None` if EOF)
+
+    """
+    data = file.read(_RECORD_HEADER)
+    file.seek(-len(data), os.SEEK_CUR)
+    if len(data) < _RECORD_HEADER:
+        return None
+    ts_sec, ts_usec, _, _ = _RECORD[header.byteorder].unpack(data)
+    if header.nanosecond:
+        return ts_sec + ts_usec / 1_000_000_000
+    return ts_sec + ts_usec / 1_000_000
+
+
+class _Scanner:
+    """Search record timestamps of PCAP file.
+
+    Methods:
+        * search -- search offset of first frame at or after timestamp
+
+    Attributes:
+        * _file -- io.BufferedReader, PCAP file
+        * _size -- int, size of PCAP file
+        * _base -- int, offset of first frame
+        * _record -- struct.Struct, record header
+        * _scale -- int, resolution of timestamps
+        * _snaplen -- int, max length of packets
+        * _minsec -- int, seconds of first frame timestamp
+        * _maxsec -- int, seconds of last frame timestamp
+
+    Utilities:
+        * _time -- make timestamp
+        * _read -- read record header
+        * _valid -- check if record header is plausible
+        * _chain -- check if consecutive record headers are plausible
+        * _resync -- find record header from arbitrary offset
+        * _last -- find last record header
+
+    """
+    ##########################################################################
+    # Methods.
+    ##########################################################################
+
+    def search(self, timestamp):
+        """Search offset of first frame at or after timestamp.
+
+        Positional arguments:
+            * timestamp -- float, UNIX-Epoch timestamp
+
+        Returns:
+            * int -- offset of frame record header (size of file if none)
+
+        The frame at `lo` is always before `timestamp`, and frames
+        starting at or after `hi` are at or after `timestamp`.
+
+        """
+        lo, hi = self._base, self._size
+        record = self._read(lo)
+        if record is None or self._time(record) >= timestamp:
+            return lo
+
+        # galloping from start of file, so that early ranges are found quickly
+        step = BLOCK_SIZE
+        while lo + step < hi:
+            probe = self._resync(lo + step, limit=hi)
+            if probe is None:
+                hi = lo + step
+                break
+            offset, record = probe
+            if self._time(record) < timestamp:
+                lo = offset
+                step *= 2
+            else:
+                hi = offset
+                break
+
+        # binary search within bracket
+        while hi - lo > BLOCK_SIZE:
+            mid = (lo + hi) // 2
+            probe = self._resync(mid, limit=hi)
+            if probe is None:
+                hi = mid
+                continue
+            offset, record = probe
+            if self._time(record) < timestamp:
+                lo = offset
+            else:
+                hi = offset
+
+        # linear scan of record headers
+        record = self._read(lo)
+        while record is not None and self._time(record) < timestamp:
+            lo += _RECORD_HEADER + record[2]
+            record = self._read(lo)
+        return min(lo, self._size)
+
+    ##########################################################################
+    # Data models.
+    ##########################################################################
+
+    def __init__(self, file, *, header):
+        self._file = file
+        self._size = os.fstat(file.fileno()).st_size
+        self._base = header.length
+        self._record = _RECORD[header.byteorder]
+        self._scale = 1_000_000_000 if header.nanosecond else 1_000_000
+        self._snaplen = header.info.snaplen or _SNAPLEN
+
+        record = self._read(self._base)
+        self._minsec = 0 if record is None else record[0]
+        self._maxsec = 0xFFFF_FFFF          # unbounded whilst looking for last frame
+        self._maxsec = self._last()
+
+    ##########################################################################
+    # Utilities.
+    ##########################################################################
+
+    def _time(self, record):
+        """Make timestamp of record header."""
+        return record[0] + record[1] / self._scale
+
+    def _read(self, offset):
+        """Read record header at offset (`None` if EOF)."""
+        self._file.seek(offset, os.SEEK_SET)
+        data = self._file.read(_RECORD_HEADER)
+        if len(data) < _RECORD_HEADER:
+            return None
+        return self._record.unpack(data)
+
+    def _valid(self, record):
+        """Check if record header is plausible."""
+        ts_sec, ts_usec, incl_len, orig_len = record
+        return (self._minsec <= ts_sec <= self._maxsec and ts_usec < self._scale
+                and incl_len <= self._snaplen and incl_len <= orig_len)
+
+    def _chain(self, offset, record):
+        """Check if record headers following offset are plausible."""
+        for _ in range(PROBE_DEPTH - 1):
+            offset += _RECORD_HEADER + record[2]
+            if offset == self._size:
+                return True
+            if offset > self._size:
+                return False
+            record = self._read(offset)
+            if record is None or not self._valid(record):
+                return False
+        return True
+
+    def _resync(self, offset, *, limit):
+        """Find record header from arbitrary offset.
+
+        Positional arguments:
+            * offset -- int, offset to start from
+
+        Keyword arguments:
+            * limit -- int, offset to stop at
+
+        Returns:
+            * tuple<int, tuple> -- offset & record header (`None` if not found)
+
+        """
+        unpack = self._record.unpack_from
+        while offset < limit:
+            self._file.seek(offset, os.SEEK_SET)
+            block = self._file.read(min(BLOCK_SIZE, limit - offset) + _RECORD_HEADER - 1)
+            for index in range(len(block) - _RECORD_HEADER + 1):
+                record = unpack(block, index)
+                if self._valid(record) and self._chain(offset + index, record):
+                    return offset + index, record
+            offset += BLOCK_SIZE
+        return None
+
+    def _last(self):
+        """Find last record header.
+
+        Returns:
+            * int -- seconds of last frame timestamp (`0xFFFFFFFF` if not found)
+
+        Record headers in the last block are walked through, till one
+        whose following records end exactly at EOF. Timestamps of frames
+        are then bounded, so that misaligned record headers (e.g. off by
+        some bytes) are unlikely to be taken on resynchronisation.
+
+        """
+        offset = max(self._base, self._size - BLOCK_SIZE)
+        self._file.seek(offset, os.SEEK_SET)
+        block = self._file.read()
+        for index in range(len(block) - _RECORD_HEADER + 1):
+            record = self._record.unpack_from(block, index)
+            if not self._valid(record):
+                continue
+            position = index
+            while True:
+                last = record[0]
+                position += _RECORD_HEADER + record[2]
+                if position >= len(block) - _RECORD_HEADER + 1:
+                    break
+                record = self._record.unpack_from(block, position)
+                if not self._valid(record):
+                    break
+            if position == len(block):
+                return last
+        return 0xFFFF_FFFF
@@ -5,33 +5,86 @@
 TCP flows from a series of packets and connections. This
 was implemented as the demand of my mate @gousaiyang.
 
+Optionally, NetFlow-style statistics are kept per flow, i.e.
+packets & bytes per direction, first & last timestamp, union
+of TCP flags and an estimate of retransmissions, and flows are
+exported as they expire on active or idle timeouts.
+
 """
+import collections
 import copy
+import ipaddress
+import os
 import pathlib
 import sys
-import warnings
 
+from pcapkit.corekit.flowkey import flow_key
 from pcapkit.corekit.infoclass import Info
-from pcapkit.utilities.exceptions import FileExists, stacklevel
+from pcapkit.utilities.exceptions import FileExists, UnsupportedCall
 from pcapkit.utilities.validations import pkt_check
-from pcapkit.utilities.warnings import FileWarning, FormatWarning
+from pcapkit.utilities.warnings import FileWarning, FormatWarning, warn
 
 ###############################################################################
 # from dictdumper import JSON, PLIST, XML, JavaScript, Tree
 # from pcapkit.dumpkit import PCAP, NotImplementedIO
 ###############################################################################
 
+# max number of flow outputs with open file handles
+FILE_LIMIT = 256
+
+# default size of write buffer of flow outputs (in bytes)
+BUFFER_SIZE = 65536
+
+# default active timeout of flow statistics (in seconds)
+ACTIVE_TIMEOUT = 1800
+
+# default idle timeout of flow statistics (in seconds)
+IDLE_TIMEOUT = 15
+
+# compact flow record passed to export functions
+FlowRecord = collections.namedtuple('FlowRecord', [
+    'src',          # IP address of first packet seen
+    'srcport',      # TCP port of first packet seen
+    'dst',          # IP address of peer
+    'dstport',      # TCP port of peer
+    'start',        # timestamp of first packet
+    'end',          # timestamp of last packet
+    'fpkts',        # number of packets from `src`
+    'bpkts',        # number of packets to `src`
+    'fbytes',       # bytes of frames from `src`
+    'bbytes',       # bytes of frames to `src`
+    'fretx',        # number of retransmissions from `src`
+    'bretx',        # number of retransmissions to `src`
+    'flags',        # union of TCP flags
+    'reason',       # reason of expiry (`None` if active)
+])
+
 
 class TraceFlow:
     """Trace TCP flows.
 
     Properties:
         * index -- tuple<Info>, index table for traced flows
+        * flows -- tuple<Info>, statistics of expired & active flows
 
     Methods:
         * make_fout -- make root path for output
         * dump -- dump frame to output files
         * trace -- trace packets
+        * expire -- export flows expired at timestamp
+        * checkpoint -- checkpoint pending flows
+        * restore -- restore pending flows
+        * close -- close output files of pending flows
+
+    Utilities:
+        * _open_fout -- open output of flow
+        * _resume_fout -- reopen output of restored flow
+        * _touch_fout -- mark output of flow as recently used
+        * _close_fout -- close output of finished flow
+        * _account -- update flow statistics with packet
+        * _export -- export statistics of expired flow
+        * _label_key -- make flow key from flow label
+        * _make_info -- make `Info` from flow record
 
     """
     ##########################################################################
@@ -44,6 +97,13 @@ class TraceFlow:
             return self.submit()
         return tuple(self._stream)
 
+    @property
+    def flows(self):
+        if not self._stats:
+            raise UnsupportedCall("'TraceFlow(stats=False)' object has no attribute 'flows'")
+        records = self._expired + [flow.record(None) for flow in self._flows.values()]
+        return tuple(map(self._make_info, records))
+
     ##########################################################################
     # Methods.
     ##########################################################################
@@ -77,8 +137,8 @@ class TraceFlow:
         else:                   # no output file
             from pcapkit.dumpkit import NotImplementedIO as output
             if fmt is not None:
-                warnings.warn(f'Unsupported output format: {fmt}; disabled file output feature',
-                              FormatWarning, stacklevel=stacklevel())
+                warn(f'Unsupported output format: {fmt}; disabled file output feature',
+                     FormatWarning)
             return output, ''
 
         try:
@@ -88,7 +148,7 @@ class TraceFlow:
             if path.is_dir():
                 pass
             elif fmt is None:
-                warnings.warn(error.strerror, FileWarning, stacklevel=stacklevel())
+                warn(error.strerror, FileWarning)
             else:
                 raise FileExists(*error.args) from None
         except OSError:
@@ -112,15 +172,25 @@ class TraceFlow:
                 |-- (str) dst -- destination IP
                 |-- (int) dstport -- TCP destination port
                 |-- (numbers.Real) timestamp -- frame timestamp
+                |-- (int) seq -- TCP sequence number
+                |-- (int) len -- TCP payload length
+                |-- (int) flags -- TCP flags, i.e. CWR ... FIN bits
+                |-- (int) length -- frame length
+                |-- (bytes) key -- flow key (optional, made from endpoints if not given)
+                |-- (bool) reverse -- if packet is in reverse direction of flow key
 
         """
         # fetch flow label
-        output = self.trace(packet, _check=False, _output=True)
+        output, label = self.trace(packet, _check=False, _output=True)
 
         # dump files
         output(packet['frame'], name=f"Frame {packet['index']}",
                byteorder=self._endian, nanosecond=self._nnsecd)
 
+        # release file handle of finished flow
+        if packet['fin']:
+            self._close_fout(label, output)
+
     def trace(self, packet, *, _check=True, _output=False):
         """Trace packets.
 
@@ -129,18 +199,22 @@ class TraceFlow:
 
         Keyword arguments:
             * _check -- bool, flag if run validations
-            * _output -- bool, flag if has formatted dumper
+            * _output -- bool, flag if return dumper (along with flow label)
 
         """
         self._newflg = True
         if _check:
             pkt_check(packet)
-        info = Info(packet)
 
-        # Buffer Identifier
-        BUFID = tuple(sorted([str(info.src), str(info.srcport), str(info.dst), str(info.dstport)]))
-        # SYN = info.syn      # Synchronise Flag (Establishment)
-        FIN = info.fin      # Finish Flag (Termination)
+        # Buffer Identifier, i.e. flow key
+        BUFID, reverse = packet.get('key'), packet.get('reverse')
+        if BUFID is None:
+            BUFID, reverse = flow_key(packet['src'], packet['srcport'], packet['dst'], packet['dstport'])
+        # SYN = packet['syn']     # Synchronise Flag (Establishment)
+        FIN = packet['fin']     # Finish Flag (Termination)
+
+        if self._stats:
+            self._account(packet, BUFID, reverse)
 
         # # when SYN is set, reset buffer of this seesion
         # if SYN and BUFID in self._buffer:
@@ -150,18 +224,25 @@ class TraceFlow:
         #     self._stream.append(Info(temp))
 
         # initialise buffer with BUFID
-        if BUFID not in self._buffer:
-            label = f'{info.src}_{info.srcport}-{info.dst}_{info.dstport}-{info.timestamp}'
-            self._buffer[BUFID] = dict(
-                fpout=self._foutio(f'{self._fproot}/{label}.{self._fdpext}', protocol=info.protocol),
+        buf = self._buffer.get(BUFID)
+        if buf is None:
+            label = f"{packet['src']}_{packet['srcport']}-{packet['dst']}_{packet['dstport']}-{packet['timestamp']}"
+            buf = self._buffer[BUFID] = dict(
+                fpout=self._open_fout(label, protocol=packet['protocol']),
                 index=list(),
                 label=label,
             )
 
+        # reopen output of flow restored from checkpoint
+        elif buf['fpout'] is None:
+            buf['fpout'] = self._resume_fout(buf['label'], protocol=packet['protocol'])
+
         # trace frame record
-        self._buffer[BUFID]['index'].append(info.index)
-        fpout = self._buffer[BUFID]['fpout']
-        label = self._buffer[BUFID]['label']
+        self._frnum = packet['index']
+        buf['index'].append(self._offset + packet['index'])
+        fpout = buf['fpout']
+        label = buf['label']
+        self._touch_fout(label, fpout)
 
         # when FIN is set, submit buffer of this session
         if FIN:
@@ -174,13 +255,19 @@ class TraceFlow:
             buf['index'] = tuple(buf['index'])
             self._stream.append(Info(buf))
 
+            # release file handle unless frame to be dumped
+            if not _output:
+                self._close_fout(label, fpout)
+
         # return label or output object
-        return fpout if _output else label
+        return (fpout, label) if _output else label
 
     def submit(self):
         """Submit traced TCP flows."""
         self._newflg = False
         ret = list()
+        for output in self._fdpool.values():
+            output.flush()
         for buf in self._buffer.values():
             buf = copy.deepcopy(buf)
             if self._fdpext:
@@ -192,6 +279,265 @@ class TraceFlow:
         ret += self._stream
         return tuple(ret)
 
+    def expire(self, timestamp=None):
+        """Export flows expired at timestamp.
+
+        Positional arguments:
+            * timestamp -- float, UNIX-Epoch timestamp
+                            (default is None, i.e. all active flows expired)
+
+        Flows are checked against timeouts as packets arrive, so this is
+        only needed when no more packets are to come, e.g. at end of capture.
+
+        """
+        if not self._stats:
+            return
+        for bufid in list(self._flows):
+            flow = self._flows[bufid]
+            if timestamp is None:
+                reason = 'end'
+            elif timestamp - flow.end >= self._idle:
+                reason = 'idle'
+            elif timestamp - flow.start >= self._active:
+                reason = 'active'
+            else:
+                continue
+            self._export(self._flows.pop(bufid), reason=reason)
+
+    def checkpoint(self, *, frames=None):
+        """Checkpoint pending flows.
+
+        Keyword arguments:
+            * frames -- int, number of frames of current file
+                            (default is None, i.e. frame number of last traced packet)
+
+        Returns:
+            * dict -- state of pending flows, which consists of built-in types only
+
+        Frames of current file are recorded as offset of frame numbers,
+        so that flows restored from the checkpoint number frames of next
+        file after those of previous files, rather than restarting at 1.
+
+        """
+        for output in self._fdpool.values():
+            output.flush()
+        buffer = list()
+        for (bufid, buf) in self._buffer.items():
+            buffer.append((bufid, buf['label'], tuple(buf['index'])))
+        flows = [(bufid, flow.state()) for (bufid, flow) in self._flows.items()]
+        offset = self._offset + (self._frnum if frames is None else frames)
+        return dict(format=self._fdpext, buffer=buffer, flows=flows, offset=offset)
+
+    def restore(self, state):
+        """Restore pending flows.
+
+        Positional arguments:
+            * state -- dict, state of pending flows made by `checkpoint`
+
+        Outputs of restored flows are reopened on their next frames, where
+        PCAP files are appended to, and files of other formats restarted.
+        Frame numbers in `index` are then offset by frames of previous files.
+
+        """
+        for (bufid, label, index) in state['buffer']:
+            if not isinstance(bufid, bytes):    # checkpoint made before flow keys
+                bufid = self._label_key(label)
+            self._buffer[bufid] = dict(
+                fpout=None,
+                index=list(index),
+                label=label,
+            )
+        for (bufid, flow) in state.get('flows', ()):
+            self._flows[bufid] = _Flow.from_state(flow)
+        self._offset = state.get('offset', 0)
+        self._newflg = True
+
+    def close(self):
+        """Close output files of pending flows.
+
+        Outputs are reopened in append mode on their next frames.
+
+        """
+        while self._fdpool:
+            _, output = self._fdpool.popitem()
+            output.close()
+
+    ##########################################################################
+    # Utilities.
+    ##########################################################################
+
+    def _open_fout(self, label, *, protocol, append=False):
+        """Open output of flow.
+
+        Positional arguments:
+            * label -- str, flow label
+
+        Keyword arguments:
+            * protocol -- data link type from global header
+            * append -- bool, if append to existing output file
+
+        Returns:
+            * output -- dumper of specified format
+
+        """
+        fout = f'{self._fproot}/{label}.{self._fdpext}'
+        if self._fdpext == 'pcap':
+            return self._foutio(fout, protocol=protocol, append=append, buffering=self._bufsiz)
+        return self._foutio(fout, protocol=protocol)
+
+    def _resume_fout(self, label, *, protocol):
+        """Reopen output of restored flow.
+
+        Positional arguments:
+            * label -- str, flow label
+
+        Keyword arguments:
+            * protocol -- data link type from global header
+
+        Returns:
+            * output -- dumper of specified format
+
+        """
+        fout = f'{self._fproot}/{label}.{self._fdpext}'
+        if self._fdpext == 'pcap':
+            return self._open_fout(label, protocol=protocol, append=True)
+        if self._fdpext and os.path.isfile(fout):
+            warn(f'cannot append to {self._fdpext} output: {fout}; restarted with following frames',
+                 FileWarning)
+        return self._open_fout(label, protocol=protocol)
+
+    def _touch_fout(self, label, output):
+        """Mark output of flow as recently used.
+
+        Outputs with open file handles are kept in a LRU pool, and
+        the least recently used one is closed when the pool is full.
+
+        Positional arguments:
+            * label -- str, flow label
+            * output -- dumper of specified format
+
+        """
+        if not hasattr(output, 'close'):    # no file handle kept open
+            return
+        self._fdpool[label] = output
+        self._fdpool.move_to_end(label)
+        while len(self._fdpool) > self._fdlimit:
+            _, evicted = self._fdpool.popitem(last=False)
+            evicted.close()
+
+    def _close_fout(self, label, output):
+        """Close output of finished flow.
+
+        Positional arguments:
+            * label -- str, flow label
+            * output -- dumper of specified format
+
+        """
+        self._fdpool.pop(label, None)
+        if hasattr(output, 'close'):
+            output.close()
+
+    def _account(self, packet, key, reverse):
+        """Update flow statistics with packet.
+
+        Positional arguments:
+            * packet -- dict, a flow packet
+            * key -- bytes, flow key
+            * reverse -- bool, if packet is in reverse direction of flow key
+
+        Flows are kept in order of last seen, thus flows idle for too
+        long are found at front. A flow lasting for too long is expired
+        on its next packet, which then starts a new flow record.
+
+        """
+        timestamp = float(packet['timestamp'])
+        flows = self._flows
+
+        # expire idle flows
+        while flows:
+            bufid = next(iter(flows))
+            if timestamp - flows[bufid].end < self._idle:
+                break
+            self._export(flows.pop(bufid), reason='idle')
+
+        flow = flows.get(key)
+        if flow is not None and timestamp - flow.start >= self._active:
+            self._export(flows.pop(key), reason='active')
+            flow = None
+        if flow is None:
+            flow = flows[key] = _Flow(packet['src'], packet['srcport'], packet['dst'], packet['dstport'],
+                                      timestamp, reverse)
+        else:
+            flows.move_to_end(key)
+        flow.update(packet, timestamp, reverse)
+
+    def _export(self, flow, *, reason):
+        """Export statistics of expired flow.
+
+        Positional arguments:
+            * flow -- _Flow, statistics of flow
+
+        Keyword arguments:
+            * reason -- str, reason of expiry
+                            <keyword> 'idle' / 'active' / 'end'
+
+        """
+        record = flow.record(reason)
+        if self._fexport is None:
+            self._expired.append(record)
+        else:
+            self._fexport(record)
+
+    @staticmethod
+    def _label_key(label):
+        """Make flow key from flow label.
+
+        Positional arguments:
+            * label -- str, flow label, i.e. `{src}_{srcport}-{dst}_{dstport}-{timestamp}`
+
+        Returns:
+            * bytes -- flow key
+
+        """
+        this, that = label.rsplit('-', 1)[0].split('-')
+        src, srcport = this.rsplit('_', 1)
+        dst, dstport = that.rsplit('_', 1)
+        return flow_key(ipaddress.ip_address(src), int(srcport), ipaddress.ip_address(dst), int(dstport))[0]
+
+    @staticmethod
+    def _make_info(record):
+        """Make `Info` from flow record.
+
+        Positional arguments:
+            * record -- FlowRecord, flow record
+
+        Returns:
+            * Info -- flow record
+                |--> src -- IP address of first packet seen
+                |--> srcport -- TCP port of first packet seen
+                |--> dst -- IP address of peer
+                |--> dstport -- TCP port of peer
+                |--> start -- float, timestamp of first packet
+                |--> end -- float, timestamp of last packet
+                |--> forward -- Info, packets, bytes & retransmissions from `src`
+                |--> backward -- Info, packets, bytes & retransmissions to `src`
+                |--> flags -- int, union of TCP flags
+                |--> reason -- str, reason of expiry
+
+        """
+        return Info(
+            src=record.src,
+            srcport=record.srcport,
+            dst=record.dst,
+            dstport=record.dstport,
+            start=record.start,
+            end=record.end,
+            forward=dict(packets=record.fpkts, bytes=record.fbytes, retransmissions=record.fretx),
+            backward=dict(packets=record.bpkts, bytes=record.bbytes, retransmissions=record.bretx),
+            flags=record.flags,
+            reason=record.reason,
+        )
+
     ##########################################################################
     # Data models.
     ##########################################################################
@@ -199,7 +545,9 @@ class TraceFlow:
     # Not hashable
     __hash__ = None
 
-    def __init__(self, *, fout=None, format=None, byteorder=sys.byteorder, nanosecond=False):
+    def __init__(self, *, fout=None, format=None, byteorder=sys.byteorder, nanosecond=False,
+                 max_files=FILE_LIMIT, buffering=BUFFER_SIZE,
+                 stats=False, active_timeout=ACTIVE_TIMEOUT, idle_timeout=IDLE_TIMEOUT, export=None):
         """Initialise instance.
 
         Keyword arguments:
@@ -207,14 +555,35 @@ class TraceFlow:
             * format -- str, output format
             * byteorder -- str, output file byte order
             * nanosecond -- bool, output nanosecond-resolution file flag
+            * max_files -- int, max number of flow outputs with open file handles
+            * buffering -- int, size of write buffer of flow outputs
+            * stats -- bool, if keep statistics of flows
+            * active_timeout -- float, time (in seconds) after which a flow is expired
+                            since its first packet
+            * idle_timeout -- float, time (in seconds) after which a flow is expired
+                            since its last packet
+            * export -- function, called with `FlowRecord` of each flow as it expires
+                            (default is None, i.e. kept in `flows`)
 
         """
         self._newflg = False    # new packet flag
         self._fproot = fout     # output root path
         self._buffer = dict()   # buffer field
         self._stream = list()   # stream index
+        self._frnum = 0         # frame number of last traced packet
+        self._offset = 0        # frames of previous files (if restored)
         self._endian = byteorder
         self._nnsecd = nanosecond
+        self._fdpool = collections.OrderedDict()    # LRU pool of outputs with open file handles
+        self._fdlimit = max(max_files, 1)           # max size of output pool
+        self._bufsiz = buffering                    # size of write buffer
+
+        self._stats = stats                         # flow statistics flag
+        self._active = active_timeout               # active timeout of flows
+        self._idle = idle_timeout                   # idle timeout of flows
+        self._fexport = export                      # export function of expired flows
+        self._flows = collections.OrderedDict()     # active flows, in order of last seen
+        self._expired = list()                      # records of expired flows (if no export function)
 
         # dump I/O object
         self._foutio, self._fdpext = self.make_fout(fout, format)
@@ -228,3 +597,110 @@ class TraceFlow:
         """
         self._newflg = True
         self.dump(packet)
+
+
+class _Flow:
+    """Statistics of a flow.
+
+    Methods:
+        * update -- update statistics with packet
+        * record -- make flow record
+        * state -- make checkpoint state
+        * from_state -- restore from checkpoint state
+
+    Attributes:
+        * src / srcport -- endpoint of first packet seen
+        * dst / dstport -- peer of first packet seen
+        * start / end -- timestamps of first & last packet
+        * fpkts / bpkts -- number of packets, forward & backward
+        * fbytes / bbytes -- bytes of frames, forward & backward
+        * fretx / bretx -- number of retransmissions, forward & backward
+        * fnext / bnext -- highest next sequence number, forward & backward
+        * flags -- int, union of TCP flags
+        * reverse -- bool, if first packet seen is in reverse direction of flow key
+
+    Directions are as of the first packet seen, which is not
+    necessarily the SYN of the connection.
+
+    """
+    __slots__ = ('src', 'srcport', 'dst', 'dstport', 'start', 'end', 'fpkts', 'bpkts',
+                 'fbytes', 'bbytes', 'fretx', 'bretx', 'fnext', 'bnext', 'flags', 'reverse')
+
+    def __init__(self, src, srcport, dst, dstport, timestamp, reverse):
+        self.src = src
+        self.srcport = srcport
+        self.dst = dst
+        self.dstport = dstport
+        self.start = self.end = timestamp
+        self.fpkts = self.bpkts = self.fbytes = self.bbytes = self.fretx = self.bretx = 0
+        self.fnext = self.bnext = None
+        self.flags = 0
+        self.reverse = reverse
+
+    def update(self, packet, timestamp, reverse):
+        """Update statistics with packet.
+
+        Positional arguments:
+            * packet -- dict, a flow packet
+            * timestamp -- float, UNIX-Epoch timestamp of packet
+            * reverse -- bool, if packet is in reverse direction of flow key
+
+        A packet with payload is counted as a retransmission if its
+        data ends at or before the highest sequence number sent in the
+        same direction, thus reordered packets are counted as well.
+
+        """
+        if timestamp > self.end:
+            self.end = timestamp
+        self.flags |= packet.get('flags', 0)
+        length = packet.get('length', 0)
+        payload = packet.get('len', 0)
+        if payload:
+            last = (packet['seq'] + payload) & 0xFFFF_FFFF
+
+        if reverse == self.reverse:
+            self.fpkts += 1
+            self.fbytes += length
+            if payload:
+                if self.fnext is not None and (self.fnext - last) & 0xFFFF_FFFF < 0x8000_0000:
+                    self.fretx += 1
+                else:
+                    self.fnext = last
+        else:
+            self.bpkts += 1
+            self.bbytes += length
+            if payload:
+                if self.bnext is not None and (self.bnext - last) & 0xFFFF_FFFF < 0x8000_0000:
+                    self.bretx += 1
+                else:
+                    self.bnext = last
+
+    def record(self, reason):
+        """Make flow record.
+
+        Positional arguments:
+            * reason -- str, reason of expiry (`None` if active)
+
+        Returns:
+            * FlowRecord -- flow record
+
+        """
+        return FlowRecord(self.src, self.srcport, self.dst, self.dstport, self.start, self.end,
+                          self.fpkts, self.bpkts, self.fbytes, self.bbytes, self.fretx, self.bretx,
+                          self.flags, reason)
+
+    def state(self):
+        """Make checkpoint state, which consists of built-in types only."""
+        return (str(self.src), self.srcport, str(self.dst), self.dstport, self.start, self.end,
+                self.fpkts, self.bpkts, self.fbytes, self.bbytes, self.fretx, self.bretx,
+                self.fnext, self.bnext, self.flags, self.reverse)
+
+    @classmethod
+    def from_state(cls, state):
+        """Restore from checkpoint state."""
+        flow = cls.__new__(cls)
+        for (name, value) in zip(cls.__slots__, state):
+            setattr(flow, name, value)
+        flow.src = ipaddress.ip_address(flow.src)
+        flow.dst = ipaddress.ip_address(flow.dst)
+        return flow
@@ -9,20 +9,30 @@ designed to help and simplify the usage of `pcapkit`.
 import io
 import sys
 
-from pcapkit.foundation.analysis import analyse as analyse2
-from pcapkit.foundation.extraction import Extractor
-from pcapkit.foundation.traceflow import TraceFlow
-from pcapkit.protocols.protocol import Protocol
-from pcapkit.reassembly.ipv4 import IPv4_Reassembly
-from pcapkit.reassembly.ipv6 import IPv6_Reassembly
-from pcapkit.reassembly.tcp import TCP_Reassembly
 from pcapkit.utilities.exceptions import FormatError
+from pcapkit.utilities.lazy import lazy_loader
 from pcapkit.utilities.validations import (bool_check, int_check, io_check,
                                            str_check)
 
+###############################################################################
+# from pcapkit.foundation.analysis import analyse as analyse2
+# from pcapkit.foundation.batch import extract_many as extract_many2
+# from pcapkit.foundation.catalog import Catalog
+# from pcapkit.foundation.columns import Columns
+# from pcapkit.foundation.extraction import Extractor
+# from pcapkit.foundation.merge import merge as merge2
+# from pcapkit.foundation.split import split as split2
+# from pcapkit.foundation.traceflow import TraceFlow
+# from pcapkit.protocols.protocol import Protocol
+# from pcapkit.reassembly.ipv4 import IPv4_Reassembly
+# from pcapkit.reassembly.ipv6 import IPv6_Reassembly
+# from pcapkit.reassembly.tcp import TCP_Reassembly
+###############################################################################
+
 __all__ = [
-    'extract', 'analyse', 'reassemble', 'trace',            # interface functions
-    'TREE', 'JSON', 'PLIST', 'PCAP',                        # format macros
+    'extract', 'analyse', 'reassemble', 'trace', 'columns', 'catalog', 'merge',
+    'split', 'extract_many',                                # interface functions
+    'TREE', 'JSON', 'JSONL', 'PLIST', 'PCAP',               # format macros
     'LINK', 'INET', 'TRANS', 'APP', 'RAW',                  # layer macros
     'DPKT', 'Scapy', 'PyShark', 'MPServer', 'MPPipeline', 'PCAPKit',
                                                             # engine macros
@@ -31,6 +41,7 @@ __all__ = [
 # output file formats
 TREE = 'tree'
 JSON = 'json'
+JSONL = 'jsonl'
 PLIST = 'plist'
 PCAP = 'pcap'
 
@@ -49,21 +60,39 @@ PyShark = 'pyshark'
 MPServer = 'server'
 MPPipeline = 'pipeline'
 
+# lazy attribute loading (PEP 562)
+__getattr__, __dir__ = lazy_loader(__name__, {
+    'analyse2': 'pcapkit.foundation.analysis:analyse',
+    'Extractor': 'pcapkit.foundation.extraction',
+    'TraceFlow': 'pcapkit.foundation.traceflow',
+    'Protocol': 'pcapkit.protocols.protocol',
+    'IPv4_Reassembly': 'pcapkit.reassembly.ipv4',
+    'IPv6_Reassembly': 'pcapkit.reassembly.ipv6',
+    'TCP_Reassembly': 'pcapkit.reassembly.tcp',
+})
+
 
 def extract(fin=None, fout=None, format=None,                           # basic settings
             auto=True, extension=True, store=True,                      # internal settings
             files=False, nofile=False, verbose=False,                   # output settings
+            threaded=False,                                             # output settings
             engine=None, layer=None, protocol=None,                     # extraction settings
             ip=False, ipv4=False, ipv6=False, tcp=False, strict=True,   # reassembly settings
+            analysis=True, lazy=False, analysers=None,                  # reassembly settings
             trace=False, trace_fout=None, trace_format=None,            # trace settings
-            trace_byteorder=sys.byteorder, trace_nanosecond=False):     # trace settings
+            trace_byteorder=sys.byteorder, trace_nanosecond=False,      # trace settings
+            trace_max_files=None, trace_buffering=None,                 # trace settings
+            trace_stats=False, trace_active_timeout=None,               # trace settings
+            trace_idle_timeout=None, trace_export=None,                 # trace settings
+            start_time=None, end_time=None, index=None,                 # slicing settings
+            resume=None, checkpoint=None):                              # checkpoint settings
     """Extract a PCAP file.
 
     Keyword arguments:
         * fin  -- str, file name to be read; if file not exist, raise an error
-        * fout -- str, file name to be written
+        * fout -- str, file name to be written ('-' for stdout with 'jsonl' format)
         * format  -- str, file format of output
-                        <keyword> 'plist' / 'json' / 'tree' / 'html'
+                        <keyword> 'plist' / 'json' / 'jsonl' / 'tree' / 'html'
 
         * auto -- bool, if automatically run till EOF (default is True)
                         <keyword> True / False
@@ -78,6 +107,8 @@ def extract(fin=None, fout=None, format=None,                           # basic
                         <keyword> True / False
         * verbose -- bool, if print verbose output information (default is False)
                         <keyword> True / False
+        * threaded -- bool, if serialise output in a background thread (default is False)
+                        <keyword> True / False
 
         * engine -- str, extraction engine to be used
                         <keyword> 'default | pcapkit'
@@ -96,6 +127,12 @@ def extract(fin=None, fout=None, format=None,                           # basic
                         <keyword> True / False
         * strict -- bool, if set strict flag for reassembly (default is True)
                         <keyword> True / False
+        * analysis -- bool, if analyse application layer of reassembled TCP payloads (default is True)
+                        <keyword> True / False
+        * lazy -- bool, if postpone analysis of reassembled TCP payloads till accessed (default is False)
+                        <keyword> True / False
+        * analysers -- iterable<str>, application layer analysers to be tried (default is None, i.e. all)
+                        <keyword> registered analyser name
 
         * trace -- bool, if trace TCP traffic flows (default is False)
                         <keyword> True / False
@@ -106,11 +143,39 @@ def extract(fin=None, fout=None, format=None,                           # basic
                         <keyword> 'little' / 'big'
         * trace_nanosecond -- bool, output nanosecond-resolution file flag
                         <keyword> True / False
+        * trace_max_files -- int, max number of flow outputs with open file handles
+                        (default is None, i.e. `pcapkit.foundation.traceflow.FILE_LIMIT`)
+        * trace_buffering -- int, size of write buffer of flow outputs
+                        (default is None, i.e. `pcapkit.foundation.traceflow.BUFFER_SIZE`)
+        * trace_stats -- bool, if keep NetFlow-style statistics of flows (default is False)
+                        <keyword> True / False
+        * trace_active_timeout -- float, time (in seconds) after which a flow is expired
+                        since its first packet
+                        (default is None, i.e. `pcapkit.foundation.traceflow.ACTIVE_TIMEOUT`)
+        * trace_idle_timeout -- float, time (in seconds) after which a flow is expired
+                        since its last packet
+                        (default is None, i.e. `pcapkit.foundation.traceflow.IDLE_TIMEOUT`)
+        * trace_export -- function, called with `FlowRecord` of each flow as it expires
+                        (default is None, i.e. kept in `flows`)
+
+        * start_time -- float / datetime.datetime / str, extract frames at or after
+                        which timestamp (default is None, i.e. from first frame)
+        * end_time -- float / datetime.datetime / str, extract frames before
+                        which timestamp (default is None, i.e. til EOF)
+        * index -- str or Catalog, capture catalog to locate `start_time`
+                        (default is None, i.e. binary search over record timestamps)
+
+        * resume -- str, checkpoint file to restore reassembly & trace state from
+        * checkpoint -- str, checkpoint file to save reassembly & trace state to
+                        when extraction finished
 
     Returns:
         * Extractor -- an Extractor object form `pcapkit.extractor`
 
     """
+    from pcapkit.foundation.extraction import Extractor
+    from pcapkit.protocols.protocol import Protocol
+
     if isinstance(layer, type) and issubclass(layer, Protocol):
         layer = layer.__layer__
     if isinstance(protocol, type) and issubclass(protocol, Protocol):
@@ -118,46 +183,64 @@ def extract(fin=None, fout=None, format=None,                           # basic
 
     str_check(fin or '', fout or '', format or '',
               trace_fout or '', trace_format or '',
+              resume or '', checkpoint or '',
               engine or '', layer or '', *(protocol or ''))
-    bool_check(files, nofile, verbose, auto, extension, store,
-               ip, ipv4, ipv6, tcp, strict, trace)
+    bool_check(files, nofile, verbose, threaded, auto, extension, store,
+               ip, ipv4, ipv6, tcp, strict, analysis, lazy, trace, trace_stats)
+    str_check(*(analysers or ''))
+    int_check(trace_max_files or 0, trace_buffering or 0)
 
     return Extractor(fin=fin, fout=fout, format=format,
                      store=store, files=files, nofile=nofile,
-                     auto=auto, verbose=verbose, extension=extension,
+                     auto=auto, verbose=verbose, extension=extension, threaded=threaded,
                      engine=engine, layer=layer, protocol=protocol,
                      ip=ip, ipv4=ipv4, ipv6=ipv6, tcp=tcp, strict=strict,
+                     analysis=analysis, lazy=lazy, analysers=analysers,
                      trace=trace, trace_fout=trace_fout, trace_format=trace_format,
-                     trace_byteorder=trace_byteorder, trace_nanosecond=trace_nanosecond)
+                     trace_byteorder=trace_byteorder, trace_nanosecond=trace_nanosecond,
+                     trace_max_files=trace_max_files, trace_buffering=trace_buffering,
+                     trace_stats=trace_stats, trace_active_timeout=trace_active_timeout,
+                     trace_idle_timeout=trace_idle_timeout, trace_export=trace_export,
+                     start_time=start_time, end_time=end_time, index=index,
+                     resume=resume, checkpoint=checkpoint)
 
 
-def analyse(file, length=None):
+def analyse(file, length=None, analysers=None):
     """Analyse application layer packets.
 
     Keyword arguments:
         * file -- bytes or file-like object, packet to be analysed
         * length -- int, length of the analysing packet
+        * analysers -- iterable<str>, application layer analysers to be tried (default is None, i.e. all)
 
     Returns:
         * Analysis -- an Analysis object from `pcapkit.analyser`
 
     """
+    from pcapkit.foundation.analysis import analyse as analyse2
+
     if isinstance(file, bytes):
         file = io.BytesIO(file)
 
     io_check(file)
     int_check(length or sys.maxsize)
+    str_check(*(analysers or ''))
 
-    return analyse2(file, length)
+    return analyse2(file, length, analysers=analysers)
 
 
-def reassemble(protocol, strict=False):
+def reassemble(protocol, strict=False, analysis=True, lazy=False, analysers=None):
     """Reassemble fragmented datagrams.
 
     Keyword arguments:
         * protocol -- str, protocol to be reassembled
         * strict -- bool, if return all datagrams (including those not implemented) when submit (default is False)
                         <keyword> True / False
+        * analysis -- bool, [TCP only] if analyse application layer of reassembled payloads (default is True)
+                        <keyword> True / False
+        * lazy -- bool, [TCP only] if postpone analysis of reassembled payloads till accessed (default is False)
+                        <keyword> True / False
+        * analysers -- iterable<str>, [TCP only] application layer analysers to be tried (default is None, i.e. all)
 
     Returns:
         * [if protocol is IPv4] IPv4_Reassembly -- a Reassembly object from `pcapkit.reassembly`
@@ -165,23 +248,30 @@ def reassemble(protocol, strict=False):
         * [if protocol is TCP] TCP_Reassembly -- a Reassembly object from `pcapkit.reassembly`
 
     """
+    from pcapkit.protocols.protocol import Protocol
+
     if isinstance(protocol, type) and issubclass(protocol, Protocol):
         protocol = protocol.__index__()
 
-    str_check(protocol)
-    bool_check(strict)
+    str_check(protocol, *(analysers or ''))
+    bool_check(strict, analysis, lazy)
 
     if protocol == 'IPv4':
+        from pcapkit.reassembly.ipv4 import IPv4_Reassembly
         return IPv4_Reassembly(strict=strict)
     elif protocol == 'IPv6':
+        from pcapkit.reassembly.ipv6 import IPv6_Reassembly
         return IPv6_Reassembly(strict=strict)
     elif protocol == 'TCP':
-        return TCP_Reassembly(strict=strict)
+        from pcapkit.reassembly.tcp import TCP_Reassembly
+        return TCP_Reassembly(strict=strict, analysis=analysis, lazy=lazy, analysers=analysers)
     else:
         raise FormatError(f'Unsupported reassembly protocol: {protocol}')
 
 
-def trace(fout=None, format=None, byteorder=sys.byteorder, nanosecond=False):
+def trace(fout=None, format=None, byteorder=sys.byteorder, nanosecond=False,
+          max_files=None, buffering=None, stats=False, active_timeout=None, idle_timeout=None,
+          export=None):
     """Trace TCP flows.
 
     Keyword arguments:
@@ -189,7 +279,160 @@ def trace(fout=None, format=None, byteorder=sys.byteorder, nanosecond=False):
         * format -- str, output format
         * byteorder -- str, output file byte order
         * nanosecond -- bool, output nanosecond-resolution file flag
+        * max_files -- int, max number of flow outputs with open file handles
+        * buffering -- int, size of write buffer of flow outputs
+        * stats -- bool, if keep NetFlow-style statistics of flows
+        * active_timeout -- float, time (in seconds) after which a flow is expired since its first packet
+        * idle_timeout -- float, time (in seconds) after which a flow is expired since its last packet
+        * export -- function, called with `FlowRecord` of each flow as it expires
 
     """
+    from pcapkit.foundation.traceflow import ACTIVE_TIMEOUT, BUFFER_SIZE, FILE_LIMIT, IDLE_TIMEOUT, TraceFlow
+
     str_check(fout or '', format or '')
-    return TraceFlow(fout=fout, format=format, byteorder=byteorder, nanosecond=nanosecond)
+    int_check(max_files or 0, buffering or 0)
+    bool_check(stats)
+    return TraceFlow(fout=fout, format=format, byteorder=byteorder, nanosecond=nanosecond,
+                     max_files=max_files or FILE_LIMIT, buffering=buffering or BUFFER_SIZE,
+                     stats=stats, export=export, active_timeout=active_timeout or ACTIVE_TIMEOUT,
+                     idle_timeout=idle_timeout or IDLE_TIMEOUT)
+
+
+def columns(fin=None, fout=None, *, capacity=None, batch_size=None):
+    """Export per-frame fields of a PCAP file as NumPy columns.
+
+    Keyword arguments:
+        * fin -- str, file name to be read; if file not exist, raise an error
+        * fout -- str, file name to be written, i.e. `.npy` or `.npz` file (default is None, i.e. not saved)
+        * capacity -- int, initial capacity of column arrays (in frames)
+        * batch_size -- int, number of frames filled into column arrays at once
+
+    Returns:
+        * Columns -- a Columns object from `pcapkit.foundation.columns`
+
+    """
+    from pcapkit.foundation.columns import BATCH_SIZE, CAPACITY, Columns
+    from pcapkit.foundation.extraction import Extractor
+
+    str_check(fin or '', fout or '')
+    int_check(capacity or 0, batch_size or 0)
+
+    table = Columns(capacity=capacity or CAPACITY, batch_size=batch_size or BATCH_SIZE)
+    extractor = Extractor(fin=fin, store=False, nofile=True, auto=False, layer='Transport')
+    table.extend(extractor)
+
+    if fout is not None:
+        table.save(fout)
+    return table
+
+
+def catalog(database='catalog.db', fin=None, *, batch_size=None):
+    """Ingest PCAP files into a SQLite-indexed capture catalog.
+
+    Positional arguments:
+        * database -- str, database file name
+
+    Keyword arguments:
+        * fin -- str or list<str>, file name(s) to be ingested (default is None, i.e. open only)
+        * batch_size -- int, number of frames inserted at once
+
+    Returns:
+        * Catalog -- a Catalog object from `pcapkit.foundation.catalog`
+
+    """
+    from pcapkit.foundation.catalog import BATCH_SIZE, Catalog
+
+    if isinstance(fin, str):
+        fin = [fin]
+    str_check(database, *(fin or list()))
+    int_check(batch_size or 0)
+
+    table = Catalog(database, batch_size=batch_size or BATCH_SIZE)
+    if fin:
+        table.ingest(*fin)
+    return table
+
+
+def merge(files, fout, *, dedup=None, byteorder=None, nanosecond=None, buffering=None):
+    """Merge PCAP files into one time-ordered PCAP file.
+
+    Positional arguments:
+        * files -- iterable<str>, PCAP file names
+        * fout -- str, output file name
+
+    Keyword arguments:
+        * dedup -- float, time window (in seconds) for suppression of exact
+                        duplicate packets (default is None, i.e. no suppression)
+        * byteorder -- str, output file byte order (default is None, i.e. as first input)
+        * nanosecond -- bool, nanosecond-resolution output file flag
+                        (default is None, i.e. if any input is of nanosecond resolution)
+        * buffering -- int, size of read blocks of each input
+
+    Returns:
+        * Info -- merge report from `pcapkit.foundation.merge`
+
+    """
+    from pcapkit.foundation.merge import merge as merge2
+
+    files = list(files)
+    str_check(fout, byteorder or '', *files)
+    int_check(buffering or 0)
+
+    return merge2(files, fout, dedup=dedup, byteorder=byteorder,
+                  nanosecond=nanosecond, buffering=buffering)
+
+
+def split(fin, fout=None, *, by='count', limit, buffering=None):
+    """Split a PCAP file by size, time or frame count.
+
+    Positional arguments:
+        * fin -- str, file name to be read
+        * fout -- str, prefix of output file names, i.e. `{fout}_{index:05d}.pcap`
+                        (default is None, i.e. input file name without extension)
+
+    Keyword arguments:
+        * by -- str, criterion of rotation
+                        <keyword> 'size' / 'time' / 'count'
+        * limit -- int / float, max size of output files (in bytes), time span of
+                        output files (in seconds), or max number of frames of output files
+        * buffering -- int, size of read blocks
+
+    Returns:
+        * Info -- split report from `pcapkit.foundation.split`
+
+    """
+    from pcapkit.foundation.split import split as split2
+
+    str_check(fin, fout or '', by)
+    int_check(buffering or 0)
+
+    return split2(fin, fout, by=by, limit=limit, buffering=buffering)
+
+
+def extract_many(paths, *, workers=None, reducer=None, initial=None, **kwargs):
+    """Extract PCAP files in a process pool.
+
+    Positional arguments:
+        * paths -- iterable<str>, PCAP file names
+
+    Keyword arguments:
+        * workers -- int, number of worker processes (default is None, i.e. number of CPUs)
+        * reducer -- function, aggregate results, i.e. `reducer(total, result)`,
+                        e.g. `pcapkit.foundation.batch.summarise`
+                        (default is None, i.e. results streamed back as iterator)
+        * initial -- object, initial value of aggregation (default is None, i.e. empty
+                        summary for `summarise`, or else first result)
+        * kwargs -- extraction & reassembly & trace settings, as in `extract`
+
+    Returns:
+        * iterator<Info> -- results of files in order of completion (if no `reducer`)
+        * object -- aggregation of results (if `reducer` given)
+
+    """
+    from pcapkit.foundation.batch import extract_many as extract_many2
+
+    paths = list(paths)
+    str_check(*paths)
+    int_check(workers or 0)
+
+    return extract_many2(paths, workers=workers, reducer=reducer, initial=initial, **kwargs)
@@ -5,18 +5,18 @@
 described in Internet Protocol Suite.
 
 """
-# Internet Protocol Suite
-from pcapkit.ipsuite.link import *
-from pcapkit.ipsuite.internet import *
-from pcapkit.ipsuite.transport import *
-from pcapkit.ipsuite.application import *
-
-# File Specific Headers
-from pcapkit.ipsuite.pcap import *
-
-# Abstract Base Class
-from pcapkit.ipsuite.protocol import Protocol as IPSProtocol
+from pcapkit.utilities.lazy import lazy_loader
 
 __all__ = [
     'IPSHeader', 'IPSFrame'                     # PCAP Headers
 ]
+
+# lazy attribute loading (PEP 562)
+__getattr__, __dir__ = lazy_loader(__name__, {
+    # File Specific Headers
+    'IPSHeader': 'pcapkit.ipsuite.pcap',
+    'IPSFrame': 'pcapkit.ipsuite.pcap',
+
+    # Abstract Base Class
+    'IPSProtocol': 'pcapkit.ipsuite.protocol:Protocol',
+})
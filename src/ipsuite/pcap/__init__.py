@@ -5,7 +5,12 @@
 PCAP files, including global header and frame header.
 
 """
-from pcapkit.ipsuite.pcap.header import Header as IPSHeader
-from pcapkit.ipsuite.pcap.frame import Frame as IPSFrame
+from pcapkit.utilities.lazy import lazy_loader
 
 __all__ = ['IPSHeader', 'IPSFrame']
+
+# lazy attribute loading (PEP 562)
+__getattr__, __dir__ = lazy_loader(__name__, {
+    'IPSHeader': 'pcapkit.ipsuite.pcap.header:Header',
+    'IPSFrame': 'pcapkit.ipsuite.pcap.frame:Frame',
+})
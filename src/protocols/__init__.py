@@ -5,24 +5,7 @@
 with detailed implementation and methods.
 
 """
-# Base Class for Protocols
-from pcapkit.protocols.protocol import Protocol
-
-# Utility Classes for Protocols
-from pcapkit.protocols.raw import *
-from pcapkit.protocols.null import *
-from pcapkit.protocols.pcap import *
-
-# Protocols & Macros
-from pcapkit.protocols.link import *
-from pcapkit.protocols.internet import *
-from pcapkit.protocols.transport import *
-from pcapkit.protocols.application import *
-
-# Deprecated / Base Protocols
-from pcapkit.protocols.internet.ip import IP
-from pcapkit.protocols.internet.ipsec import IPsec
-from pcapkit.protocols.application.http import HTTP
+from pcapkit.utilities.lazy import lazy_loader
 
 # TODO: Implement specified classes for MAC and IP addresses.
 __all__ = [
@@ -38,3 +21,47 @@ __all__ = [
     'TCP', 'UDP',                                       # Transport Layer
     'HTTP',                                             # Application Layer
 ]
+
+# lazy attribute loading (PEP 562)
+__getattr__, __dir__ = lazy_loader(__name__, {
+    # Base Class for Protocols
+    'Protocol': 'pcapkit.protocols.protocol',
+
+    # Utility Classes for Protocols
+    'Raw': 'pcapkit.protocols.raw',
+    'NoPayload': 'pcapkit.protocols.null',
+    'Frame': 'pcapkit.protocols.pcap',
+    'Header': 'pcapkit.protocols.pcap',
+
+    # Protocols & Macros
+    'LINKTYPE': 'pcapkit.protocols.link',
+    'ARP': 'pcapkit.protocols.link',
+    'DRARP': 'pcapkit.protocols.link',
+    'Ethernet': 'pcapkit.protocols.link',
+    'InARP': 'pcapkit.protocols.link',
+    'L2TP': 'pcapkit.protocols.link',
+    'OSPF': 'pcapkit.protocols.link',
+    'RARP': 'pcapkit.protocols.link',
+    'VLAN': 'pcapkit.protocols.link',
+    'ETHERTYPE': 'pcapkit.protocols.internet',
+    'AH': 'pcapkit.protocols.internet',
+    'IPv4': 'pcapkit.protocols.internet',
+    'IPv6': 'pcapkit.protocols.internet',
+    'IPX': 'pcapkit.protocols.internet',
+    'HIP': 'pcapkit.protocols.internet',
+    'HOPOPT': 'pcapkit.protocols.internet',
+    'IPv6_Frag': 'pcapkit.protocols.internet',
+    'IPv6_Opts': 'pcapkit.protocols.internet',
+    'IPv6_Route': 'pcapkit.protocols.internet',
+    'MH': 'pcapkit.protocols.internet',
+    'TP_PROTO': 'pcapkit.protocols.transport',
+    'TCP': 'pcapkit.protocols.transport',
+    'UDP': 'pcapkit.protocols.transport',
+    'HTTPv1': 'pcapkit.protocols.application',
+    'HTTPv2': 'pcapkit.protocols.application',
+
+    # Deprecated / Base Protocols
+    'IP': 'pcapkit.protocols.internet.ip',
+    'IPsec': 'pcapkit.protocols.internet.ipsec',
+    'HTTP': 'pcapkit.protocols.application.http',
+})
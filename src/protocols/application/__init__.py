@@ -6,16 +6,21 @@ protocols in application layer, with detailed
 implementation and methods.
 
 """
-# Base Class for Internet Layer
-from pcapkit.protocols.application.application import Application
-
-# Utility Classes for Protocols
-from pcapkit.protocols.application.httpv1 import HTTPv1
-from pcapkit.protocols.application.httpv2 import HTTPv2
-
-# Deprecated / Base Classes
-from pcapkit.protocols.application.http import HTTP
+from pcapkit.utilities.lazy import lazy_loader
 
 # TODO: Implements BGP, DHCP, DNS, FTP, IMAP, IDAP, MQTT, NNTP, NTP,
 # #     ONC:RPC, POP, RIP, RTP, SIP, SMTP, SNMP, SSH, SSL, TELNET, TLS, XMPP.
 __all__ = ['HTTPv1', 'HTTPv2']
+
+# lazy attribute loading (PEP 562)
+__getattr__, __dir__ = lazy_loader(__name__, {
+    # Base Class for Internet Layer
+    'Application': 'pcapkit.protocols.application.application',
+
+    # Utility Classes for Protocols
+    'HTTPv1': 'pcapkit.protocols.application.httpv1',
+    'HTTPv2': 'pcapkit.protocols.application.httpv2',
+
+    # Deprecated / Base Classes
+    'HTTP': 'pcapkit.protocols.application.http',
+})
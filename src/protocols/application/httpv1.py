@@ -18,6 +18,7 @@ HTTP/VERSION CODE DESP \r\n :==: RESPONSE LINE
 <body>                      :==: RESPONSE BODY (optional)
 
 """
+import codecs
 import re
 
 from pcapkit.corekit.infoclass import Info
@@ -30,6 +31,7 @@ __all__ = ['HTTPv1']
 _RE_METHOD = re.compile(rb'GET|HEAD|POST|PUT|DELETE|CONNECT|OPTIONS|TRACE')
 _RE_VERSION = re.compile(rb'HTTP/(?P<version>\d\.\d)')
 _RE_STATUS = re.compile(rb'\d{3}')
+_RE_CHARSET = re.compile(r'charset\s*=\s*"?(?P<charset>[^\s;"]+)', re.IGNORECASE)
 
 
 class HTTPv1(HTTP):
@@ -58,6 +60,7 @@ class HTTPv1(HTTP):
         * _read_binary -- read bytes and convert into binaries
         * _read_http_header -- read HTTP/1.* header
         * _read_http_body -- read HTTP/1.* body
+        * _read_http_charset -- read charset from Content-Type header
 
     """
     ##########################################################################
@@ -93,7 +96,8 @@ class HTTPv1(HTTP):
             raise ProtocolError('HTTP: invalid format', quiet=True)
 
         header_unpacked, http_receipt = self._read_http_header(header)
-        body_unpacked = self._read_http_body(body) or None
+        charset = self._read_http_charset(header_unpacked)
+        body_unpacked = self._read_http_body(body, charset=charset) or None
 
         http = dict(
             receipt=http_receipt,
@@ -183,6 +187,30 @@ class HTTPv1(HTTP):
 
         return header, receipt
 
-    def _read_http_body(self, body):
+    def _read_http_body(self, body, *, charset=None):
         """Read HTTP/1.* body."""
-        return self.decode(body)
+        return self.decode(body, encoding=charset)
+
+    def _read_http_charset(self, header):
+        """Read charset from Content-Type header.
+
+        Positional arguments:
+            * header -- dict, parsed HTTP/1.* header
+
+        Returns:
+            * str -- charset of HTTP/1.* body (None if not given or unknown)
+
+        """
+        for key, value in header.items():
+            if key.lower() != 'content-type':
+                continue
+            if isinstance(value, tuple):
+                value = value[-1]
+            match = _RE_CHARSET.search(value)
+            if match is None:
+                return None
+            try:
+                return codecs.lookup(match.group('charset')).name
+            except LookupError:
+                return None
+        return None
@@ -6,29 +6,7 @@ in internet layer, with detailed implementation and
 methods.
 
 """
-# Base Class for Internet Layer
-from pcapkit.protocols.internet.internet import Internet
-
-# Utility Classes for Protocols
-from pcapkit.protocols.internet.ah import AH
-from pcapkit.protocols.internet.ipv4 import IPv4
-from pcapkit.protocols.internet.ipv6 import IPv6
-from pcapkit.protocols.internet.ipx import IPX
-
-# IPv6 Extension Headers
-from pcapkit.protocols.internet.hip import HIP
-from pcapkit.protocols.internet.hopopt import HOPOPT
-from pcapkit.protocols.internet.ipv6_frag import IPv6_Frag
-from pcapkit.protocols.internet.ipv6_opts import IPv6_Opts
-from pcapkit.protocols.internet.ipv6_route import IPv6_Route
-from pcapkit.protocols.internet.mh import MH
-
-# Ethertype IEEE 802 Numbers
-from pcapkit.protocols.internet.internet import ETHERTYPE
-
-# Deprecated / Base Classes
-from pcapkit.protocols.internet.ip import IP
-from pcapkit.protocols.internet.ipsec import IPsec
+from pcapkit.utilities.lazy import lazy_loader
 
 # TODO: Implements ECN, ESP, ICMP, ICMPv6, IGMP, Shim6.
 __all__ = [
@@ -37,3 +15,30 @@ __all__ = [
     'HIP', 'HOPOPT', 'IPv6_Frag',
     'IPv6_Opts', 'IPv6_Route', 'MH',                    # IPv6 Extension Header
 ]
+
+# lazy attribute loading (PEP 562)
+__getattr__, __dir__ = lazy_loader(__name__, {
+    # Base Class for Internet Layer
+    'Internet': 'pcapkit.protocols.internet.internet',
+
+    # Utility Classes for Protocols
+    'AH': 'pcapkit.protocols.internet.ah',
+    'IPv4': 'pcapkit.protocols.internet.ipv4',
+    'IPv6': 'pcapkit.protocols.internet.ipv6',
+    'IPX': 'pcapkit.protocols.internet.ipx',
+
+    # IPv6 Extension Headers
+    'HIP': 'pcapkit.protocols.internet.hip',
+    'HOPOPT': 'pcapkit.protocols.internet.hopopt',
+    'IPv6_Frag': 'pcapkit.protocols.internet.ipv6_frag',
+    'IPv6_Opts': 'pcapkit.protocols.internet.ipv6_opts',
+    'IPv6_Route': 'pcapkit.protocols.internet.ipv6_route',
+    'MH': 'pcapkit.protocols.internet.mh',
+
+    # Ethertype IEEE 802 Numbers
+    'ETHERTYPE': 'pcapkit.protocols.internet.internet',
+
+    # Deprecated / Base Classes
+    'IP': 'pcapkit.protocols.internet.ip',
+    'IPsec': 'pcapkit.protocols.internet.ipsec',
+})
@@ -11,6 +11,7 @@ AH, IP, IPsec, IPv4, IPv6, IPX, and etc.
 from pcapkit._common.ethertype import EtherType as ETHERTYPE
 from pcapkit.corekit.protochain import ProtoChain
 from pcapkit.protocols.protocol import Protocol
+from pcapkit.protocols.registry import lookup
 from pcapkit.protocols.transport.transport import TP_PROTO
 from pcapkit.utilities.decorators import beholder
 
@@ -139,32 +140,10 @@ class Internet(Protocol):
         """
         if length == 0:
             from pcapkit.protocols.null import NoPayload as Protocol
-        elif self._sigterm or proto == 59:
+        elif self._sigterm:
             from pcapkit.protocols.raw import Raw as Protocol
-        elif proto == 51:
-            from pcapkit.protocols.internet.ah import AH as Protocol
-        elif proto == 139:
-            from pcapkit.protocols.internet.hip import HIP as Protocol
-        elif proto == 0:
-            from pcapkit.protocols.internet.hopopt import HOPOPT as Protocol
-        elif proto == 44:
-            from pcapkit.protocols.internet.ipv6_frag import IPv6_Frag as Protocol
-        elif proto == 60:
-            from pcapkit.protocols.internet.ipv6_opts import IPv6_Opts as Protocol
-        elif proto == 43:
-            from pcapkit.protocols.internet.ipv6_route import IPv6_Route as Protocol
-        elif proto == 135:
-            from pcapkit.protocols.internet.mh import MH as Protocol
-        elif proto == 4:
-            from pcapkit.protocols.internet.ipv4 import IPv4 as Protocol
-        elif proto == 41:
-            from pcapkit.protocols.internet.ipv6 import IPv6 as Protocol
-        elif proto == 6:
-            from pcapkit.protocols.transport.tcp import TCP as Protocol
-        elif proto == 17:
-            from pcapkit.protocols.transport.udp import UDP as Protocol
         else:
-            from pcapkit.protocols.raw import Raw as Protocol
+            Protocol = lookup('Internet', proto)
         next_ = Protocol(self._file, length, version=version, extension=extension,
                          error=self._onerror, layer=self._exlayer, protocol=self._exproto)
         return next_
@@ -5,21 +5,7 @@
 link layer, with detailed implementation and methods.
 
 """
-# Base Class for Link Layer
-from pcapkit.protocols.link.link import Link
-
-# Utility Classes for Protocols
-from pcapkit.protocols.link.arp import ARP
-from pcapkit.protocols.link.arp import ARP as InARP
-from pcapkit.protocols.link.ethernet import Ethernet
-from pcapkit.protocols.link.l2tp import L2TP
-from pcapkit.protocols.link.ospf import OSPF
-from pcapkit.protocols.link.rarp import RARP
-from pcapkit.protocols.link.rarp import RARP as DRARP
-from pcapkit.protocols.link.vlan import VLAN
-
-# Link-Layer Header Type Values
-from pcapkit.protocols.link.link import LINKTYPE
+from pcapkit.utilities.lazy import lazy_loader
 
 # TODO: Implements DSL, EAPOL, FDDI, ISDN, NDP, PPP.
 __all__ = [
@@ -27,3 +13,22 @@ __all__ = [
     'ARP', 'DRARP', 'Ethernet', 'InARP', 'L2TP', 'OSPF', 'RARP', 'VLAN',
                                             # Link Layer Protocols
 ]
+
+# lazy attribute loading (PEP 562)
+__getattr__, __dir__ = lazy_loader(__name__, {
+    # Base Class for Link Layer
+    'Link': 'pcapkit.protocols.link.link',
+
+    # Utility Classes for Protocols
+    'ARP': 'pcapkit.protocols.link.arp',
+    'InARP': 'pcapkit.protocols.link.arp:ARP',
+    'Ethernet': 'pcapkit.protocols.link.ethernet',
+    'L2TP': 'pcapkit.protocols.link.l2tp',
+    'OSPF': 'pcapkit.protocols.link.ospf',
+    'RARP': 'pcapkit.protocols.link.rarp',
+    'DRARP': 'pcapkit.protocols.link.rarp:RARP',
+    'VLAN': 'pcapkit.protocols.link.vlan',
+
+    # Link-Layer Header Type Values
+    'LINKTYPE': 'pcapkit.protocols.link.link',
+})
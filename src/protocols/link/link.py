@@ -11,6 +11,7 @@ L2TP, OSPF, RARP/DRARP and etc.
 from pcapkit._common.linktype import LinkType as LINKTYPE
 from pcapkit.protocols.internet.internet import ETHERTYPE
 from pcapkit.protocols.protocol import Protocol
+from pcapkit.protocols.registry import lookup
 
 __all__ = ['Link', 'LINKTYPE']
 
@@ -102,20 +103,8 @@ class Link(Protocol):
             from pcapkit.protocols.null import NoPayload as Protocol
         elif self._sigterm:
             from pcapkit.protocols.raw import Raw as Protocol
-        elif proto == 0x0806:
-            from pcapkit.protocols.link.arp import ARP as Protocol
-        elif proto == 0x8035:
-            from pcapkit.protocols.link.rarp import RARP as Protocol
-        elif proto == 0x8100:
-            from pcapkit.protocols.link.vlan import VLAN as Protocol
-        elif proto == 0x0800:
-            from pcapkit.protocols.internet.ipv4 import IPv4 as Protocol
-        elif proto == 0x86DD:
-            from pcapkit.protocols.internet.ipv6 import IPv6 as Protocol
-        elif proto == 0x8137:
-            from pcapkit.protocols.internet.ipx import IPX as Protocol
         else:
-            from pcapkit.protocols.raw import Raw as Protocol
+            Protocol = lookup('Link', proto)
         next_ = Protocol(self._file, length, error=self._onerror,
                          layer=self._exlayer, protocol=self._exproto)
         return next_
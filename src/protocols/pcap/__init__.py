@@ -5,7 +5,12 @@
 PCAP files, including global header and frame header.
 
 """
-from pcapkit.protocols.pcap.frame import Frame
-from pcapkit.protocols.pcap.header import Header
+from pcapkit.utilities.lazy import lazy_loader
 
 __all__ = ['Frame', 'Header']
+
+# lazy attribute loading (PEP 562)
+__getattr__, __dir__ = lazy_loader(__name__, {
+    'Frame': 'pcapkit.protocols.pcap.frame',
+    'Header': 'pcapkit.protocols.pcap.header',
+})
@@ -19,14 +19,9 @@ import os
 
 from pcapkit.corekit.infoclass import Info
 from pcapkit.protocols.protocol import Protocol
+from pcapkit.protocols.registry import lookup
 from pcapkit.utilities.decorators import beholder
 
-###############################################################################
-# from pcapkit.protocols.link import Ethernet
-# from pcapkit.protocols.internet import IPv4
-# from pcapkit.protocols.internet import IPv6
-# from pcapkit.protocols.raw import Raw
-###############################################################################
 
 __all__ = ['Frame']
 
@@ -279,14 +274,7 @@ class Frame(Protocol):
             * IPv6 (internet layer)
 
         """
-        if proto == 1:
-            from pcapkit.protocols.link import Ethernet as Protocol
-        elif proto == 228:
-            from pcapkit.protocols.internet import IPv4 as Protocol
-        elif proto == 229:
-            from pcapkit.protocols.internet import IPv6 as Protocol
-        else:
-            from pcapkit.protocols.raw import Raw as Protocol
+        Protocol = lookup('Frame', proto)
         next_ = Protocol(self._file, length, error=error,
                          layer=self._exlayer, protocol=self._exproto)
         return next_
@@ -191,7 +191,7 @@ class Header(Protocol):
             * str -- link layer protocol name
 
         """
-        _byte = self._read_unpack(4, lilendian=True)
+        _byte = self._read_unpack(size, lilendian=(self._byte == 'little'))
         _prot = LINKTYPE.get(_byte)
         return _prot
 
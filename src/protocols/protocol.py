@@ -22,7 +22,6 @@ import sys
 import textwrap
 import urllib
 
-import chardet
 from pcapkit.corekit.infoclass import Info
 from pcapkit.corekit.protochain import ProtoChain
 from pcapkit.utilities.decorators import beholder, seekset
@@ -40,6 +39,23 @@ __all__ = ['Protocol']
 # readable characters' order list
 readable = [ord(char) for char in filter(lambda char: not char.isspace(), string.printable)]
 
+# regular expression special characters
+metachar = re.compile(r'[\\^$.|?*+()\[\]{}]')
+
+# sample size for character encoding detection
+DETECT_SAMPLE = 4096
+
+
+# precomputed termination thresholds, i.e. (class, layer, protocol) -> flag
+_THRESHOLD = dict()
+
+
+@functools.lru_cache(maxsize=1024)
+def detect_encoding(sample):
+    """Detect character encoding of bytes sample with `chardet`."""
+    import chardet
+    return chardet.detect(sample)['encoding']
+
 
 @functools.total_ordering
 class Protocol:
@@ -63,6 +79,9 @@ class Protocol:
         * _info -- Info, info dict of current instance
         * _next -- Protocol, payload of current instance
         * _protos -- ProtoChain, protocol chain of current instance
+        * _layers -- tuple, layer index of current instance (built on demand)
+            |--> tuple<Protocol> -- current instance and its payloads
+            |--> dict -- lowercase class names and aliases to layer positions
 
     Utilities:
         * _read_protos -- read next layer protocol type
@@ -73,6 +92,8 @@ class Protocol:
         * _decode_next_layer -- decode next layer protocol type
         * _import_next_layer -- import next layer protocol extractor
         * _check_term_threshold -- check if reached termination threshold
+        * _match_term_threshold -- match protocol class against termination threshold
+        * _index_layers -- build layer index of current instance
 
     """
     __layer__ = None
@@ -135,8 +156,19 @@ class Protocol:
 
     @staticmethod
     def decode(byte, *, encoding=None, errors='strict'):
-        """Decode bytes into str."""
-        charset = encoding or chardet.detect(byte)['encoding']
+        """Decode bytes into str.
+
+        Without `encoding` given, bytes are decoded as UTF-8 (and thus
+        ASCII) first, then with the character encoding detected from
+        (at most) the leading `DETECT_SAMPLE` bytes, which is cached.
+
+        """
+        charset = encoding
+        if not charset:
+            try:
+                return byte.decode('utf-8')
+            except UnicodeError:
+                charset = detect_encoding(bytes(byte[:DETECT_SAMPLE]))
         try:
             return byte.decode(charset or 'utf-8', errors=errors)
         except UnicodeError:
@@ -227,6 +259,15 @@ class Protocol:
         if flag or isinstance(key, Protocol):
             key = key.__index__()
 
+        # look up layer index for names
+        names = key if isinstance(key, tuple) else (key,)
+        if all(isinstance(name, str) and metachar.search(name) is None for name in names):
+            layers, index = self._index_layers()
+            found = [index[name.lower()] for name in names if name.lower() in index]
+            if found:
+                return layers[min(found)]
+            raise ProtocolNotFound(f"Layer {key!r} not in Frame")
+
         # make regex for tuple indexes
         if isinstance(key, tuple):
             key = r'|'.join(map(re.escape, key))
@@ -432,14 +473,60 @@ class Protocol:
         return next_
 
     def _check_term_threshold(self):
-        """Check if reached termination threshold."""
+        """Check if reached termination threshold.
+
+        Results are precomputed per protocol class and threshold,
+        i.e. `(layer, protocol)` given at initialisation.
+
+        """
+        key = (type(self), self._exlayer, self._exproto)
+        try:
+            return _THRESHOLD[key]
+        except KeyError:
+            pass
+        except TypeError:   # unhashable threshold
+            return self._match_term_threshold()
+        flag = _THRESHOLD[key] = self._match_term_threshold()
+        return flag
+
+    def _match_term_threshold(self):
+        """Match protocol class against termination threshold."""
         index = self.__index__()
-        layer = self.__layer__ or ''
+        names = frozenset(name.lower() for name in (index if isinstance(index, tuple) else (index,)))
+        layer = (self.__layer__ or '').lower()
 
-        pattern = r'|'.join(index) if isinstance(index, tuple) else index
         iterable = self._exproto if isinstance(self._exproto, tuple) else (self._exproto,)
+        protocols = frozenset(proto.lower() for proto in iterable)
 
-        layer_match = re.fullmatch(layer, self._exlayer, re.IGNORECASE)
-        protocol_match = filter(lambda string: re.fullmatch(pattern, string, re.IGNORECASE), iterable)
+        return layer == self._exlayer.lower() or not names.isdisjoint(protocols)
+
+    def _index_layers(self):
+        """Build layer index of current instance.
+
+        Returns:
+            * tuple<Protocol> -- current instance and its payloads
+            * dict -- lowercase class names and aliases to layer positions
+
+        """
+        layers = getattr(self, '_layers', None)
+        if layers is not None:
+            return layers
+
+        from pcapkit.protocols.null import NoPayload
+        chain = [self]
+        if not isinstance(self, NoPayload):
+            payload = self._next
+            while not isinstance(payload, NoPayload):
+                chain.append(payload)
+                payload = payload.payload
+
+        index = dict()
+        for (position, layer) in enumerate(chain):
+            index.setdefault(type(layer).__name__.lower(), position)
+            try:
+                index.setdefault(layer.alias.lower(), position)
+            except Exception:   # alias not available
+                pass
 
-        return bool(list(protocol_match) or layer_match)
+        self._layers = (tuple(chain), index)
+        return self._layers
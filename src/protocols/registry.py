@@ -0,0 +1,110 @@
+# -*- coding: utf-8 -*-
+"""protocol registry
+
+`pcapkit.protocols.registry` works as the dispatch table
+of next layer protocols. Protocol classes are kept in the
+`PROTOCOL` registry, which maps the dispatching layer and
+protocol number, i.e. link-layer header type (`LINKTYPE`)
+for PCAP frames, ethertype (`ETHERTYPE`) for link layer
+and IP protocol number (`TP_PROTO`) for internet layer,
+to next layer protocol classes. Classes may be given as
+`'module:class'` strings, which are imported only once on
+first lookup. Third-party protocols may be added through
+`register`, and unregistered protocol numbers fall back to
+`Raw`.
+
+"""
+import importlib
+
+__all__ = ['lookup', 'register', 'PROTOCOL']
+
+
+def lookup(layer, proto):
+    """Lookup next layer protocol class.
+
+    Positional arguments:
+        * layer -- str, dispatching layer
+                        <keyword> 'Frame' / 'Link' / 'Internet'
+        * proto -- int, protocol number
+
+    Returns:
+        * type -- next layer protocol class, or `Raw` if not registered
+
+    """
+    try:
+        return _RESOLVED.get(layer, dict())[proto]
+    except KeyError:
+        pass
+    except TypeError:   # unhashable protocol number
+        return _resolve(_RAW)
+
+    protocol = _resolve(PROTOCOL.get(layer, dict()).get(proto, _RAW))
+    _RESOLVED.setdefault(layer, dict())[proto] = protocol
+    return protocol
+
+
+def register(layer, proto, protocol):
+    """Register a next layer protocol.
+
+    Positional arguments:
+        * layer -- str, dispatching layer
+                        <keyword> 'Frame' / 'Link' / 'Internet'
+        * proto -- int, protocol number, i.e. link-layer header type,
+                        ethertype or IP protocol number
+        * protocol -- type or str, protocol class, or `'module:class'`
+                        to be imported on first lookup
+
+    """
+    PROTOCOL.setdefault(layer, dict())[proto] = protocol
+    _RESOLVED.get(layer, dict()).pop(proto, None)
+
+
+def _resolve(protocol):
+    """Import protocol class from `'module:class'` string."""
+    if not isinstance(protocol, str):
+        return protocol
+    module, name = protocol.split(':')
+    return getattr(importlib.import_module(module), name)
+
+
+# fallback protocol for unregistered protocol numbers
+_RAW = 'pcapkit.protocols.raw:Raw'
+
+# resolved protocol classes, i.e. layer -> protocol number -> class
+_RESOLVED = dict()
+
+# next layer protocols, i.e. layer -> protocol number -> class
+PROTOCOL = {
+    # link-layer header type (LINKTYPE)
+    'Frame': {
+        1: 'pcapkit.protocols.link.ethernet:Ethernet',          # Ethernet
+        228: 'pcapkit.protocols.internet.ipv4:IPv4',            # IPv4
+        229: 'pcapkit.protocols.internet.ipv6:IPv6',            # IPv6
+    },
+
+    # ethertype (ETHERTYPE)
+    'Link': {
+        0x0806: 'pcapkit.protocols.link.arp:ARP',               # ARP
+        0x8035: 'pcapkit.protocols.link.rarp:RARP',             # RARP
+        0x8100: 'pcapkit.protocols.link.vlan:VLAN',             # VLAN
+        0x0800: 'pcapkit.protocols.internet.ipv4:IPv4',         # IPv4
+        0x86DD: 'pcapkit.protocols.internet.ipv6:IPv6',         # IPv6
+        0x8137: 'pcapkit.protocols.internet.ipx:IPX',           # IPX
+    },
+
+    # IP protocol number (TP_PROTO)
+    'Internet': {
+        59: _RAW,                                               # IPv6-NoNxt
+        51: 'pcapkit.protocols.internet.ah:AH',                 # AH
+        139: 'pcapkit.protocols.internet.hip:HIP',              # HIP
+        0: 'pcapkit.protocols.internet.hopopt:HOPOPT',          # HOPOPT
+        44: 'pcapkit.protocols.internet.ipv6_frag:IPv6_Frag',   # IPv6-Frag
+        60: 'pcapkit.protocols.internet.ipv6_opts:IPv6_Opts',   # IPv6-Opts
+        43: 'pcapkit.protocols.internet.ipv6_route:IPv6_Route',  # IPv6-Route
+        135: 'pcapkit.protocols.internet.mh:MH',                # Mobility Header
+        4: 'pcapkit.protocols.internet.ipv4:IPv4',              # IPv4
+        41: 'pcapkit.protocols.internet.ipv6:IPv6',             # IPv6
+        6: 'pcapkit.protocols.transport.tcp:TCP',               # TCP
+        17: 'pcapkit.protocols.transport.udp:UDP',              # UDP
+    },
+}
@@ -6,18 +6,23 @@ in transport layer, with detailed implementation and
 methods.
 
 """
-# Base Class for Transport Layer
-from pcapkit.protocols.transport.transport import Transport
-
-# Utility Classes for Protocols
-from pcapkit.protocols.transport.tcp import TCP
-from pcapkit.protocols.transport.udp import UDP
-
-# Transport Layer Protocol Numbers
-from pcapkit.protocols.transport.transport import TP_PROTO
+from pcapkit.utilities.lazy import lazy_loader
 
 # TODO: Implements DCCP, RSVP, STCP.
 __all__ = [
     'TP_PROTO',     # Protocol Numbers
     'TCP', 'UDP',   # Transport Layer Protocols
 ]
+
+# lazy attribute loading (PEP 562)
+__getattr__, __dir__ = lazy_loader(__name__, {
+    # Base Class for Transport Layer
+    'Transport': 'pcapkit.protocols.transport.transport',
+
+    # Utility Classes for Protocols
+    'TCP': 'pcapkit.protocols.transport.tcp',
+    'UDP': 'pcapkit.protocols.transport.udp',
+
+    # Transport Layer Protocol Numbers
+    'TP_PROTO': 'pcapkit.protocols.transport.transport',
+})
@@ -325,7 +325,7 @@ class TCP(Transport):
         length -= _hlen
         tcp['packet'] = self._read_packet(header=_hlen, payload=length)
 
-        return self._decode_next_layer(tcp, None, length)
+        return self._decode_next_layer(tcp, (_srcp, _dstp), length)
 
     ##########################################################################
     # Data models.
@@ -66,7 +66,8 @@ class Transport(Protocol):
         """Import next layer extractor.
 
         Positional arguments:
-            * proto -- str, next layer protocol name
+            * proto -- tuple<int>, source and destination ports as hints
+                        for application layer analysis
             * length -- int, valid (not padding) length
 
         Returns:
@@ -80,7 +81,7 @@ class Transport(Protocol):
         if length == 0:
             next_ = NoPayload()
         elif self._onerror:
-            next_ = beholder_ng(analyse)(self._file, length, _termination=self._sigterm)
+            next_ = beholder_ng(analyse)(self._file, length, ports=proto, _termination=self._sigterm)
         else:
-            next_ = analyse(self._file, length, _termination=self._sigterm)
+            next_ = analyse(self._file, length, ports=proto, _termination=self._sigterm)
         return next_
@@ -125,7 +125,7 @@ class UDP(Transport):
         length = udp['len'] - 8
         udp['packet'] = self._read_packet(header=8, payload=length)
 
-        return self._decode_next_layer(udp, None, length)
+        return self._decode_next_layer(udp, (_srcp, _dstp), length)
 
     ##########################################################################
     # Data models.
@@ -6,18 +6,23 @@
 implements datagram reassembly of IP and TCP packets.
 
 """
-# Base Class for Reassembly
-from pcapkit.reassembly.reassembly import Reassembly
-from pcapkit.reassembly.ip import IP_Reassembly
-
-# Reassembly for IP
-from pcapkit.reassembly.ipv4 import IPv4_Reassembly
-from pcapkit.reassembly.ipv6 import IPv6_Reassembly
-
-# Reassembly for TCP
-from pcapkit.reassembly.tcp import TCP_Reassembly
+from pcapkit.utilities.lazy import lazy_loader
 
 __all__ = [
     'IPv4_Reassembly', 'IPv6_Reassembly',   # IP Reassembly
     'TCP_Reassembly',                       # TCP Reassembly
 ]
+
+# lazy attribute loading (PEP 562)
+__getattr__, __dir__ = lazy_loader(__name__, {
+    # Base Class for Reassembly
+    'Reassembly': 'pcapkit.reassembly.reassembly',
+    'IP_Reassembly': 'pcapkit.reassembly.ip',
+
+    # Reassembly for IP
+    'IPv4_Reassembly': 'pcapkit.reassembly.ipv4',
+    'IPv6_Reassembly': 'pcapkit.reassembly.ipv6',
+
+    # Reassembly for TCP
+    'TCP_Reassembly': 'pcapkit.reassembly.tcp',
+})
@@ -70,13 +70,26 @@ Algorithm:
     }
 
 """
+import collections
 import copy
 
 from pcapkit.corekit.infoclass import Info
 from pcapkit.reassembly.reassembly import Reassembly
 
 
-__all__ = ['IP_Reassembly']
+__all__ = ['IP_Reassembly', 'IP_Fragment']
+
+# compact IP fragment record for trusted callers
+IP_Fragment = collections.namedtuple('IP_Fragment', [
+    'bufid',        # buffer identifier
+    'num',          # original packet range number
+    'fo',           # fragment offset
+    'ihl',          # internet header length
+    'mf',           # more fragment flag
+    'tl',           # total length, header includes
+    'header',       # raw bytearray type header
+    'payload',      # raw bytearray type payload
+])
 
 
 class IP_Reassembly(Reassembly):
@@ -95,6 +108,8 @@ class IP_Reassembly(Reassembly):
         * fetch -- fetch datagram
         * index -- return datagram index
         * run -- run automatically
+        * checkpoint -- checkpoint reassembly buffers
+        * restore -- restore reassembly buffers
 
     Attributes:
         * _strflg -- bool, strict mode flag
@@ -137,7 +152,8 @@ class IP_Reassembly(Reassembly):
             )
 
         # append packet index
-        self._buffer[BUFID]['index'].append(info.num)
+        self._frnum = info.num
+        self._buffer[BUFID]['index'].append(self._offset + info.num)
 
         # put data into data buffer
         start = FO
@@ -147,11 +163,12 @@ class IP_Reassembly(Reassembly):
         # set RCVBT bits (in 8 octets)
         start = FO // 8
         stop = FO // 8 + (TL - IHL + 7) // 8
-        self._buffer[BUFID]['RCVBT'][start:stop] = b'\x01' * (stop - start + 1)
+        self._buffer[BUFID]['RCVBT'][start:stop] = b'\x01' * (stop - start)
 
         # get total data length (header excludes)
         if not MF:
-            TDL = TL - IHL + FO
+            self._buffer[BUFID]['TDL'] = TL - IHL + FO
+        TDL = self._buffer[BUFID]['TDL']
 
         # put header into header buffer
         if not FO:
@@ -164,14 +181,15 @@ class IP_Reassembly(Reassembly):
             self._dtgram += self.submit(self._buffer[BUFID], checked=True)
             del self._buffer[BUFID]
 
-    def submit(self, buf, *, checked=False):
+    def submit(self, buf, *, bufid=None, checked=False):
         """Submit reassembled payload.
 
         Positional arguments:
             * buf -- dict, buffer dict of reassembled packets
 
         Keyword arguments:
-            * bufid -- tuple, buffer identifier
+            * bufid -- tuple, buffer identifier (unused, as passed by `fetch`)
+            * checked -- bool, if datagram is known to be reassembled in whole
 
         Returns:
             * list -- reassembled packets
@@ -208,6 +226,8 @@ class IP_Reassembly(Reassembly):
                     header=header or None,
                     payload=tuple(data) or None,
                 )
+            else:
+                return []
         # if datagram is reassembled in whole
         else:
             payload = datagram[:TDL]
@@ -217,3 +237,46 @@ class IP_Reassembly(Reassembly):
                 packet=(bytes(header) + bytes(payload)) or None,
             )
         return [packet]
+
+    ##########################################################################
+    # Utilities.
+    ##########################################################################
+
+    def _dump_buffer(self, buf):
+        """Convert buffer into built-in types.
+
+        Positional arguments:
+            * buf -- dict, buffer dict of pending packets
+
+        Returns:
+            * tuple -- TDL, RCVBT, index, header & datagram, where
+                        trailing unreceived blocks are stripped
+
+        """
+        RCVBT = bytes(buf['RCVBT']).rstrip(b'\x00')
+        return (
+            buf['TDL'],
+            RCVBT,
+            tuple(buf['index']),
+            bytes(buf['header']),
+            bytes(buf['datagram'][:len(RCVBT)*8]),
+        )
+
+    def _load_buffer(self, buf):
+        """Convert built-in types back into buffer.
+
+        Positional arguments:
+            * buf -- tuple, buffer in built-in types made by `_dump_buffer`
+
+        Returns:
+            * dict -- buffer dict of pending packets
+
+        """
+        TDL, RCVBT, index, header, datagram = buf
+        return dict(
+            TDL=TDL,
+            RCVBT=bytearray(RCVBT).ljust(8191, b'\x00'),
+            index=list(index),
+            header=bytearray(header),
+            datagram=bytearray(datagram).ljust(65535, b'\x00'),
+        )
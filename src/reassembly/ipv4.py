@@ -100,6 +100,8 @@ class IPv4_Reassembly(IP_Reassembly):
         * fetch -- fetch datagram
         * index -- return datagram index
         * run -- run automatically
+        * checkpoint -- checkpoint reassembly buffers
+        * restore -- restore reassembly buffers
 
     Attributes:
         * _strflg -- bool, strict mode flag
@@ -101,6 +101,8 @@ class IPv6_Reassembly(IP_Reassembly):
         * fetch -- fetch datagram
         * index -- return datagram index
         * run -- run automatically
+        * checkpoint -- checkpoint reassembly buffers
+        * restore -- restore reassembly buffers
 
     Attributes:
         * _strflg -- bool, strict mode flag
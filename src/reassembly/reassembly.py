@@ -10,8 +10,10 @@ implements datagram reassembly of IP and TCP packets.
 """
 import abc
 import copy
+import ipaddress
 
 from pcapkit.corekit.infoclass import Info
+from pcapkit.utilities.exceptions import ProtocolError
 from pcapkit.utilities.validations import frag_check, int_check
 
 __all__ = ['Reassembly']
@@ -33,12 +35,23 @@ class Reassembly(object):
         * fetch -- fetch datagram
         * index -- return datagram index
         * run -- run automatically
+        * checkpoint -- checkpoint reassembly buffers
+        * restore -- restore reassembly buffers
 
     Attributes:
         * _strflg -- bool, strict mode flag
         * _newflg -- bool, if new packets reassembled flag
         * _buffer -- dict, buffer field
         * _dtgram -- list, reassembled datagram
+        * _fetchd -- tuple, fetched datagram, i.e. reassembled & pending ones
+        * _frnum -- int, frame number of last reassembled packet
+        * _offset -- int, frames of previous files (if restored)
+
+    Utilities:
+        * _trusted_call -- call packet reassembly without validation
+        * _dump_buffer -- convert buffer into built-in types
+        * _load_buffer -- convert built-in types back into buffer
+        * _load_bufid -- convert buffer identifier of checkpoint
 
     """
     __metaclass__ = abc.ABCMeta
@@ -107,13 +120,13 @@ class Reassembly(object):
     # fetch datagram
     def fetch(self):
         """Fetch datagram."""
-        if self._newflg:
+        if self._newflg:    # pending buffers submitted once new packets arrived
             self._newflg = False
             temp_dtgram = copy.deepcopy(self._dtgram)
             for (bufid, buffer) in self._buffer.items():
                 temp_dtgram += self.submit(buffer, bufid=bufid)
-            return tuple(temp_dtgram)
-        return tuple(self._dtgram)
+            self._fetchd = tuple(temp_dtgram)
+        return self._fetchd
 
     # return datagram index
     def index(self, pkt_num):
@@ -138,6 +151,50 @@ class Reassembly(object):
             self.reassembly(info)
         self._newflg = True
 
+    # checkpoint reassembly buffers
+    def checkpoint(self, *, frames=None):
+        """Checkpoint reassembly buffers.
+
+        Keyword arguments:
+            * frames -- int, number of frames of current file
+                        (default is None, i.e. frame number of last reassembled packet)
+
+        Returns:
+            * dict -- state of pending buffers, which consists of built-in
+                        types only (IP addresses in packed bytes)
+
+        Frames of current file are recorded as offset of frame numbers,
+        so that buffers restored from the checkpoint number frames of next
+        file after those of previous files, rather than restarting at 1.
+
+        """
+        buffer = list()
+        for (bufid, buf) in self._buffer.items():
+            if isinstance(bufid, tuple):
+                bufid = tuple(item.packed if isinstance(item, ipaddress._BaseAddress) else item for item in bufid)
+            buffer.append((bufid, self._dump_buffer(buf)))
+        offset = self._offset + (self._frnum if frames is None else frames)
+        return dict(protocol=self.protocol, buffer=buffer, offset=offset)
+
+    # restore reassembly buffers
+    def restore(self, state):
+        """Restore reassembly buffers.
+
+        Positional arguments:
+            * state -- dict, state of pending buffers made by `checkpoint`
+
+        Frame numbers in `index` are then offset by frames of previous files.
+
+        """
+        if state['protocol'] != self.protocol:
+            raise ProtocolError(f"{self.protocol}: cannot restore {state['protocol']} buffers")
+        for (bufid, buf) in state['buffer']:
+            if not isinstance(bufid, bytes):
+                bufid = tuple(ipaddress.ip_address(item) if isinstance(item, bytes) else item for item in bufid)
+            self._buffer[self._load_bufid(bufid)] = self._load_buffer(buf)
+        self._offset = state.get('offset', 0)
+        self._newflg = True
+
     ##########################################################################
     # Data models.
     ##########################################################################
@@ -158,6 +215,9 @@ class Reassembly(object):
         self._strflg = strict   # strict mode flag
         self._buffer = dict()   # buffer field
         self._dtgram = list()   # reassembled datagram
+        self._fetchd = tuple()  # fetched datagram
+        self._frnum = 0         # frame number of last reassembled packet
+        self._offset = 0        # frames of previous files (if restored)
 
     def __call__(self, packet):
         """Call packet reassembly.
@@ -171,3 +231,53 @@ class Reassembly(object):
         info = Info(packet)
         self.reassembly(info)
         self._newflg = True
+
+    def _trusted_call(self, record):
+        """Call packet reassembly without validation.
+
+        Positional arguments:
+            * record -- namedtuple, packet record to be reassembled, which
+                        is built by trusted callers from dissected frames
+                        (fields same as packet dict of corresponding protocol)
+
+        """
+        self.reassembly(record)
+        self._newflg = True
+
+    @abc.abstractmethod
+    def _dump_buffer(self, buf):
+        """Convert buffer into built-in types.
+
+        Positional arguments:
+            * buf -- dict, buffer dict of pending packets
+
+        Returns:
+            * tuple -- buffer in built-in types
+
+        """
+        pass
+
+    @abc.abstractmethod
+    def _load_buffer(self, buf):
+        """Convert built-in types back into buffer.
+
+        Positional arguments:
+            * buf -- tuple, buffer in built-in types made by `_dump_buffer`
+
+        Returns:
+            * dict -- buffer dict of pending packets
+
+        """
+        pass
+
+    def _load_bufid(self, bufid):
+        """Convert buffer identifier of checkpoint.
+
+        Positional arguments:
+            * bufid -- tuple / bytes, buffer identifier restored from checkpoint
+
+        Returns:
+            * tuple / bytes -- buffer identifier
+
+        """
+        return bufid
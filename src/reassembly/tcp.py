@@ -94,15 +94,68 @@ appeared in RFC 791. And here is the process:
   for further handling. Otherwise, return.
 
 """
+import collections
+import collections.abc
 import copy
 import io
 import sys
 
+from pcapkit.corekit.flowkey import flow_key, stream_key, unpack_key
 from pcapkit.corekit.infoclass import Info
 from pcapkit.foundation.analysis import analyse
 from pcapkit.reassembly.reassembly import Reassembly
 
-__all__ = ['TCP_Reassembly']
+__all__ = ['TCP_Reassembly', 'TCP_Fragment']
+
+# compact TCP fragment record for trusted callers
+TCP_Fragment = collections.namedtuple('TCP_Fragment', [
+    'bufid',        # buffer identifier
+    'num',          # original packet range number
+    'ack',          # acknowledgement
+    'dsn',          # data sequence number
+    'syn',          # synchronise flag
+    'fin',          # finish flag
+    'payload',      # raw bytearray type payload
+    'first',        # this sequence number
+    'last',         # next (wanted) sequence number
+    'len',          # payload length, header excludes
+    'key',          # flow key, as of `pcapkit.corekit.flowkey`
+    'reverse',      # if packet is in reverse direction of flow key
+])
+
+
+class _Packets(collections.abc.Sequence):
+    """Lazily analysed application layer packets of reassembled payloads.
+
+    Payloads are analysed upon first access to the packets,
+    then cached for later references.
+
+    """
+    @property
+    def data(self):
+        if self._packets is None:
+            self._packets = tuple(analyse(io.BytesIO(frag), len(frag),
+                                          analysers=self._analysers, ports=self._ports)
+                                  for frag in self._payload)
+        return self._packets
+
+    def __init__(self, payload, *, analysers=None, ports=None):
+        self._payload = payload         # payload fragments
+        self._analysers = analysers     # analysers to be tried
+        self._ports = ports             # transport layer port hints
+        self._packets = None            # analysed packets
+
+    def __repr__(self):
+        return repr(self.data)
+
+    def __len__(self):
+        return len(self._payload)
+
+    def __iter__(self):
+        return iter(self.data)
+
+    def __getitem__(self, index):
+        return self.data[index]
 
 
 class TCP_Reassembly(Reassembly):
@@ -125,16 +178,22 @@ class TCP_Reassembly(Reassembly):
         * protocol -- str, protocol of current reassembly object
 
     Methods:
+        * analyse -- analyse application layer packets
         * reassembly -- perform the reassembly procedure
         * submit -- submit reassembled payload
         * fetch -- fetch datagram
         * index -- return datagram index
         * run -- run automatically
+        * checkpoint -- checkpoint reassembly buffers
+        * restore -- restore reassembly buffers
 
     Attributes:
         * _strflg -- bool, strict mode flag
         * _buffer -- dict, buffer field
         * _dtgram -- tuple, reassembled datagram
+        * _anaflg -- bool, application layer analysis flag
+        * _lzyflg -- bool, lazy analysis flag
+        * _anlyrs -- tuple<str>, names of application layer analysers
 
     Terminology:
         - packet_dict = Info(
@@ -151,6 +210,8 @@ class TCP_Reassembly(Reassembly):
             first = tcp.seq,                # this sequence number
             last = tcp.seq + tcp.raw_len,   # next (wanted) sequence number
             payload = tcp.raw,              # raw bytearray type payload
+            key = flow_key(...)[0],         # flow key (optional, made from bufid if not given)
+            reverse = flow_key(...)[1],     # if packet is in reverse direction of flow key
          )
         - (tuple) datagram
            |--> (Info) data
@@ -167,6 +228,7 @@ class TCP_Reassembly(Reassembly):
            |       |                |--> (int) original packet range number
            |       |--> 'payload' : (bytes/None) reassembled application layer data
            |       |--> 'packets' : (tuple<Analysis>) analysed payload
+           |                        (None if analysis disabled, lazily analysed if lazy flag set)
            |--> (Info) data
            |       |--> 'NotImplemented' : (bool) False --> not implemented
            |       |--> 'id' : (Info) original packet identifier
@@ -224,6 +286,29 @@ class TCP_Reassembly(Reassembly):
     # Methods.
     ##########################################################################
 
+    def analyse(self, payload, *, ports=None):
+        """Analyse application layer packets.
+
+        Positional arguments:
+            * payload -- tuple<bytes>, reassembled payload fragments
+
+        Keyword arguments:
+            * ports -- tuple<int>, source and destination ports as hints
+                        for application layer analysis
+
+        Returns:
+            * [if analysis disabled] None
+            * [if lazy flag set] _Packets -- lazily analysed packets
+            * tuple<Analysis> -- analysed packets
+
+        """
+        if not self._anaflg:
+            return None
+        packets = _Packets(payload, analysers=self._anlyrs, ports=ports)
+        if self._lzyflg:
+            return packets
+        return packets.data
+
     def reassembly(self, info):
         """Reassembly procedure.
 
@@ -231,7 +316,11 @@ class TCP_Reassembly(Reassembly):
             * info -- Info, info dict of packets to be reassembled
 
         """
-        BUFID = info.bufid  # Buffer Identifier
+        # Buffer Identifier, i.e. stream key of packet direction
+        if getattr(info, 'key', None) is None:
+            BUFID = stream_key(*flow_key(info.bufid[0], info.bufid[2], info.bufid[1], info.bufid[3]))
+        else:
+            BUFID = stream_key(info.key, info.reverse)
         DSN = info.dsn      # Data Sequence Number
         ACK = info.ack      # Acknowledgement Number
         FIN = info.fin      # Finish Flag (Termination)
@@ -264,7 +353,8 @@ class TCP_Reassembly(Reassembly):
             )
 
         # append packet index
-        self._buffer[BUFID][ACK]['ind'].append(info.num)
+        self._frnum = info.num
+        self._buffer[BUFID][ACK]['ind'].append(self._offset + info.num)
 
         # record fragment payload
         ISN = self._buffer[BUFID][ACK]['isn']   # Initial Sequence Number
@@ -322,17 +412,20 @@ class TCP_Reassembly(Reassembly):
             * buf -- dict, buffer dict of reassembled packets
 
         Keyword arguments:
-            * bufid -- tuple, buffer identifier
+            * bufid -- bytes, buffer identifier, i.e. stream key
 
         Returns:
             * list -- reassembled packets
 
         """
+        src, srcport, dst, dstport = unpack_key(bufid)
         datagram = []           # reassembled datagram
-        HDL = buf.pop('hdl')    # hole descriptor list (remove from dict)
+        HDL = buf['hdl']        # hole descriptor list (kept, as pending buffers are submitted on fetch)
 
         # check through every buffer with ACK
         for (ack, buffer) in buf.items():
+            if ack == 'hdl':
+                continue
             # if this buffer is not implemented
             # go through every hole and extract received payload
             if len(HDL) > 2 and self._strflg:
@@ -351,13 +444,13 @@ class TCP_Reassembly(Reassembly):
                     packet = Info(
                         NotImplemented=True,
                         id=Info(
-                            src=(bufid[0], bufid[2]),
-                            dst=(bufid[1], bufid[3]),
+                            src=(src, srcport),
+                            dst=(dst, dstport),
                             ack=ack,
                         ),
                         index=tuple(buffer['ind']),
                         payload=tuple(data) or None,
-                        packets=tuple([analyse(io.BytesIO(frag), len(frag)) for frag in data]),
+                        packets=self.analyse(tuple(data), ports=(srcport, dstport)),
                     )
                     datagram.append(packet)
             # if this buffer is implemented
@@ -368,13 +461,94 @@ class TCP_Reassembly(Reassembly):
                     packet = Info(
                         NotImplemented=False,
                         id=Info(
-                            src=(bufid[0], bufid[2]),
-                            dst=(bufid[1], bufid[3]),
+                            src=(src, srcport),
+                            dst=(dst, dstport),
                             ack=ack,
                         ),
                         index=tuple(buffer['ind']),
                         payload=bytes(data) or None,
-                        packets=(analyse(io.BytesIO(data), len(data)),),
+                        packets=self.analyse((bytes(data),), ports=(srcport, dstport)),
                     )
                     datagram.append(packet)
         return datagram
+
+    ##########################################################################
+    # Utilities.
+    ##########################################################################
+
+    def _dump_buffer(self, buf):
+        """Convert buffer into built-in types.
+
+        Positional arguments:
+            * buf -- dict, buffer dict of pending packets
+
+        Returns:
+            * tuple -- hole descriptor list & ACK buffers
+                |--> (tuple) HDL --> (first, last) of each hole
+                |--> (tuple) ACK --> (ack, ind, isn, len, raw) of each buffer
+
+        """
+        HDL = tuple((hole.first, hole.last) for hole in buf['hdl'])
+        ACK = tuple((ack, tuple(buffer['ind']), buffer['isn'], buffer['len'], bytes(buffer['raw']))
+                    for (ack, buffer) in buf.items() if ack != 'hdl')
+        return (HDL, ACK)
+
+    def _load_buffer(self, buf):
+        """Convert built-in types back into buffer.
+
+        Positional arguments:
+            * buf -- tuple, buffer in built-in types made by `_dump_buffer`
+
+        Returns:
+            * dict -- buffer dict of pending packets
+
+        """
+        HDL, ACK = buf
+        buffer = {'hdl': [Info(first=first, last=last) for (first, last) in HDL]}
+        for (ack, ind, isn, len_, raw) in ACK:
+            buffer[ack] = dict(
+                ind=list(ind),
+                isn=isn,
+                len=len_,
+                raw=bytearray(raw),
+            )
+        return buffer
+
+    def _load_bufid(self, bufid):
+        """Convert buffer identifier of checkpoint.
+
+        Positional arguments:
+            * bufid -- tuple / bytes, buffer identifier restored from checkpoint,
+                        where tuples, i.e. (src, dst, srcport, dstport), are of
+                        checkpoints made before stream keys
+
+        Returns:
+            * bytes -- buffer identifier, i.e. stream key
+
+        """
+        if isinstance(bufid, bytes):
+            return bufid
+        return stream_key(*flow_key(bufid[0], bufid[2], bufid[1], bufid[3]))
+
+    ##########################################################################
+
+    def __init__(self, *, strict=True, analysis=True, lazy=False, analysers=None):
+        """Initialise packet reassembly.
+
+        Keyword arguments:
+            * strict -- bool, if return all datagrams (including those not
+                        implemented) when submit (default is True)
+                            <keyword> True / False
+            * analysis -- bool, if analyse application layer packets of
+                        reassembled payloads (default is True)
+                            <keyword> True / False
+            * lazy -- bool, if postpone analysis till packets accessed (default is False)
+                            <keyword> True / False
+            * analysers -- iterable<str>, names of application layer analysers
+                        to be tried (default is None, i.e. all registered analysers)
+
+        """
+        super().__init__(strict=strict)
+        self._anaflg = analysis     # analysis flag
+        self._lzyflg = lazy         # lazy analysis flag
+        self._anlyrs = None if analysers is None else tuple(analysers)
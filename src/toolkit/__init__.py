@@ -5,29 +5,7 @@
 capability of multiple engine support.
 
 """
-# tools for default engine
-from pcapkit.toolkit.default import *
-
-# tools for DPKT engine
-from pcapkit.toolkit.dpkt import ipv6_hdr_len as dpkt_ipv6_hdr_len
-from pcapkit.toolkit.dpkt import packet2chain as dpkt_packet2chain
-from pcapkit.toolkit.dpkt import packet2dict as dpkt_packet2dict
-from pcapkit.toolkit.dpkt import ipv4_reassembly as dpkt_ipv4_reassembly
-from pcapkit.toolkit.dpkt import ipv6_reassembly as dpkt_ipv6_reassembly
-from pcapkit.toolkit.dpkt import tcp_reassembly as dpkt_tcp_reassembly
-from pcapkit.toolkit.dpkt import tcp_traceflow as dpkt_tcp_traceflow
-
-# tools for PyShark engine
-from pcapkit.toolkit.pyshark import packet2dict as pyshark_packet2dict
-from pcapkit.toolkit.pyshark import tcp_traceflow as pyshark_tcp_traceflow
-
-# tools for Scapy engine
-from pcapkit.toolkit.scapy import packet2chain as scapy_packet2chain
-from pcapkit.toolkit.scapy import packet2dict as scapy_packet2dict
-from pcapkit.toolkit.scapy import ipv4_reassembly as scapy_ipv4_reassembly
-from pcapkit.toolkit.scapy import ipv6_reassembly as scapy_ipv6_reassembly
-from pcapkit.toolkit.scapy import tcp_reassembly as scapy_tcp_reassembly
-from pcapkit.toolkit.scapy import tcp_traceflow as scapy_tcp_traceflow
+from pcapkit.utilities.lazy import lazy_loader
 
 __all__ = [
     # default engine
@@ -44,3 +22,35 @@ __all__ = [
     'scapy_packet2chain', 'scapy_packet2dict',
     'scapy_ipv4_reassembly', 'scapy_ipv6_reassembly', 'scapy_tcp_reassembly', 'scapy_tcp_traceflow',
 ]
+
+# lazy attribute loading (PEP 562)
+__getattr__, __dir__ = lazy_loader(__name__, {
+    # tools for default engine
+    'ipv4_reassembly': 'pcapkit.toolkit.default',
+    'ipv6_reassembly': 'pcapkit.toolkit.default',
+    'tcp_reassembly': 'pcapkit.toolkit.default',
+    'tcp_traceflow': 'pcapkit.toolkit.default',
+    'frame_layers': 'pcapkit.toolkit.default',
+    'frame_records': 'pcapkit.toolkit.default',
+
+    # tools for DPKT engine
+    'dpkt_ipv6_hdr_len': 'pcapkit.toolkit.dpkt:ipv6_hdr_len',
+    'dpkt_packet2chain': 'pcapkit.toolkit.dpkt:packet2chain',
+    'dpkt_packet2dict': 'pcapkit.toolkit.dpkt:packet2dict',
+    'dpkt_ipv4_reassembly': 'pcapkit.toolkit.dpkt:ipv4_reassembly',
+    'dpkt_ipv6_reassembly': 'pcapkit.toolkit.dpkt:ipv6_reassembly',
+    'dpkt_tcp_reassembly': 'pcapkit.toolkit.dpkt:tcp_reassembly',
+    'dpkt_tcp_traceflow': 'pcapkit.toolkit.dpkt:tcp_traceflow',
+
+    # tools for PyShark engine
+    'pyshark_packet2dict': 'pcapkit.toolkit.pyshark:packet2dict',
+    'pyshark_tcp_traceflow': 'pcapkit.toolkit.pyshark:tcp_traceflow',
+
+    # tools for Scapy engine
+    'scapy_packet2chain': 'pcapkit.toolkit.scapy:packet2chain',
+    'scapy_packet2dict': 'pcapkit.toolkit.scapy:packet2dict',
+    'scapy_ipv4_reassembly': 'pcapkit.toolkit.scapy:ipv4_reassembly',
+    'scapy_ipv6_reassembly': 'pcapkit.toolkit.scapy:ipv6_reassembly',
+    'scapy_tcp_reassembly': 'pcapkit.toolkit.scapy:tcp_reassembly',
+    'scapy_tcp_traceflow': 'pcapkit.toolkit.scapy:tcp_traceflow',
+})
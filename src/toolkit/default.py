@@ -3,86 +3,64 @@
 
 `pcapkit.toolkit.default` contains all you need for
 `PyPCAPKit` handy usage. All functions returns with a flag
-to indicate if usable for its caller.
+to indicate if usable for its caller, except `frame_layers`,
+which walks through protocol layers of a frame once, and
+`frame_records`, which makes all records of a frame in a
+single pass through its protocol layers.
 
 """
-__all__ = ['ipv4_reassembly', 'ipv6_reassembly', 'tcp_reassembly', 'tcp_traceflow']
+from pcapkit.corekit.flowkey import flow_key
+from pcapkit.reassembly.ip import IP_Fragment
+from pcapkit.reassembly.tcp import TCP_Fragment
 
+__all__ = ['ipv4_reassembly', 'ipv6_reassembly', 'tcp_reassembly', 'tcp_traceflow',
+           'frame_layers', 'frame_records']
 
-def ipv4_reassembly(frame):
-    """Make data for IPv4 reassembly."""
+
+def ipv4_reassembly(frame, *, record=False):
+    """Make data for IPv4 reassembly.
+
+    Keyword arguments:
+        * record -- bool, if return compact `IP_Fragment` record for trusted
+                        reassembly call instead of packet dict (default is False)
+
+    """
     if 'IPv4' in frame:
-        ipv4 = frame['IPv4'].info
-        if ipv4.flags.df:       # dismiss not fragmented frame
+        data = _ipv4_fragment(frame, frame['IPv4'].info)
+        if data is None:
             return False, None
-        data = dict(
-            bufid=(
-                ipv4.src,                                   # source IP address
-                ipv4.dst,                                   # destination IP address
-                ipv4.id,                                    # identification
-                ipv4.proto.name,                            # payload protocol type
-            ),
-            num=frame.info.number,                          # original packet range number
-            fo=ipv4.frag_offset,                            # fragment offset
-            ihl=ipv4.hdr_len,                               # internet header length
-            mf=ipv4.flags.mf,                               # more fragment flag
-            tl=ipv4.len,                                    # total length, header includes
-            header=bytearray(ipv4.packet.header),           # raw bytearray type header
-            payload=bytearray(ipv4.packet.payload or b''),  # raw bytearray type payload
-        )
-        return True, data
+        return True, (data if record else data._asdict())
     return False, None
 
 
-def ipv6_reassembly(frame):
-    """Make data for IPv6 reassembly."""
+def ipv6_reassembly(frame, *, record=False):
+    """Make data for IPv6 reassembly.
+
+    Keyword arguments:
+        * record -- bool, if return compact `IP_Fragment` record for trusted
+                        reassembly call instead of packet dict (default is False)
+
+    """
     if 'IPv6' in frame:
-        ipv6 = frame['IPv6'].info
-        if 'frag' not in ipv6:      # dismiss not fragmented frame
+        data = _ipv6_fragment(frame, frame['IPv6'].info)
+        if data is None:
             return False, None
-        data = dict(
-            bufid=(
-                ipv6.src,                                       # source IP address
-                ipv6.dst,                                       # destination IP address
-                ipv6.label,                                     # label
-                ipv6.ipv6_frag.next.name,                       # next header field in IPv6 Fragment Header
-            ),
-            num=frame.info.number,                              # original packet range number
-            fo=ipv6.ipv6_frag.offset,                           # fragment offset
-            ihl=ipv6.hdr_len,                                   # header length, only headers before IPv6-Frag
-            mf=ipv6.ipv6_frag.mf,                               # more fragment flag
-            tl=ipv6.hdr_len + ipv6.raw_len,                     # total length, header includes
-            header=bytearray(ipv6.fragment.header),             # raw bytearray type header before IPv6-Frag
-            payload=bytearray(ipv6.fragment.payload or b''),    # raw bytearray type payload after IPv6-Frag
-        )
-        return True, data
+        return True, (data if record else data._asdict())
     return False, None
 
 
-def tcp_reassembly(frame):
-    """Make data for TCP reassembly."""
+def tcp_reassembly(frame, *, record=False):
+    """Make data for TCP reassembly.
+
+    Keyword arguments:
+        * record -- bool, if return compact `TCP_Fragment` record for trusted
+                        reassembly call instead of packet dict (default is False)
+
+    """
     if 'TCP' in frame:
         ip = (frame['IPv4'] if 'IPv4' in frame else frame['IPv6']).info
-        tcp = frame['TCP'].info
-        data = dict(
-            bufid=(
-                ip.src,                                     # source IP address
-                ip.dst,                                     # destination IP address
-                tcp.srcport,                                # source port
-                tcp.dstport,                                # destination port
-            ),
-            num=frame.info.number,                          # original packet range number
-            ack=tcp.ack,                                    # acknowledgement
-            dsn=tcp.seq,                                    # data sequence number
-            syn=tcp.flags.syn,                              # synchronise flag
-            fin=tcp.flags.fin,                              # finish flag
-            payload=bytearray(tcp.packet.payload or b''),   # raw bytearray type payload
-        )
-        raw_len = len(data['payload'])                      # payload length, header excludes
-        data['first'] = tcp.seq                             # this sequence number
-        data['last'] = tcp.seq + raw_len                    # next (wanted) sequence number
-        data['len'] = raw_len                               # payload length, header excludes
-        return True, data
+        data = _tcp_fragment(frame, ip, frame['TCP'].info)
+        return True, (data if record else data._asdict())
     return False, None
 
 
@@ -90,18 +68,162 @@ def tcp_traceflow(frame, *, data_link):
     """Trace packet flow for TCP."""
     if 'TCP' in frame:
         ip = (frame['IPv4'] if 'IPv4' in frame else frame['IPv6']).info
-        tcp = frame['TCP'].info
-        data = dict(
-            protocol=data_link,                     # data link type from global header
-            index=frame.info.number,                # frame number
-            frame=frame.info,                       # extracted frame info
-            syn=tcp.flags.syn,                      # TCP synchronise (SYN) flag
-            fin=tcp.flags.fin,                      # TCP finish (FIN) flag
-            src=ip.src,                             # source IP
-            dst=ip.dst,                             # destination IP
-            srcport=tcp.srcport,                    # TCP source port
-            dstport=tcp.dstport,                    # TCP destination port
-            timestamp=frame.info.time_epoch,        # frame timestamp
-        )
+        data = _tcp_packet(frame, ip, frame['TCP'].info, data_link=data_link)
         return True, data
     return False, None
+
+
+def frame_layers(frame):
+    """Walk through protocol layers of a frame once.
+
+    Positional arguments:
+        * frame -- Frame, extracted frame
+
+    Returns:
+        * dict -- outermost layer of each protocol, keyed on class name
+                    (e.g. `'IPv4'`, `'TCP'`), in order of layers
+
+    """
+    from pcapkit.protocols.null import NoPayload
+
+    layers = dict()
+    payload = frame.payload
+    while not isinstance(payload, NoPayload):
+        layers.setdefault(type(payload).__name__, payload)
+        payload = payload.payload
+    return layers
+
+
+def frame_records(frame, *, ipv4=False, ipv6=False, tcp=False, trace=False, data_link=None):
+    """Make data for reassembly and flow tracing in a single pass.
+
+    Positional arguments:
+        * frame -- Frame, extracted frame
+
+    Keyword arguments:
+        * ipv4 -- bool, if make `IP_Fragment` record for IPv4 reassembly
+        * ipv6 -- bool, if make `IP_Fragment` record for IPv6 reassembly
+        * tcp -- bool, if make `TCP_Fragment` record for TCP reassembly
+        * trace -- bool, if make packet dict for TCP flow tracing
+        * data_link -- data link type from global header
+
+    Returns:
+        * tuple -- records of IPv4, IPv6, TCP reassembly and flow tracing,
+                    each of which is None if disabled or not applicable
+
+    """
+    layers = frame_layers(frame)
+    ipv4_info = layers['IPv4'].info if 'IPv4' in layers else None
+    ipv6_info = layers['IPv6'].info if 'IPv6' in layers else None
+    tcp_info = layers['TCP'].info if 'TCP' in layers else None
+    ip_info = ipv6_info if ipv4_info is None else ipv4_info
+
+    ipv4_data = _ipv4_fragment(frame, ipv4_info) if (ipv4 and ipv4_info is not None) else None
+    ipv6_data = _ipv6_fragment(frame, ipv6_info) if (ipv6 and ipv6_info is not None) else None
+    if tcp_info is None:
+        return ipv4_data, ipv6_data, None, None
+
+    # flow key shared by TCP reassembly and flow tracing
+    key = flow_key(ip_info.src, tcp_info.srcport, ip_info.dst, tcp_info.dstport)
+    tcp_data = _tcp_fragment(frame, ip_info, tcp_info, key=key) if tcp else None
+    trace_data = _tcp_packet(frame, ip_info, tcp_info, data_link=data_link, key=key) if trace else None
+    return ipv4_data, ipv6_data, tcp_data, trace_data
+
+
+def _ipv4_fragment(frame, ipv4):
+    """Make IPv4 fragment record."""
+    if ipv4.flags.df:       # dismiss not fragmented frame
+        return None
+    return IP_Fragment(
+        bufid=(
+            ipv4.src,                                   # source IP address
+            ipv4.dst,                                   # destination IP address
+            ipv4.id,                                    # identification
+            ipv4.proto.name,                            # payload protocol type
+        ),
+        num=frame.info.number,                          # original packet range number
+        fo=ipv4.frag_offset,                            # fragment offset
+        ihl=ipv4.hdr_len,                               # internet header length
+        mf=ipv4.flags.mf,                               # more fragment flag
+        tl=ipv4.len,                                    # total length, header includes
+        header=bytearray(ipv4.packet.header),           # raw bytearray type header
+        payload=bytearray(ipv4.packet.payload or b''),  # raw bytearray type payload
+    )
+
+
+def _ipv6_fragment(frame, ipv6):
+    """Make IPv6 fragment record."""
+    if 'frag' not in ipv6:      # dismiss not fragmented frame
+        return None
+    return IP_Fragment(
+        bufid=(
+            ipv6.src,                                       # source IP address
+            ipv6.dst,                                       # destination IP address
+            ipv6.label,                                     # label
+            ipv6.ipv6_frag.next.name,                       # next header field in IPv6 Fragment Header
+        ),
+        num=frame.info.number,                              # original packet range number
+        fo=ipv6.ipv6_frag.offset,                           # fragment offset
+        ihl=ipv6.hdr_len,                                   # header length, only headers before IPv6-Frag
+        mf=ipv6.ipv6_frag.mf,                               # more fragment flag
+        tl=ipv6.hdr_len + ipv6.raw_len,                     # total length, header includes
+        header=bytearray(ipv6.fragment.header),             # raw bytearray type header before IPv6-Frag
+        payload=bytearray(ipv6.fragment.payload or b''),    # raw bytearray type payload after IPv6-Frag
+    )
+
+
+def _tcp_fragment(frame, ip, tcp, *, key=None):
+    """Make TCP fragment record."""
+    if key is None:
+        key = flow_key(ip.src, tcp.srcport, ip.dst, tcp.dstport)
+    payload = bytearray(tcp.packet.payload or b'')      # raw bytearray type payload
+    raw_len = len(payload)                              # payload length, header excludes
+    return TCP_Fragment(
+        bufid=(
+            ip.src,                                     # source IP address
+            ip.dst,                                     # destination IP address
+            tcp.srcport,                                # source port
+            tcp.dstport,                                # destination port
+        ),
+        num=frame.info.number,                          # original packet range number
+        ack=tcp.ack,                                    # acknowledgement
+        dsn=tcp.seq,                                    # data sequence number
+        syn=tcp.flags.syn,                              # synchronise flag
+        fin=tcp.flags.fin,                              # finish flag
+        payload=payload,                                # raw bytearray type payload
+        first=tcp.seq,                                  # this sequence number
+        last=tcp.seq + raw_len,                         # next (wanted) sequence number
+        len=raw_len,                                    # payload length, header excludes
+        key=key[0],                                     # flow key
+        reverse=key[1],                                 # if in reverse direction of flow key
+    )
+
+
+def _tcp_packet(frame, ip, tcp, *, data_link, key=None):
+    """Make TCP flow packet dict."""
+    if key is None:
+        key = flow_key(ip.src, tcp.srcport, ip.dst, tcp.dstport)
+    return dict(
+        protocol=data_link,                     # data link type from global header
+        index=frame.info.number,                # frame number
+        frame=frame.info,                       # extracted frame info
+        syn=tcp.flags.syn,                      # TCP synchronise (SYN) flag
+        fin=tcp.flags.fin,                      # TCP finish (FIN) flag
+        src=ip.src,                             # source IP
+        dst=ip.dst,                             # destination IP
+        srcport=tcp.srcport,                    # TCP source port
+        dstport=tcp.dstport,                    # TCP destination port
+        timestamp=frame.info.time_epoch,        # frame timestamp
+        seq=tcp.seq,                            # TCP sequence number
+        len=len(tcp.packet.payload or b''),     # TCP payload length, header excludes
+        flags=_tcp_flags(tcp.flags),            # TCP flags, i.e. CWR ... FIN bits
+        length=frame.info.frame_info.orig_len,  # frame length
+        key=key[0],                             # flow key
+        reverse=key[1],                         # if in reverse direction of flow key
+    )
+
+
+def _tcp_flags(flags):
+    """Make TCP flags byte."""
+    return ((flags.cwr << 7) | (flags.ecn << 6) | (flags.urg << 5) | (flags.ack << 4)
+            | (flags.push << 3) | (flags.reset << 2) | (flags.syn << 1) | flags.fin)
@@ -161,6 +161,10 @@ def tcp_traceflow(packet, timestamp, *, data_link, count=NotImplemented):
             srcport=tcp.sport,                                          # TCP source port
             dstport=tcp.dport,                                          # TCP destination port
             timestamp=timestamp,                                        # timestamp
+            seq=tcp.seq,                                                # TCP sequence number
+            len=len(tcp.data),                                          # TCP payload length
+            flags=tcp.flags & 0xFF,                                     # TCP flags, i.e. CWR ... FIN bits
+            length=len(packet),                                         # frame length
         )
         return True, data
     return False, None
@@ -47,6 +47,10 @@ def tcp_traceflow(packet):
             srcport=int(tcp.srcport),                                       # TCP source port
             dstport=int(tcp.dstport),                                       # TCP destination port
             timestamp=packet.frame_info.time_epoch,                         # timestamp
+            seq=int(getattr(tcp, 'seq_raw', tcp.seq)),                      # TCP sequence number
+            len=int(tcp.len),                                               # TCP payload length
+            flags=int(tcp.flags, base=16) & 0xFF,                           # TCP flags, i.e. CWR ... FIN bits
+            length=int(packet.length),                                      # frame length
         )
         return True, data
     return False, None
@@ -9,12 +9,11 @@ its caller.
 """
 import ipaddress
 import time
-import warnings
 
 from pcapkit.protocols.link.link import LINKTYPE
 from pcapkit.protocols.transport.transport import TP_PROTO
-from pcapkit.utilities.exceptions import ModuleNotFound, stacklevel
-from pcapkit.utilities.warnings import ScapyWarning
+from pcapkit.utilities.exceptions import ModuleNotFound
+from pcapkit.utilities.warnings import ScapyWarning, warn
 
 ###############################################################################
 # import scapy.all
@@ -24,8 +23,8 @@ try:
     import scapy.all as scapy_all
 except ImportError:
     scapy_all = None
-    warnings.warn("dependency package 'Scapy' not found",
-                  ScapyWarning, stacklevel=stacklevel())
+    warn("dependency package 'Scapy' not found",
+         ScapyWarning)
 
 __all__ = [
     'packet2chain', 'packet2dict',
@@ -159,6 +158,10 @@ def tcp_traceflow(packet, *, count=NotImplemented):
             srcport=tcp.sport,                              # TCP source port
             dstport=tcp.dport,                              # TCP destination port
             timestamp=time.time(),                          # timestamp
+            seq=tcp.seq,                                    # TCP sequence number
+            len=len(tcp.payload),                           # TCP payload length
+            flags=int(tcp.flags) & 0xFF,                    # TCP flags, i.e. CWR ... FIN bits
+            length=len(packet),                             # frame length
         )
         return True, data
     return False, None
@@ -7,9 +7,85 @@ decorater function `seekset` and `beholder`, and several
 user-refined exceptions and validations.
 
 """
-from pcapkit.utilities.decorators import *
-from pcapkit.utilities.exceptions import *
-from pcapkit.utilities.validations import *
-from pcapkit.utilities.warnings import *
+from pcapkit.utilities.lazy import lazy_loader
 
 __all__ = ['seekset_ng', 'beholder_ng']
+
+# lazy attribute loading (PEP 562)
+__getattr__, __dir__ = lazy_loader(__name__, {
+    # Decorators
+    'seekset': 'pcapkit.utilities.decorators',
+    'seekset_ng': 'pcapkit.utilities.decorators',
+    'beholder': 'pcapkit.utilities.decorators',
+    'beholder_ng': 'pcapkit.utilities.decorators',
+
+    # Exceptions
+    'BaseError': 'pcapkit.utilities.exceptions',
+    'DigitError': 'pcapkit.utilities.exceptions',
+    'IntError': 'pcapkit.utilities.exceptions',
+    'RealError': 'pcapkit.utilities.exceptions',
+    'ComplexError': 'pcapkit.utilities.exceptions',
+    'BoolError': 'pcapkit.utilities.exceptions',
+    'BytesError': 'pcapkit.utilities.exceptions',
+    'StringError': 'pcapkit.utilities.exceptions',
+    'BytearrayError': 'pcapkit.utilities.exceptions',
+    'DictError': 'pcapkit.utilities.exceptions',
+    'ListError': 'pcapkit.utilities.exceptions',
+    'TupleError': 'pcapkit.utilities.exceptions',
+    'IterableError': 'pcapkit.utilities.exceptions',
+    'IOObjError': 'pcapkit.utilities.exceptions',
+    'ProtocolUnbound': 'pcapkit.utilities.exceptions',
+    'CallableError': 'pcapkit.utilities.exceptions',
+    'InfoError': 'pcapkit.utilities.exceptions',
+    'IPError': 'pcapkit.utilities.exceptions',
+    'EnumError': 'pcapkit.utilities.exceptions',
+    'ComparisonError': 'pcapkit.utilities.exceptions',
+    'FormatError': 'pcapkit.utilities.exceptions',
+    'UnsupportedCall': 'pcapkit.utilities.exceptions',
+    'FileError': 'pcapkit.utilities.exceptions',
+    'FileExists': 'pcapkit.utilities.exceptions',
+    'FileNotFound': 'pcapkit.utilities.exceptions',
+    'ProtocolNotFound': 'pcapkit.utilities.exceptions',
+    'VersionError': 'pcapkit.utilities.exceptions',
+    'IndexNotFound': 'pcapkit.utilities.exceptions',
+    'ProtocolError': 'pcapkit.utilities.exceptions',
+    'EndianError': 'pcapkit.utilities.exceptions',
+    'ProtocolNotImplemented': 'pcapkit.utilities.exceptions',
+    'StructError': 'pcapkit.utilities.exceptions',
+    'FragmentError': 'pcapkit.utilities.exceptions',
+    'PacketError': 'pcapkit.utilities.exceptions',
+    'ModuleNotFound': 'pcapkit.utilities.exceptions',
+
+    # Validations
+    'int_check': 'pcapkit.utilities.validations',
+    'real_check': 'pcapkit.utilities.validations',
+    'complex_check': 'pcapkit.utilities.validations',
+    'number_check': 'pcapkit.utilities.validations',
+    'bool_check': 'pcapkit.utilities.validations',
+    'bytes_check': 'pcapkit.utilities.validations',
+    'bytearray_check': 'pcapkit.utilities.validations',
+    'str_check': 'pcapkit.utilities.validations',
+    'list_check': 'pcapkit.utilities.validations',
+    'dict_check': 'pcapkit.utilities.validations',
+    'tuple_check': 'pcapkit.utilities.validations',
+    'io_check': 'pcapkit.utilities.validations',
+    'frag_check': 'pcapkit.utilities.validations',
+    'pkt_check': 'pcapkit.utilities.validations',
+    'info_check': 'pcapkit.utilities.validations',
+    'ip_check': 'pcapkit.utilities.validations',
+    'set_validation': 'pcapkit.utilities.validations',
+    'get_validation': 'pcapkit.utilities.validations',
+
+    # Warnings
+    'warn': 'pcapkit.utilities.warnings',
+    'BaseWarning': 'pcapkit.utilities.warnings',
+    'FormatWarning': 'pcapkit.utilities.warnings',
+    'EngineWarning': 'pcapkit.utilities.warnings',
+    'FileWarning': 'pcapkit.utilities.warnings',
+    'LayerWarning': 'pcapkit.utilities.warnings',
+    'ProtocolWarning': 'pcapkit.utilities.warnings',
+    'AttributeWarning': 'pcapkit.utilities.warnings',
+    'DPKTWarning': 'pcapkit.utilities.warnings',
+    'ScapyWarning': 'pcapkit.utilities.warnings',
+    'PySharkWarning': 'pcapkit.utilities.warnings',
+})
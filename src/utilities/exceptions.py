@@ -35,9 +35,15 @@ __all__ = [
 def stacklevel():
     """Fetch current stack level."""
     pcapkit = f'{os.path.sep}pcapkit{os.path.sep}'
-    tb = traceback.extract_stack()
-    for index, tbitem in enumerate(tb):
-        if pcapkit in tbitem[0]:
+    # walk frames instead of extracting stack with source lines
+    tb = list()
+    frame = sys._getframe()
+    while frame is not None:
+        tb.append(frame.f_code.co_filename)
+        frame = frame.f_back
+    tb.reverse()
+    for index, filename in enumerate(tb):
+        if pcapkit in filename:
             break
     else:
         index = len(tb)
@@ -60,12 +66,14 @@ class BaseError(Exception):
 
     """
     def __init__(self, *args, **kwargs):
-        index = stacklevel()
         quiet = kwargs.pop('quiet', False)
-        if not quiet and index:
-            fmt_exc = traceback.format_exc(limit=-index)
-            if len(fmt_exc.splitlines(True)) > 1:
-                print(fmt_exc, file=sys.stderr)
+        # stack level only matters when an exception is being handled
+        if not quiet and sys.exc_info()[0] is not None:
+            index = stacklevel()
+            if index:
+                fmt_exc = traceback.format_exc(limit=-index)
+                if len(fmt_exc.splitlines(True)) > 1:
+                    print(fmt_exc, file=sys.stderr)
 
         sys.tracebacklimit = 0
         super().__init__(*args, **kwargs)
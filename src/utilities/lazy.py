@@ -0,0 +1,55 @@
+# -*- coding: utf-8 -*-
+"""lazy attribute loading
+
+`pcapkit.utilities.lazy` contains `lazy_loader`, which
+creates module level `__getattr__` and `__dir__` functions
+(as described in [PEP 562](https://www.python.org/dev/peps/pep-0562/))
+for packages of `pcapkit`, so that modules are imported
+only when their attributes are first accessed.
+
+"""
+import importlib
+import sys
+
+__all__ = ['lazy_loader']
+
+
+def lazy_loader(name, attrs):
+    """Create lazy attribute loader for a module.
+
+    Positional arguments:
+        * name -- str, name of the module (i.e. `__name__`)
+        * attrs -- dict, mapping of attribute name to its source, i.e.
+                        `'module'`, `'module:attribute'` (if renamed), or
+                        `'module:'` (for the module itself)
+
+    Returns:
+        * function -- module level `__getattr__` function
+        * function -- module level `__dir__` function
+
+    """
+    def __getattr__(attr):
+        """Import attribute on first access."""
+        try:
+            source = attrs[attr]
+        except KeyError:
+            # fallback to submodules, e.g. `pcapkit.protocols.link`
+            try:
+                return importlib.import_module(f'{name}.{attr}')
+            except ModuleNotFoundError as error:
+                if error.name != f'{name}.{attr}':
+                    raise
+            raise AttributeError(f'module {name!r} has no attribute {attr!r}') from None
+
+        module, sep, origin = source.partition(':')
+        value = importlib.import_module(module)
+        if not sep or origin:
+            value = getattr(value, origin or attr)
+        setattr(sys.modules[name], attr, value)
+        return value
+
+    def __dir__():
+        """List attributes including those not yet imported."""
+        return sorted(set(vars(sys.modules[name])) | set(attrs))
+
+    return __getattr__, __dir__
@@ -1,13 +1,17 @@
 # -*- coding: utf-8 -*-
 """user defined warnings
 
+`pcapkit.utilities.warnings` contains user defined warning
+classes, and `warn` which issues warnings with stack level
+computed only if the warning is to be shown.
+
 """
-##############################################################################
-# import warnings
-##############################################################################
+import warnings
 
+from pcapkit.utilities.exceptions import stacklevel
 
 __all__ = [
+    'warn',                                                         # function
     'BaseWarning',                                                  # Warning
     'FormatWarning', 'EngineWarning',                               # ImportWarning
     'FileWarning', 'LayerWarning', 'ProtocolWarning', 'AttributeWarning',
@@ -16,6 +20,26 @@ __all__ = [
 ]
 
 
+def warn(message, category):
+    """Issue a warning.
+
+    Positional arguments:
+        * message -- str, warning message
+        * category -- Warning, warning category
+
+    The stack level is computed only if the warning is not ignored
+    by the first matching warning filter.
+
+    """
+    for (action, msg, cat, mod, lineno) in warnings.filters:
+        if (msg is None or msg.match(message)) and issubclass(category, cat):
+            # unless the filter depends on caller
+            if action == 'ignore' and mod is None and not lineno:
+                return
+            break
+    warnings.warn(message, category, stacklevel=stacklevel()+1)
+
+
 ##############################################################################
 # BaseWarning (abc of warnings) session.
 ##############################################################################
@@ -19,3 +19,6 @@ for reassembly in extraction.reassembly.tcp:
         else:
             print(packet)
     print()
+
+# application layer dispatch statistics
+pprint.pprint(pcapkit.foundation.analysis.stats())
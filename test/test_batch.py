@@ -0,0 +1,35 @@
+# -*- coding: utf-8 -*-
+
+import time
+
+import pcapkit
+from pcapkit.foundation.batch import summarise
+
+FILES = ['../sample/in.pcap'] * 8
+
+if __name__ == '__main__':
+    # serial extraction
+    now = time.time()
+    frames = 0
+    for file in FILES:
+        frames += pcapkit.extract(fin=file, store=False, nofile=True, trace=True).length
+    delta = time.time() - now
+    print(f'Report: [serial] {frames} frames in {delta} seconds.')
+
+    # results streamed back as completed
+    now = time.time()
+    for result in pcapkit.extract_many(FILES, workers=4, trace=True):
+        print(result.fin, result.frames, len(result.trace), result.error)
+    delta = time.time() - now
+    print(f'Report: [extract_many] {delta} seconds.')
+
+    # aggregated statistics
+    summary = pcapkit.extract_many(FILES, workers=4, reducer=summarise, trace=True)
+    assert summary.files == len(FILES) and summary.frames == frames
+    print(summary)
+
+    # summaries of a single file & no files
+    single = pcapkit.extract_many(FILES[:1], workers=1, reducer=summarise)
+    assert single.files == 1 and single.frames == frames // len(FILES)
+    empty = pcapkit.extract_many([], workers=1, reducer=summarise)
+    assert empty.files == 0 and empty.errors == () and empty.flows == 0
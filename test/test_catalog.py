@@ -0,0 +1,53 @@
+# -*- coding: utf-8 -*-
+
+import os
+import struct
+import time
+
+import pcapkit
+
+if os.path.isfile('../sample/test_catalog.db'):
+    os.remove('../sample/test_catalog.db')
+
+# ingestion
+now = time.time()
+catalog = pcapkit.catalog('../sample/test_catalog.db', '../sample/in.pcap')
+delta = time.time() - now
+print(f'Report: [ingest] {delta} seconds.')
+print(catalog.captures)
+
+# full extraction
+now = time.time()
+extraction = pcapkit.extract(fin='../sample/in.pcap', store=True, nofile=True)
+delta = time.time() - now
+print(f'Report: [extract] {delta} seconds.')
+
+# indexed lookup
+record = catalog.query(protocol='TCP', limit=1)[0]
+now = time.time()
+records = catalog.query(host=record.src, port=record.srcport)
+frames = catalog.read(records)
+delta = time.time() - now
+print(f'Report: [query] {len(records)} frames in {delta} seconds.')
+
+for frame in frames:
+    number = frame.info.number
+    assert str(frame.protochain) == str(extraction.frame[number-1].protochain)
+    print(number, frame.protochain)
+
+# protocol of IPv6 is next header after extension headers, i.e. UDP after Hop-by-Hop Options
+udp = struct.pack('>HHHH', 5353, 53, 12, 0) + b'pcap'
+hopopt = bytes([17, 0]) + b'\x01\x04\x00\x00\x00\x00'
+ipv6 = struct.pack('>IHBB16s16s', 6 << 28, len(hopopt) + len(udp), 0, 64,
+                   bytes(15) + b'\x01', bytes(15) + b'\x02') + hopopt + udp
+packet = b'\x00' * 12 + b'\x86\xdd' + ipv6
+with open('../sample/test_catalog.pcap', 'wb') as file:
+    file.write(struct.pack('<IHHiIII', 0xA1B2C3D4, 2, 4, 0, 0, 65535, 1))
+    file.write(struct.pack('<IIII', 1, 0, len(packet), len(packet)) + packet)
+catalog.ingest('../sample/test_catalog.pcap')
+record = catalog.query(protocol='HOPOPT')[0]
+assert record.ip_proto == 17 and record.dstport == 53, record
+
+catalog.close()
+os.remove('../sample/test_catalog.pcap')
+os.remove('../sample/test_catalog.db')
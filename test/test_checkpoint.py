@@ -0,0 +1,42 @@
+# -*- coding: utf-8 -*-
+
+import os
+import struct
+
+import pcapkit
+
+# UDP datagram fragmented in two IPv4 packets, each in a capture file
+datagram = struct.pack('>HHHH', 5353, 5353, 40, 0) + bytes(range(32))
+fragments = ((0, True, datagram[:16]), (2, False, datagram[16:]))
+files = ('../sample/test_checkpoint_0.pcap', '../sample/test_checkpoint_1.pcap')
+for (file, (offset, more, payload)) in zip(files, fragments):
+    ip = struct.pack('>BBHHHBBH4s4s', 0x45, 0, 20 + len(payload), 1, (more << 13) | offset,
+                     64, 17, 0, bytes([10, 0, 0, 1]), bytes([10, 0, 0, 2]))
+    packet = b'\x00' * 12 + b'\x08\x00' + ip + payload
+    with open(file, 'wb') as pcap:
+        pcap.write(struct.pack('<IHHiIII', 0xA1B2C3D4, 2, 4, 0, 0, 65535, 1))
+        pcap.write(struct.pack('<IIII', 1, len(files), len(packet), len(packet)) + packet)
+
+# capture ends mid-fragment, thus datagram kept pending in checkpoint
+first = pcapkit.extract(fin=files[0], nofile=True, ip=True, checkpoint='../sample/test_checkpoint.ckpt')
+print(f'Report: [pending] {first.reassembly.ipv4}')
+assert len(first.reassembly.ipv4) == 1 and first.reassembly.ipv4[0].NotImplemented
+
+# pending datagram reassembled with fragment of next capture
+second = pcapkit.extract(fin=files[1], nofile=True, ip=True, resume='../sample/test_checkpoint.ckpt')
+print(f'Report: [resumed] {second.reassembly.ipv4}')
+assert len(second.reassembly.ipv4) == 1
+assert second.reassembly.ipv4[0].packet[20:] == datagram
+assert second.reassembly.ipv4[0].index == (1, 2)
+
+# frame numbers of resumed flows count on from frames of previous file
+report = pcapkit.split('../sample/in.pcap', '../sample/test_checkpoint', by='count', limit=4)
+full = pcapkit.extract(fin='../sample/in.pcap', nofile=True, trace=True)
+pcapkit.extract(fin=report.files[0], nofile=True, trace=True, checkpoint='../sample/test_checkpoint.ckpt')
+second = pcapkit.extract(fin=report.files[1], nofile=True, trace=True, resume='../sample/test_checkpoint.ckpt')
+index = {flow.label: flow.index for flow in full.trace}
+print(f'Report: [resumed flows] {second.trace}')
+assert second.trace and all(flow.index == index[flow.label] for flow in second.trace)
+
+for file in files + report.files + ('../sample/test_checkpoint.ckpt',):
+    os.remove(file)
@@ -0,0 +1,64 @@
+# -*- coding: utf-8 -*-
+
+import os
+import struct
+import time
+
+import numpy
+
+import pcapkit
+
+# warm up, i.e. imports and caches
+pcapkit.columns(fin='../sample/in.pcap')
+
+# dissection only
+now = time.time()
+extraction = pcapkit.extract(fin='../sample/in.pcap', store=False, nofile=True, layer='Transport')
+dissect = time.time() - now
+print(f'Report: [dissection] {dissect / extraction.length} seconds per packet.')
+
+# columns built from `Frame.info` by hand
+now = time.time()
+extraction = pcapkit.extract(fin='../sample/in.pcap', store=True, nofile=True, layer='Transport')
+table = list()
+for frame in extraction.frame:
+    info = frame.info
+    table.append((info['number'], info['time_epoch'], info['frame_info']['incl_len'], info['frame_info']['orig_len']))
+delta = time.time() - now
+print(f'Report: [Frame.info] {(delta - dissect) / extraction.length} seconds per packet.')
+
+# columnar export
+now = time.time()
+columns = pcapkit.columns(fin='../sample/in.pcap')
+delta = time.time() - now
+print(f'Report: [columns] {(delta - dissect) / len(columns)} seconds per packet.')
+print(columns.array[:10])
+
+# columns match fields of dissected frames
+columns.save('../sample/test_columns.npz')
+with numpy.load('../sample/test_columns.npz') as saved:
+    assert len(saved['number']) == extraction.length
+    for (index, frame) in enumerate(extraction.frame):
+        version = 4 if 'IPv4' in frame else 6 if 'IPv6' in frame else 0
+        transport = frame['TCP'] if 'TCP' in frame else frame['UDP'] if 'UDP' in frame else None
+        assert saved['number'][index] == frame.info.number
+        assert saved['ip_version'][index] == version
+        if transport is not None:
+            assert saved['srcport'][index] == transport.info.srcport
+            assert saved['dstport'][index] == transport.info.dstport
+
+os.remove('../sample/test_columns.npz')
+
+# protocol of IPv6 is next header after extension headers, i.e. UDP after Hop-by-Hop Options
+udp = struct.pack('>HHHH', 5353, 53, 12, 0) + b'pcap'
+hopopt = bytes([17, 0]) + b'\x01\x04\x00\x00\x00\x00'
+ipv6 = struct.pack('>IHBB16s16s', 6 << 28, len(hopopt) + len(udp), 0, 64,
+                   bytes(15) + b'\x01', bytes(15) + b'\x02') + hopopt + udp
+packet = b'\x00' * 12 + b'\x86\xdd' + ipv6
+with open('../sample/test_columns.pcap', 'wb') as file:
+    file.write(struct.pack('<IHHiIII', 0xA1B2C3D4, 2, 4, 0, 0, 65535, 1))
+    file.write(struct.pack('<IIII', 1, 0, len(packet), len(packet)) + packet)
+row = pcapkit.columns(fin='../sample/test_columns.pcap').array[0]
+assert row['ip_version'] == 6 and row['ip_proto'] == 17 and row['dstport'] == 53, row
+
+os.remove('../sample/test_columns.pcap')
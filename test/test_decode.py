@@ -0,0 +1,37 @@
+# -*- coding: utf-8 -*-
+
+import io
+import timeit
+
+import chardet
+from pcapkit.protocols.application.httpv1 import HTTPv1
+from pcapkit.protocols.protocol import Protocol
+
+
+def legacy_decode(byte):
+    charset = chardet.detect(byte)['encoding']
+    try:
+        return byte.decode(charset or 'utf-8')
+    except UnicodeError:
+        return r''.join(chr(char) for char in byte)
+
+
+samples = dict(
+    ascii=b'Content-Type',
+    utf8='Grüße aus München'.encode('utf-8') * 100,
+    latin1='Grüße aus München'.encode('latin-1') * 100,
+    cp1251='Привет из Москвы'.encode('cp1251') * 1000,
+)
+
+for name, byte in samples.items():
+    assert Protocol.decode(byte) == legacy_decode(byte), name
+    legacy = timeit.timeit(lambda: legacy_decode(byte), number=10) / 10
+    tiered = timeit.timeit(lambda: Protocol.decode(byte), number=10) / 10
+    print(f'Report: [{name}] {legacy} -> {tiered} seconds per call.')
+
+# charset hint in Content-Type header
+body = 'Grüße aus München'.encode('latin-1')
+packet = b'HTTP/1.1 200 OK\r\nContent-Type: text/plain; charset=ISO-8859-1\r\n\r\n' + body
+http = HTTPv1(io.BytesIO(packet), len(packet))
+assert http.info.body == 'Grüße aus München', http.info.body
+print(f'Report: [HTTP/1.1] {timeit.timeit(lambda: HTTPv1(io.BytesIO(packet), len(packet)), number=1000) / 1000} seconds per packet.')
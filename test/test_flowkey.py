@@ -0,0 +1,79 @@
+# -*- coding: utf-8 -*-
+
+import ipaddress
+import time
+
+import pcapkit
+from pcapkit.corekit.flowkey import flow_key, stream_key, unpack_key
+
+FLOWS = 1_000_000
+
+# endpoints of flows, i.e. packets of both directions
+packets = list()
+for index in range(FLOWS):
+    src = ipaddress.ip_address(0x0A00_0000 + index)
+    dst = ipaddress.ip_address(0xC0A8_0000 + index % 256)
+    packets.append((src, 1024 + index % 60000, dst, 80))
+packets += [(dst, dstport, src, srcport) for (src, srcport, dst, dstport) in packets]
+
+
+def sorted_strings(src, srcport, dst, dstport):
+    return tuple(sorted([str(src), str(srcport), str(dst), str(dstport)]))
+
+
+def packed_bytes(src, srcport, dst, dstport):
+    return flow_key(src, srcport, dst, dstport)[0]
+
+
+def table(make_key):
+    flows = dict()
+    now = time.time()
+    for packet in packets:
+        key = make_key(*packet)
+        if key in flows:
+            flows[key] += 1
+        else:
+            flows[key] = 1
+    delta = time.time() - now
+    assert len(flows) == FLOWS
+    return delta
+
+
+# flow table of 1M flows, keyed on sorted strings & packed bytes
+for make_key in (sorted_strings, packed_bytes):
+    delta = table(make_key)
+    print(f'Report: [{make_key.__name__}] {len(packets) / delta:.0f} packets per second.')
+
+# flow tracing of 1M flows, with keys made whilst dissecting
+exported = 0
+
+
+def export(record):
+    global exported
+    exported += 1
+
+
+trace = pcapkit.trace(stats=True, export=export)
+records = list()
+for (index, (src, srcport, dst, dstport)) in enumerate(packets, start=1):
+    key, reverse = flow_key(src, srcport, dst, dstport)
+    records.append(dict(protocol=None, index=index, frame=None, syn=False, fin=False,
+                        src=src, srcport=srcport, dst=dst, dstport=dstport, timestamp=index / FLOWS,
+                        key=key, reverse=reverse))
+now = time.time()
+for record in records:
+    trace.trace(record, _check=False)
+delta = time.time() - now
+print(f'Report: [TraceFlow] {len(records) / delta:.0f} packets per second.')
+trace.expire()
+assert exported == FLOWS
+
+# keys of swapped ports collide when sorted as strings
+this = (ipaddress.ip_address('10.0.0.1'), 80, ipaddress.ip_address('10.0.0.2'), 443)
+that = (ipaddress.ip_address('10.0.0.1'), 443, ipaddress.ip_address('10.0.0.2'), 80)
+assert sorted_strings(*this) == sorted_strings(*that)
+assert packed_bytes(*this) != packed_bytes(*that)
+
+# stream keys unpack into endpoints of packet direction
+key, reverse = flow_key(*that)
+assert unpack_key(stream_key(key, reverse)) == that
@@ -0,0 +1,24 @@
+# -*- coding: utf-8 -*-
+
+import pprint
+import time
+
+import pcapkit
+
+now = time.time()
+extraction = pcapkit.extract(fin='../sample/in.pcap', store=False, nofile=True,
+                             trace=True, trace_stats=True)
+delta = time.time() - now
+print(f'Report: [flow statistics] {len(extraction.flows)} flows in {delta} seconds.')
+pprint.pprint(extraction.flows)
+
+packets = sum(flow.forward.packets + flow.backward.packets for flow in extraction.flows)
+frames = sum(len(flow.index) for flow in extraction.trace)
+assert packets == frames
+
+# flows exported as they expire
+expired = list()
+pcapkit.extract(fin='../sample/in.pcap', store=False, nofile=True,
+                trace=True, trace_stats=True, trace_idle_timeout=0.001, trace_export=expired.append)
+print(f'Report: [flow statistics] {len(expired)} flows expired on idle timeout.')
+assert sum(flow.fpkts + flow.bpkts for flow in expired) == packets
@@ -0,0 +1,41 @@
+# -*- coding: utf-8 -*-
+
+import subprocess
+import sys
+
+# cold import time budget (in seconds)
+BUDGET = 0.025
+
+# modules which shall not be loaded by `import pcapkit`
+HEAVY = ('chardet', 'aenum', 'dictdumper', 'pcapkit._common', 'pcapkit.protocols')
+
+
+def importtime(statement):
+    """Measure cumulative import time of pcapkit modules with `python -X importtime`."""
+    proc = subprocess.run([sys.executable, '-X', 'importtime', '-c', statement],
+                          stderr=subprocess.PIPE, check=True, universal_newlines=True)
+    total = 0
+    for line in proc.stderr.splitlines():
+        if not line.startswith('import time:'):
+            continue
+        _, cumulative, name = line[12:].split('|')
+        if name.startswith(' pcapkit'):     # top level imports only
+            total += int(cumulative)
+    return total / 1e6
+
+
+def loaded(statement):
+    """List heavy modules loaded after statement."""
+    proc = subprocess.run([sys.executable, '-c', f'{statement}; import sys; print(*sys.modules)'],
+                          stdout=subprocess.PIPE, check=True, universal_newlines=True)
+    return sorted(name for name in proc.stdout.split() if name.startswith(HEAVY))
+
+
+delta = min(importtime('import pcapkit') for _ in range(5))
+print(f'Report: [import pcapkit] {delta} seconds.')
+print(f'Report: [import pcapkit; pcapkit.extract] {importtime("import pcapkit; pcapkit.extract")} seconds.')
+print(f'Report: [import pcapkit; pcapkit.IPv4] {importtime("import pcapkit; pcapkit.IPv4")} seconds.')
+
+modules = loaded('import pcapkit')
+assert not modules, f'heavy modules loaded on import: {modules}'
+assert delta < BUDGET, f'cold import time {delta} seconds exceeds budget {BUDGET} seconds'
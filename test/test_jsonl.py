@@ -0,0 +1,21 @@
+# -*- coding: utf-8 -*-
+
+import json
+import os
+import time
+
+import pcapkit
+
+for fmt in ('json', 'jsonl'):
+    now = time.time()
+    extraction = pcapkit.extract(fin='../sample/in.pcap', fout=f'../sample/test_jsonl.{fmt}', store=False)
+    delta = time.time() - now
+    print(f'Report: [{fmt}] {delta / extraction.length} seconds per packet.')
+
+# one self-contained record per line, i.e. global header and frames
+with open('../sample/test_jsonl.jsonl') as file:
+    records = [json.loads(line) for line in file]
+assert len(records) == extraction.length + 1, f'{len(records)} records for {extraction.length} frames'
+
+for fmt in ('json', 'jsonl'):
+    os.remove(f'../sample/test_jsonl.{fmt}')
@@ -0,0 +1,64 @@
+# -*- coding: utf-8 -*-
+
+import os
+import struct
+import time
+import timeit
+import traceback
+import warnings
+
+import pcapkit
+from pcapkit.utilities.exceptions import ProtocolError, stacklevel
+from pcapkit.utilities.warnings import FormatWarning, warn
+
+
+def legacy_stacklevel():
+    pcapkit = f'{os.path.sep}pcapkit{os.path.sep}'
+    tb = traceback.extract_stack()
+    for index, tbitem in enumerate(tb):
+        if pcapkit in tbitem[0]:
+            break
+    else:
+        index = len(tb)
+    return (index-1)
+
+
+def raise_in_handler():
+    try:
+        raise ValueError
+    except ValueError:
+        try:
+            raise ProtocolError('malformed', quiet=True)
+        except ProtocolError:
+            pass
+
+
+# malformed capture: Ethernet frames with truncated IPv4/TCP headers
+with open('../sample/malformed.pcap', 'wb') as file:
+    file.write(struct.pack('<IHHiIII', 0xa1b2c3d4, 2, 4, 0, 0, 65535, 1))
+    for index in range(1000):
+        packet = b'\x00' * 12 + b'\x08\x00' + b'\x45\x00\x00\x28' + b'\x00' * 5 + b'\x06' + b'\x00' * (index % 10)
+        file.write(struct.pack('<IIII', index, 0, len(packet), len(packet)))
+        file.write(packet)
+
+now = time.time()
+extraction = pcapkit.extract(fin='../sample/malformed.pcap', store=False, nofile=True, tcp=True, trace=True)
+delta = time.time() - now
+print(f'Report: [malformed] {delta / extraction.length} seconds per packet.')
+
+os.remove('../sample/malformed.pcap')
+
+# stack level computation
+print(f'Report: [legacy stacklevel] {timeit.timeit(legacy_stacklevel, number=1000) / 1000} seconds per call.')
+print(f'Report: [stacklevel] {timeit.timeit(stacklevel, number=1000) / 1000} seconds per call.')
+
+# exception construction whilst handling another exception
+print(f'Report: [error] {timeit.timeit(raise_in_handler, number=1000) / 1000} seconds per call.')
+
+# filtered out warnings
+with warnings.catch_warnings():
+    warnings.simplefilter('ignore')
+    legacy = timeit.timeit(lambda: warnings.warn('malformed', FormatWarning, stacklevel=legacy_stacklevel()), number=1000)
+    lazy = timeit.timeit(lambda: warn('malformed', FormatWarning), number=1000)
+print(f'Report: [legacy ignored warning] {legacy / 1000} seconds per call.')
+print(f'Report: [ignored warning] {lazy / 1000} seconds per call.')
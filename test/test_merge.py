@@ -0,0 +1,38 @@
+# -*- coding: utf-8 -*-
+
+import os
+import time
+
+import pcapkit
+from pcapkit.foundation.records import RecordReader
+
+# merge a capture with itself
+now = time.time()
+report = pcapkit.merge(['../sample/in.pcap', '../sample/in.pcap'], '../sample/test_merge.pcap')
+delta = time.time() - now
+print(f'Report: [merge] {report.frames} frames in {delta} seconds.')
+
+extraction = pcapkit.extract(fin='../sample/test_merge.pcap', store=True, nofile=True)
+times = [frame.info.time_epoch for frame in extraction.frame]
+assert times == sorted(times) and extraction.length == report.frames
+
+# suppress exact duplicates
+report = pcapkit.merge(['../sample/in.pcap', '../sample/in.pcap'], '../sample/test_merge.pcap', dedup=1)
+print(f'Report: [dedup] {report.frames} frames, {report.duplicates} duplicates.')
+
+extraction = pcapkit.extract(fin='../sample/test_merge.pcap', store=True, nofile=True)
+origin = pcapkit.extract(fin='../sample/in.pcap', store=True, nofile=True)
+assert [frame.info.packet for frame in extraction.frame] == [frame.info.packet for frame in origin.frame]
+
+# keep largest snapshot length of inputs
+with open('../sample/in.pcap', 'rb') as file:
+    data = bytearray(file.read())
+data[16:20] = (524288).to_bytes(4, 'little')
+with open('../sample/test_snaplen.pcap', 'wb') as file:
+    file.write(data)
+pcapkit.merge(['../sample/in.pcap', '../sample/test_snaplen.pcap'], '../sample/test_merge.pcap')
+with RecordReader('../sample/test_merge.pcap') as reader:
+    assert reader.snaplen == 524288, reader.snaplen
+
+os.remove('../sample/test_snaplen.pcap')
+os.remove('../sample/test_merge.pcap')
@@ -0,0 +1,46 @@
+# -*- coding: utf-8 -*-
+
+import statistics
+import time
+
+import pcapkit
+from pcapkit.toolkit.default import (frame_records, ipv4_reassembly,
+                                     ipv6_reassembly, tcp_reassembly,
+                                     tcp_traceflow)
+
+
+def extract(**kwargs):
+    lid = list()
+    for _ in range(10):
+        now = time.time()
+        extraction = pcapkit.extract(fin='../sample/test.pcap', store=False, nofile=True, **kwargs)
+        lid.append(time.time() - now)
+    return statistics.mean(lid) / extraction.length
+
+
+# overhead of enabling IP & TCP reassembly and flow tracing
+plain = extract()
+full = extract(ip=True, tcp=True, trace=True)
+print(f'Report: [plain] {plain} seconds per packet.')
+print(f'Report: [ip+tcp+trace] {full} seconds per packet.')
+print(f'Report: [overhead] {full - plain} seconds per packet.')
+
+# record extraction from dissected frames
+extraction = pcapkit.extract(fin='../sample/test.pcap', nofile=True)
+data_link = extraction.header.protocol
+
+now = time.time()
+for frame in extraction.frame:
+    ipv4_reassembly(frame, record=True)
+    ipv6_reassembly(frame, record=True)
+    tcp_reassembly(frame, record=True)
+    tcp_traceflow(frame, data_link=data_link)
+lookup = (time.time() - now) / extraction.length
+
+now = time.time()
+for frame in extraction.frame:
+    frame_records(frame, ipv4=True, ipv6=True, tcp=True, trace=True, data_link=data_link)
+single = (time.time() - now) / extraction.length
+
+print(f'Report: [layer lookups] {lookup} seconds per packet.')
+print(f'Report: [single pass] {single} seconds per packet.')
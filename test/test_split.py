@@ -0,0 +1,21 @@
+# -*- coding: utf-8 -*-
+
+import os
+import time
+
+import pcapkit
+
+origin = pcapkit.extract(fin='../sample/in.pcap', store=True, nofile=True)
+
+for (by, limit) in (('count', 4), ('size', 256), ('time', 1)):
+    now = time.time()
+    report = pcapkit.split('../sample/in.pcap', '../sample/test_split', by=by, limit=limit)
+    delta = time.time() - now
+    print(f'Report: [split by {by}] {report.frames} frames into {len(report.files)} files in {delta} seconds.')
+
+    packets = list()
+    for file in report.files:
+        extraction = pcapkit.extract(fin=file, store=True, nofile=True)
+        packets.extend(frame.info.packet for frame in extraction.frame)
+        os.remove(file)
+    assert packets == [frame.info.packet for frame in origin.frame]
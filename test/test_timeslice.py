@@ -0,0 +1,26 @@
+# -*- coding: utf-8 -*-
+
+import time
+
+import pcapkit
+
+# full extraction
+now = time.time()
+extraction = pcapkit.extract(fin='../sample/in.pcap', store=True, nofile=True)
+delta = time.time() - now
+print(f'Report: [extract] {delta} seconds.')
+
+# time range of middle frames
+start = extraction.frame[1].info.time_epoch
+end = extraction.frame[-1].info.time_epoch
+
+# time range slicing
+now = time.time()
+sliced = pcapkit.extract(fin='../sample/in.pcap', store=True, nofile=True, start_time=start, end_time=end)
+delta = time.time() - now
+print(f'Report: [slice] {delta} seconds.')
+
+expected = [frame.info.packet for frame in extraction.frame if start <= frame.info.time_epoch < end]
+assert [frame.info.packet for frame in sliced.frame] == expected
+for frame in sliced.frame:
+    print(frame.info.number, frame.info.time, frame.protochain)